@@ -12,6 +12,9 @@ from agents.logic_agent import LogicAgent
 from agents.probabilistic_agent import ProbabilisticAgent
 from ai_core.knowledge_base import KnowledgeBase
 from ai_core.bayes_reasoning import bayes_update, update_belief_map
+from ai_core.distance_field import DistanceField
+from ai_core.search_algorithms import DStarLite
+from ai_core.flow_field import FlowField
 from typing import Tuple, Optional, List
 
 
@@ -20,21 +23,38 @@ class HybridAgent:
     A rational agent that integrates search, logic, and probabilistic reasoning.
     """
     
-    def __init__(self, environment: GridWorld):
+    def __init__(self, environment: GridWorld, planner: str = 'field'):
         """
         Initialize the hybrid agent.
         
         Args:
             environment: The GridWorld environment
+            planner: 'field' (cached distance field), 'dstar' (D* Lite,
+                     repaired incrementally from the current position) or
+                     'flow' (flow field, updated incrementally - can be
+                     shared with other agents heading to the same goal)
         """
+        if planner not in ('field', 'dstar', 'flow'):
+            raise ValueError(f"Unknown planner: {planner}")
         self.env = environment
+        self.planner = planner
         
         # Search component
         self.search_agent = SearchAgent(environment)
+        # Cost-to-goal for every cell, reused across ticks; cells we believe
+        # are obstacles are blocked in it as the beliefs change
+        self.distance_field = DistanceField(environment)
+        # D* Lite planner (planner='dstar'), created on first plan(), and
+        # the cells whose blocked state flipped since it last replanned
+        self.dstar = None
+        self._changed_cells = set()
+        # Flow field towards env.goal (planner='flow'); beliefs block cells in it
+        self.flow_field = FlowField(environment) if planner == 'flow' else None
         
         # Logic component
         self.logic_agent = LogicAgent(environment)
-        self.kb = KnowledgeBase()
+        # Cell facts are interned per predicate as bool grids
+        self.kb = KnowledgeBase(shape=(environment.height, environment.width), verbose=False)
         
         # Probabilistic component
         self.probabilistic_agent = ProbabilisticAgent(environment)
@@ -65,44 +85,57 @@ class HybridAgent:
         # 2. Update knowledge base with certain facts
         self.probabilistic_agent.update_beliefs(current_reading,self.env.agent_pos)
         self.beliefs = self.probabilistic_agent.beliefs
+        self._sync_blocked(self.env.agent_pos)
         # 3. Update belief map with probabilistic information
         obstacle_prob = self.beliefs.get(self.env.agent_pos,0.5)
         if obstacle_prob > 0.9:
-            self.kb.tell(f"obstacle_{self.env.agent_pos[0]}_{self.env.agent_pos[1]}")
+            self.kb.tell('obstacle', *self.env.agent_pos)
         elif obstacle_prob < 0.1:
-            self.kb.tell(f"free_{self.env.agent_pos[0]}_{self.env.agent_pos[1]}")
+            self.kb.tell('free', *self.env.agent_pos)
 
         neighbors = self.env.get_neighbors(self.env.agent_pos)
         for neighbor in neighbors:
             nbr_reading = self.probabilistic_agent.get_sensor_reading(neighbor)
             self.probabilistic_agent.update_beliefs(nbr_reading,neighbor)
+            self._sync_blocked(neighbor)
+    
+    def _sync_blocked(self, pos: Tuple[int, int]):
+        """Block/unblock pos in the planners' fields from its current belief."""
+        blocked = self.beliefs.get(pos, 0.5) >= 0.7
+        if self.distance_field.set_blocked(pos, blocked):
+            self._changed_cells.add(pos)
+        if self.flow_field is not None:
+            self.flow_field.set_blocked(pos, blocked)
     
     def plan(self) -> Optional[List[Tuple[int, int]]]:
         """
         Use search algorithms to plan path to goal.
         
+        With planner='field' the path is read from the cached distance
+        field, which already avoids high-probability obstacles and is only
+        recomputed when the grid or those beliefs change - no search runs
+        on a normal tick.
+        
+        With planner='dstar' the D* Lite planner is handed only the cells
+        whose blocked state changed since the last call and repairs its
+        path from the current position.
+        
         Returns:
             Path from current position to goal, or None if no path
         """
-        # TODO: Implement planning
-        # Steps:
-        # 1. Use SearchAgent to find path
-        try:
-            path, cost, expanded = self.search_agent.search('astar')
-
-            # 2. Consider beliefs when planning (avoid high-probability obstacles)
-            safe_path = []
-            for pos in path:
-                obstacle_prob = self.beliefs.get(pos, 0.5)
-                if obstacle_prob < 0.7:
-                    safe_path.append(pos)
-                else:
-                    return None
-            return safe_path if safe_path else None
-        except Exception:
-            return None
-        # 3. Update path if needed based on new information
-       
+        if self.planner == 'field':
+            return self.distance_field.path_from(self.env.agent_pos)
+        if self.planner == 'flow':
+            return self.flow_field.path_from(self.env.agent_pos)
+        
+        if self.dstar is None or self.dstar.goal != self.env.goal:
+            self.dstar = DStarLite(self.env, self.env.goal,
+                                   is_blocked=self.distance_field.blocked.__contains__)
+            self._changed_cells.clear()
+        path, _, _ = self.dstar.plan(self.env.agent_pos, self._changed_cells)
+        self._changed_cells.clear()
+        return path
+    
     
     def reason(self):
         """
@@ -110,14 +143,12 @@ class HybridAgent:
         """
         # TODO: Implement reasoning
         # Steps:
-        # 1. Call self.kb.infer() to derive new facts
-        self.kb.infer()
-        # 2. Query KB for safe moves
+        # 1-2. Query KB for safe moves; backward chaining only proves the
+        #      neighbor facts, no full infer() pass per tick
         neighbors = self.env.get_neighbors(self.env.agent_pos)
         safe_moves = []
         for neighbor in neighbors:
-            free_fact = f"free_{neighbor[0]}_{neighbor[1]}"
-            if self.kb.ask(free_fact):
+            if self.kb.ask('free', *neighbor, backward=True):
                 safe_moves.append(neighbor)
         return safe_moves
         # 3. Use logic to validate probabilistic decisions
@@ -132,10 +163,12 @@ class HybridAgent:
         sensor_reading = self.probabilistic_agent.get_sensor_reading(self.env.agent_pos)
         self.probabilistic_agent.update_beliefs(sensor_reading,self.env.agent_pos)
         self.beliefs = self.probabilistic_agent.beliefs
+        self._sync_blocked(self.env.agent_pos)
         neighbors = self.env.get_neighbors(self.env.agent_pos)
         for neighbor in neighbors:
             nbr_reading = self.probabilistic_agent.get_sensor_reading(neighbor)
             self.probabilistic_agent.update_beliefs(nbr_reading,neighbor)
+            self._sync_blocked(neighbor)
             
         # 2. Update belief map using update_belief_map()
         # 3. Use beliefs to inform decision-making
@@ -164,7 +197,7 @@ class HybridAgent:
         confidence_ratio = confident_cells / total_cells if total_cells > 0  else 0 
         if confidence_ratio > 0.7:
             return 'search'
-        if len(self.kb.facts) > 5:
+        if len(self.kb) > 5:
             return 'logic'
         # - If sensor readings are uncertain → probability
         # - If we need to infer relationships → logic
@@ -193,9 +226,16 @@ class HybridAgent:
         neighbors = self.env.get_neighbors(self.env.agent_pos)
         candidate_moves = []
         if strategy == 'search':
-            path = self.plan()
-            if path and len(path) > 1:
-                candidate_moves.append(path[1])
+            if self.planner == 'field':
+                # O(1) lookup - same move as plan()[1] without building the path
+                next_step = self.distance_field.next_step(self.env.agent_pos)
+            elif self.planner == 'flow':
+                next_step = self.flow_field.next_step(self.env.agent_pos)
+            else:
+                path = self.plan()
+                next_step = path[1] if path and len(path) > 1 else None
+            if next_step is not None:
+                candidate_moves.append(next_step)
         elif strategy == 'logic':
             safe_moves = self.reason()
             candidate_moves.extend(safe_moves)
@@ -12,7 +12,15 @@ Phase 1 of the project (Week 1-2)
 
 from environment import GridWorld
 from typing import Tuple, List, Optional
-from ai_core.search_algorithms import bfs, ucs, astar
+from ai_core.search_algorithms import (bfs, ucs, astar, astar_array, jps,
+                                      bidirectional_bfs, bidirectional_astar,
+                                      wavefront_bfs, arastar, idastar)
+from ai_core.path_cache import PathCache
+from ai_core.hpa import HPAStar
+from ai_core.landmarks import LandmarkHeuristic
+from ai_core.batch import batch_search
+from ai_core.flow_field import FlowField
+from ai_core.stepwise_search import bfs_steps, ucs_steps, astar_steps
 
 
 class SearchAgent:
@@ -30,38 +38,222 @@ class SearchAgent:
         self.env = environment
         self.path = []
         self.current_pos = environment.start
+        self.path_cache = PathCache(environment)
+        self.hpa = None  # HPA* abstract graph, built on first 'hpa' search
+        self.landmarks = None  # ALT tables, built on first heuristic='alt' search
+        self.flow_field = None  # Flow field towards env.goal, built on first 'flow' search
+        self.last_stats = {}  # Extra statistics of the last search run (e.g. ARA*'s epsilon)
     
-    def search(self, algorithm='bfs', heuristic='manhattan') -> Tuple[Optional[List], float, int]:
+    def search(self, algorithm='bfs', heuristic='manhattan',
+               use_cache=True, deadline=None, open_list='heap',
+               instrument=None) -> Tuple[Optional[List], float, int]:
         """
         Find a path from start to goal using the specified algorithm.
         
         Args:
-            algorithm: 'bfs', 'ucs', or 'astar'
-            heuristic: 'manhattan' or 'euclidean' (for A* only)
+            algorithm: 'bfs', 'ucs', 'astar', 'jps' (Jump Point Search, maps
+                       without terrain costs only),
+                       'jps8' (Jump Point Search with diagonal moves),
+                       'bidirectional_bfs', 'bidirectional_astar' or
+                       'wavefront' (vectorized BFS), 'hpa' (hierarchical,
+                       near-optimal, for very large maps), 'arastar'
+                       (anytime, improves its path until the deadline) or
+                       'idastar' (memory-bounded; peak memory is left in
+                       self.last_stats) or 'flow' (follow the shared flow
+                       field towards env.goal)
+            heuristic: 'manhattan' or 'euclidean' (for the A* variants only),
+                       or 'alt' (landmark bounds, for 'astar' only)
+            use_cache: Reuse the result of an identical earlier search if the
+                       grid has not changed since (see self.path_cache)
+            deadline: Time budget in seconds for 'arastar'; its suboptimality
+                      bound is left in self.last_stats['epsilon']
+            open_list: Open list for 'ucs' and 'astar' (see
+                       ai_core.priority_queues)
+            instrument: Optional SearchInstrument for 'bfs', 'ucs' and 'astar'
+                        (see ai_core.instrumentation); an instrumented
+                        search always runs, it is never served from the cache
         
         Returns:
             path: List of (row, col) tuples forming the path
             cost: Total path cost
-            expanded: Number of nodes expanded during search
+            expanded: Number of nodes expanded during search (for a cached
+                      result, the count of the search that produced it)
         """
         print(f"\n🔍 Running {algorithm.upper()} search...")
         print(f"   Start: {self.env.start}")
         print(f"   Goal: {self.env.goal}")
         
-        # Call the appropriate search algorithm
+        start, goal = self.env.start, self.env.goal
+        # The heuristic only changes the result of the A* variants
+        cache_heuristic = heuristic if 'astar' in algorithm else None
+        # A time-bounded result depends on the machine's speed, not just the grid
+        if algorithm == 'arastar' and deadline is not None:
+            use_cache = False
+        # The instrument has to watch a real run
+        if instrument is not None:
+            use_cache = False
+        # Other open lists may break ties differently
+        cache_algorithm = algorithm if open_list == 'heap' else f"{algorithm}/{open_list}"
+        
+        # A cached result brings back the statistics of the search behind it
+        self.last_stats = {}
+        result = None
+        if use_cache:
+            result = self.path_cache.get(start, goal, cache_algorithm, cache_heuristic,
+                                         stats=self.last_stats)
+        if result is None:
+            result = self._run_search(algorithm, heuristic, deadline, open_list, instrument)
+            if use_cache:
+                self.path_cache.put(start, goal, cache_algorithm, cache_heuristic, result,
+                                    stats=self.last_stats)
+        
+        path, cost, expanded = result
+        self.path = path
+        
+        return path, cost, expanded
+    
+    def _run_search(self, algorithm: str, heuristic: str, deadline: Optional[float] = None,
+                    open_list='heap', instrument=None) -> Tuple[Optional[List], float, int]:
+        """Call the search algorithm named by `algorithm` on start -> goal."""
+        if instrument is not None and algorithm not in ('bfs', 'ucs', 'astar'):
+            raise ValueError(f"Instrumentation not available for: {algorithm}")
         if algorithm == 'bfs':
-            path, cost, expanded = bfs(self.env, self.env.start, self.env.goal)
+            path, cost, expanded = bfs(self.env, self.env.start, self.env.goal, instrument=instrument)
         elif algorithm == 'ucs':
-            path, cost, expanded = ucs(self.env, self.env.start, self.env.goal)
+            path, cost, expanded = ucs(self.env, self.env.start, self.env.goal, open_list,
+                                       instrument=instrument)
         elif algorithm == 'astar':
-            path, cost, expanded = astar(self.env, self.env.start, self.env.goal, heuristic)
+            landmarks = self._landmarks() if heuristic == 'alt' else None
+            if instrument is not None:
+                # Only astar() carries the instrumentation hooks
+                path, cost, expanded = astar(self.env, self.env.start, self.env.goal, heuristic,
+                                             open_list, landmarks=landmarks, instrument=instrument)
+            else:
+                # Array-backed engine: same results as astar(), far less overhead
+                path, cost, expanded = astar_array(self.env, self.env.start, self.env.goal, heuristic,
+                                                   open_list, landmarks=landmarks)
+        elif algorithm == 'jps':
+            path, cost, expanded = jps(self.env, self.env.start, self.env.goal)
+        elif algorithm == 'jps8':
+            path, cost, expanded = jps(self.env, self.env.start, self.env.goal, diagonal=True)
+        elif algorithm == 'bidirectional_bfs':
+            path, cost, expanded = bidirectional_bfs(self.env, self.env.start, self.env.goal)
+        elif algorithm == 'bidirectional_astar':
+            path, cost, expanded = bidirectional_astar(self.env, self.env.start, self.env.goal, heuristic)
+        elif algorithm == 'wavefront':
+            path, cost, expanded = wavefront_bfs(self.env, self.env.start, self.env.goal)
+        elif algorithm == 'hpa':
+            if self.hpa is None:
+                self.hpa = HPAStar(self.env)
+            path, cost, expanded = self.hpa.search(self.env.start, self.env.goal)
+        elif algorithm == 'arastar':
+            path, cost, expanded = arastar(self.env, self.env.start, self.env.goal, heuristic,
+                                           deadline=deadline, stats=self.last_stats)
+        elif algorithm == 'flow':
+            # The field is shared by every start; 'expanded' counts the cells
+            # (re)computed to bring it up to date for this query
+            if self.flow_field is None:
+                self.flow_field = FlowField(self.env)
+            settled = self.flow_field.settled
+            path = self.flow_field.path_from(self.env.start)
+            expanded = self.flow_field.settled - settled
+            cost = self.flow_field.cost(self.env.start)
+        elif algorithm == 'idastar':
+            path, cost, expanded = idastar(self.env, self.env.start, self.env.goal, heuristic,
+                                           stats=self.last_stats)
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
         
-        self.path = path
-        
         return path, cost, expanded
     
+    def search_many(self, pairs, algorithm='astar', heuristic='manhattan', workers=None):
+        """
+        Answer many start/goal queries at once, on a process pool.
+        
+        env.start and env.goal are left untouched; see ai_core.batch.batch_search().
+        
+        Args:
+            pairs: Sequence of (start, goal) pairs
+            algorithm: Name as for search() (not 'hpa', 'jps8', 'arastar', 'idastar')
+            heuristic: 'manhattan', 'euclidean' or 'alt'
+            workers: Number of worker processes (None = one per CPU)
+        
+        Returns:
+            paths: List of paths (None where no path exists)
+            costs: Array of path costs (inf where no path exists)
+            expanded: Array of nodes expanded per query
+        """
+        return batch_search(self.env, pairs, algorithm, heuristic, workers=workers)
+    
+    def _landmarks(self) -> LandmarkHeuristic:
+        """ALT landmark tables for the current grid, (re)built when it changed."""
+        if self.landmarks is None or self.landmarks.version != self.env.version:
+            self.landmarks = LandmarkHeuristic(self.env)
+        return self.landmarks
+    
+    def search_steps(self, algorithm='astar', heuristic='manhattan', k=1):
+        """
+        Start a step-wise search from start to goal (see ai_core.stepwise_search).
+        
+        Args:
+            algorithm: 'bfs', 'ucs' or 'astar'
+            heuristic: 'manhattan', 'euclidean' or 'alt' (for 'astar' only)
+            k: Expansions between two yielded steps
+        
+        Returns:
+            Generator of SearchStep; close() it to cancel the search
+        """
+        start, goal = self.env.start, self.env.goal
+        if algorithm == 'bfs':
+            return bfs_steps(self.env, start, goal, k)
+        elif algorithm == 'ucs':
+            return ucs_steps(self.env, start, goal, k)
+        elif algorithm == 'astar':
+            landmarks = self._landmarks() if heuristic == 'alt' else None
+            return astar_steps(self.env, start, goal, heuristic, k, landmarks=landmarks)
+        raise ValueError(f"Step-wise search not available for: {algorithm}")
+    
+    def search_interactive(self, algorithm='astar', heuristic='manhattan',
+                           steps_per_frame=20) -> Tuple[Optional[List], float, int]:
+        """
+        Run a search while rendering its progress, one frame per step.
+        
+        The window stays responsive during the search; closing it cancels
+        the search.
+        
+        Args:
+            algorithm: 'bfs', 'ucs' or 'astar'
+            heuristic: 'manhattan', 'euclidean' or 'alt' (for 'astar' only)
+            steps_per_frame: Expansions between two rendered frames
+        
+        Returns:
+            path, cost, expanded as search(); (None, inf, expanded so far)
+            if the window was closed
+        """
+        if not self.env.running:
+            self.env.init_display()
+        self.env.reset()
+        
+        steps = self.search_steps(algorithm, heuristic, steps_per_frame)
+        step = None
+        for step in steps:
+            self.env.visited.update(step.visited_delta)
+            self.env.frontier.update(step.frontier_delta)
+            self.env.frontier.difference_update(step.visited_delta)
+            self.env.expanded = step.expanded
+            if step.done:
+                break
+            if not self.env.handle_events():
+                steps.close()
+                return None, float('inf'), step.expanded
+            self.env.render()
+        
+        self.env.frontier = set()
+        self.path = step.path or []
+        self.env.path = self.path
+        self.env.render()
+        return step.path, step.cost, step.expanded
+    
     def move_along_path(self):
         """
         Move the agent along the computed path (for visualization).
@@ -0,0 +1,155 @@
+"""
+Batch Path Queries - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Answers many (start, goal) queries on one map in parallel. The terrain
+costs, the grid and (for ALT) the landmark distance tables are copied
+once into a shared-memory block; every worker process attaches to it and
+rebuilds its own GridWorld (and neighbor caches) around that block once,
+so tasks only carry the query pairs and the results.
+"""
+
+from typing import Tuple, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+from environment import GridWorld
+from ai_core.search_algorithms import (bfs, ucs, astar_array, jps, bidirectional_bfs,
+                                      bidirectional_astar, wavefront_bfs)
+from ai_core.landmarks import LandmarkHeuristic
+
+
+# Algorithms available to batch_search(); the second entry says whether
+# the function takes a heuristic argument
+BATCH_ALGORITHMS = {
+    'bfs': (bfs, False),
+    'ucs': (ucs, False),
+    'astar': (astar_array, True),
+    'jps': (jps, False),
+    'bidirectional_bfs': (bidirectional_bfs, False),
+    'bidirectional_astar': (bidirectional_astar, True),
+    'wavefront': (wavefront_bfs, False),
+}
+
+# Per-process state set up by _init_worker()
+_worker_env = None
+_worker_shm = None
+_worker_landmarks = None
+
+
+def batch_search(env, pairs: Sequence, algorithm: str = 'astar', heuristic: str = 'manhattan',
+                 workers: Optional[int] = None,
+                 chunksize: int = 64) -> Tuple[List[Optional[List]], np.ndarray, np.ndarray]:
+    """
+    Solve many start/goal queries on the same grid.
+
+    Args:
+        env: GridWorld environment (only its grid is used; start/goal are untouched)
+        pairs: Sequence of (start, goal) pairs, or an (N, 2, 2) integer array
+        algorithm: Any key of BATCH_ALGORITHMS
+        heuristic: 'manhattan' or 'euclidean' (A* variants only), or
+                   'alt' for 'astar' (landmark tables built once per worker)
+        workers: Number of worker processes (None = one per CPU); 1 solves
+                 everything in this process without a pool
+        chunksize: Queries sent to a worker per task
+
+    Returns:
+        paths: List of paths (None where no path exists), in input order
+        costs: (N,) float64 array of path costs (inf where no path exists)
+        expanded: (N,) int64 array of nodes expanded per query
+    """
+    if algorithm not in BATCH_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    queries = [(tuple(int(v) for v in start), tuple(int(v) for v in goal))
+               for start, goal in np.asarray(pairs, dtype=np.int64).reshape(-1, 2, 2)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Landmark tables are built once, here, and shared with the workers
+    landmarks = LandmarkHeuristic(env) if _uses_landmarks(algorithm, heuristic) else None
+
+    if workers <= 1 or len(queries) <= chunksize:
+        results = [_solve(env, start, goal, algorithm, heuristic, landmarks)
+                   for start, goal in queries]
+    else:
+        grid = np.ascontiguousarray(env.grid, dtype=np.int8)
+        terrain = np.ascontiguousarray(env.terrain, dtype=np.float32)
+        # Layout: float32 terrain first (keeps it aligned), then the int8
+        # grid, then the landmark tables from the next 8-byte boundary
+        tables_offset = -(-(terrain.nbytes + grid.nbytes) // 8) * 8
+        tables = landmarks.distances if landmarks is not None else None
+        size = tables_offset + (tables.nbytes if tables is not None else 0)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            np.ndarray(terrain.shape, dtype=np.float32, buffer=shm.buf)[:] = terrain
+            np.ndarray(grid.shape, dtype=np.int8, buffer=shm.buf, offset=terrain.nbytes)[:] = grid
+            tables_spec = None
+            if tables is not None:
+                np.ndarray(tables.shape, dtype=tables.dtype, buffer=shm.buf, offset=tables_offset)[:] = tables
+                tables_spec = (landmarks.landmarks, tables.dtype.str, tables.shape, tables_offset)
+            chunks = [queries[i:i + chunksize] for i in range(0, len(queries), chunksize)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shm.name, grid.shape, tables_spec)) as pool:
+                results = []
+                for chunk_results in pool.map(_solve_chunk, chunks,
+                                              [algorithm] * len(chunks), [heuristic] * len(chunks)):
+                    results.extend(chunk_results)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    paths = [path for path, _, _ in results]
+    costs = np.array([cost for _, cost, _ in results], dtype=np.float64)
+    expanded = np.array([count for _, _, count in results], dtype=np.int64)
+    return paths, costs, expanded
+
+
+def _uses_landmarks(algorithm: str, heuristic: str) -> bool:
+    return algorithm == 'astar' and heuristic == 'alt'
+
+
+def _solve(env, start, goal, algorithm, heuristic, landmarks):
+    """Run one query with the engine named by algorithm."""
+    search, takes_heuristic = BATCH_ALGORITHMS[algorithm]
+    if not takes_heuristic:
+        return search(env, start, goal)
+    if landmarks is not None:
+        return search(env, start, goal, heuristic, landmarks=landmarks)
+    return search(env, start, goal, heuristic)
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, int], tables_spec: Optional[tuple]):
+    """
+    Attach to the shared block and build this process's GridWorld around it.
+
+    Args:
+        shm_name: Name of the shared-memory block
+        shape: (height, width) of the grid
+        tables_spec: (landmarks, dtype, shape, offset) of the shared landmark
+                     tables, or None when the queries do not use ALT
+    """
+    global _worker_env, _worker_shm, _worker_landmarks
+    # Attaching registers the block with the resource tracker, which the
+    # workers inherit from the parent; it keeps one entry per name, so the
+    # parent's unlink() in batch_search() also clears the workers' entries
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+
+    height, width = shape
+    _worker_env = GridWorld(width=width, height=height)
+    _worker_env.terrain = np.ndarray(shape, dtype=np.float32, buffer=_worker_shm.buf)
+    _worker_env.grid = np.ndarray(shape, dtype=np.int8, buffer=_worker_shm.buf,
+                                  offset=height * width * 4)
+    _worker_landmarks = None
+    if tables_spec is not None:
+        landmarks, dtype, tables_shape, offset = tables_spec
+        distances = np.ndarray(tables_shape, dtype=dtype, buffer=_worker_shm.buf, offset=offset)
+        _worker_landmarks = LandmarkHeuristic.from_tables(_worker_env, landmarks, distances)
+
+
+def _solve_chunk(chunk, algorithm: str, heuristic: str):
+    """Solve a list of (start, goal) queries in a worker process."""
+    return [_solve(_worker_env, start, goal, algorithm, heuristic, _worker_landmarks)
+            for start, goal in chunk]
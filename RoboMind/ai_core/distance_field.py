@@ -0,0 +1,154 @@
+"""
+Goal Distance Field - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+A cached map of "cost to the goal" for every cell, computed once with a
+reverse search from the goal: a vectorized BFS on maps without terrain,
+Dijkstra over the terrain costs otherwise. Any agent can then read its
+next move in O(1) instead of running a fresh search on every tick.
+"""
+
+from typing import Tuple, List, Optional
+from array import array
+import heapq
+
+import numpy as np
+
+from ai_core.search_algorithms import wavefront
+
+
+UNREACHABLE = -1
+
+
+class DistanceField:
+    """
+    Distance-to-goal for every cell of a GridWorld, recomputed only when needed.
+
+    The field is rebuilt lazily when the grid changes (GridWorld.version),
+    when the goal moves, or when a cell is blocked/unblocked with
+    set_blocked() - e.g. because the agent now believes it is an obstacle.
+    """
+
+    def __init__(self, env, goal: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the distance field.
+
+        Args:
+            env: GridWorld environment
+            goal: Target cell; None follows env.goal
+        """
+        self.env = env
+        self.goal = goal
+        self.blocked = set()     # Extra cells treated as obstacles
+        self.recomputes = 0      # Number of full recomputations so far
+
+        self._dist = None        # Flat array('d'), UNREACHABLE if no path
+        self._version = None
+        self._field_goal = None
+        self._dirty = True
+
+    @property
+    def distances(self) -> np.ndarray:
+        """(height, width) float64 array of costs to the goal (UNREACHABLE = -1)."""
+        self._ensure()
+        return np.frombuffer(self._dist, dtype=np.float64).reshape(self.env.height, self.env.width)
+
+    def set_blocked(self, pos: Tuple[int, int], blocked: bool) -> bool:
+        """
+        Mark a cell as blocked (or free again) on top of the grid obstacles.
+
+        Only an actual change of state invalidates the field.
+
+        Returns:
+            True if the cell's blocked state changed
+        """
+        if blocked and pos not in self.blocked:
+            self.blocked.add(pos)
+        elif not blocked and pos in self.blocked:
+            self.blocked.discard(pos)
+        else:
+            return False
+        self._dirty = True
+        return True
+
+    def distance(self, pos: Tuple[int, int]) -> float:
+        """Cost from pos to the goal (inf if the goal cannot be reached)."""
+        self._ensure()
+        d = self._dist[pos[0] * self.env.width + pos[1]]
+        return float('inf') if d == UNREACHABLE else d
+
+    def next_step(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Get the neighbor of pos on a cheapest path to the goal.
+
+        Returns:
+            Next position, or None if pos is the goal or no path exists
+        """
+        self._ensure()
+        if pos == self._field_goal:
+            return None
+        # Cost through a neighbor: entering it, then its distance
+        costs, width = self.env.cost_table(), self.env.width
+        best, best_dist = None, None
+        for neighbor in self.env.get_neighbors(pos):
+            index = neighbor[0] * width + neighbor[1]
+            d = self._dist[index]
+            if d != UNREACHABLE and (best_dist is None or d + costs[index] < best_dist):
+                best, best_dist = neighbor, d + costs[index]
+        return best
+
+    def path_from(self, pos: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Follow next_step() from pos to the goal.
+
+        Returns:
+            Path from pos to goal (inclusive), or None if no path exists
+        """
+        path = [pos]
+        while path[-1] != self._field_goal:
+            step = self.next_step(path[-1])
+            if step is None:
+                return None
+            path.append(step)
+        return path
+
+    def _ensure(self):
+        """Recompute the field if the grid, goal or blocked cells changed."""
+        goal = self.goal if self.goal is not None else self.env.goal
+        if not self._dirty and self._version == self.env.version and self._field_goal == goal:
+            return
+        self._compute(goal)
+
+    def _compute(self, goal: Tuple[int, int]):
+        """Reverse search from the goal over passable, non-blocked cells."""
+        if self.env.has_uniform_cost():
+            dist, _ = wavefront(self.env, goal, blocked=self.blocked)
+            self._dist = array('d', dist.astype(np.float64).tobytes())
+        else:
+            self._dist = self._dijkstra(goal)
+        self._version = self.env.version
+        self._field_goal = goal
+        self._dirty = False
+        self.recomputes += 1
+
+    def _dijkstra(self, goal: Tuple[int, int]) -> array:
+        """Cost to the goal with terrain: moving into a cell costs its terrain cost."""
+        env = self.env
+        width = env.width
+        costs = env.cost_table()
+        best = [float('inf')] * (env.height * width)
+        best[goal[0] * width + goal[1]] = 0.0
+        frontier = [(0.0, goal)]
+        while frontier:
+            d, cell = heapq.heappop(frontier)
+            index = cell[0] * width + cell[1]
+            if d > best[index]:
+                continue
+            # Neighbors reach the goal through cell by moving into it
+            through = d + costs[index]
+            for neighbor in env.get_neighbors(cell):
+                n = neighbor[0] * width + neighbor[1]
+                if through < best[n] and neighbor not in self.blocked:
+                    best[n] = through
+                    heapq.heappush(frontier, (through, neighbor))
+        return array('d', (UNREACHABLE if d == float('inf') else d for d in best))
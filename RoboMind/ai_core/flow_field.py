@@ -0,0 +1,324 @@
+"""
+Flow Field - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Navigation for many agents sharing one goal. A single Dijkstra from the
+goal (a vectorized wavefront when there is no terrain) fills the
+integration field (cost to the goal for every cell); the
+direction field then stores, per cell, which neighbor to step to. Any
+number of agents read their next move from it in O(1) - no per-agent
+search at all.
+
+When cells become blocked, only the cells whose flow ran through them
+are recomputed; when cells open up, only the cells that get closer to
+the goal are updated.
+"""
+
+from typing import Tuple, List, Optional
+import heapq
+
+import numpy as np
+
+from environment import DIRECTIONS
+from ai_core.search_algorithms import wavefront
+
+
+NO_DIRECTION = -1
+
+# Incremental updates that would invalidate more than this fraction of the
+# grid fall back to a (vectorized, faster) full rebuild
+MAX_INCREMENTAL_FRACTION = 0.1
+
+
+class FlowField:
+    """
+    Integration and direction fields towards one goal, kept up to date.
+
+    Cells are open if they are passable in the grid and not blocked with
+    set_blocked(). Grid changes (GridWorld.changes_since()) and blocked
+    cells are applied lazily, the next time the field is read.
+
+    Moving into a cell costs its terrain cost (GridWorld.get_cost()).
+    """
+
+    def __init__(self, env, goal: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the flow field.
+
+        Args:
+            env: GridWorld environment
+            goal: Target cell; None follows env.goal
+        """
+        self.env = env
+        self.goal = goal
+        self.blocked = set()     # Extra cells treated as obstacles
+        self.rebuilds = 0        # Number of full recomputations so far
+        self.settled = 0         # Cells whose cost was (re)computed so far
+
+        self._integration = None     # Flat float64 cost to goal (inf = unreachable)
+        self._direction = None       # Flat int8 index into DIRECTIONS
+        self._open = None            # Flat bool, passable and not blocked
+        self._costs = None           # Flat cost of moving into each cell (array('d'))
+        self._version = None
+        self._field_goal = None
+        self._newly_blocked = set()
+        self._newly_freed = set()
+
+    # ------------------------------------------------------------------
+    # Reading the field
+    # ------------------------------------------------------------------
+
+    @property
+    def integration(self) -> np.ndarray:
+        """(height, width) float64 cost to the goal (inf = unreachable)."""
+        self._ensure()
+        return self._integration.reshape(self.env.height, self.env.width)
+
+    @property
+    def directions(self) -> np.ndarray:
+        """(height, width) int8 index into DIRECTIONS of the next step (-1 = none)."""
+        self._ensure()
+        return self._direction.reshape(self.env.height, self.env.width)
+
+    def next_step(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Get the next cell on a shortest path from pos to the goal, in O(1).
+
+        Returns:
+            Next position, or None at the goal or where the goal is unreachable
+        """
+        self._ensure()
+        direction = self._direction[pos[0] * self.env.width + pos[1]]
+        if direction == NO_DIRECTION:
+            return None
+        dr, dc = DIRECTIONS[direction]
+        return pos[0] + dr, pos[1] + dc
+
+    def next_steps(self, positions) -> np.ndarray:
+        """
+        Next cell for a whole fleet at once.
+
+        Args:
+            positions: (N, 2) array-like of (row, col) positions
+
+        Returns:
+            (N, 2) int array of next positions; agents at the goal or with
+            no path stay where they are
+        """
+        self._ensure()
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        direction = self._direction[positions[:, 0] * self.env.width + positions[:, 1]]
+        steps = np.vstack([np.array(DIRECTIONS, dtype=np.int64), [[0, 0]]])
+        return positions + steps[direction]   # -1 picks the trailing (0, 0)
+
+    def cost(self, pos: Tuple[int, int]) -> float:
+        """Cost from pos to the goal (inf if it cannot be reached)."""
+        self._ensure()
+        return float(self._integration[pos[0] * self.env.width + pos[1]])
+
+    def path_from(self, pos: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Follow the direction field from pos to the goal.
+
+        Returns:
+            Path from pos to goal (inclusive), or None if no path exists
+        """
+        if self.cost(pos) == float('inf'):
+            return None
+        path = [pos]
+        while path[-1] != self._field_goal:
+            path.append(self.next_step(path[-1]))
+        return path
+
+    # ------------------------------------------------------------------
+    # Changes
+    # ------------------------------------------------------------------
+
+    def set_blocked(self, pos: Tuple[int, int], blocked: bool) -> bool:
+        """
+        Mark a cell as blocked (or free again) on top of the grid obstacles.
+
+        Returns:
+            True if the cell's blocked state changed
+        """
+        if blocked and pos not in self.blocked:
+            self.blocked.add(pos)
+            self._newly_freed.discard(pos)
+            self._newly_blocked.add(pos)
+        elif not blocked and pos in self.blocked:
+            self.blocked.discard(pos)
+            self._newly_blocked.discard(pos)
+            self._newly_freed.add(pos)
+        else:
+            return False
+        return True
+
+    def _ensure(self):
+        """Bring the fields up to date with the grid, goal and blocked cells."""
+        goal = self.goal if self.goal is not None else self.env.goal
+        if self._integration is None or goal != self._field_goal:
+            self._rebuild(goal)
+            return
+
+        blocked, freed = self._newly_blocked, self._newly_freed
+        if self._version != self.env.version:
+            changed = self.env.changes_since(self._version)
+            if changed is None:
+                self._rebuild(goal)
+                return
+            blocked = blocked | set(changed)
+        self._version = self.env.version
+
+        width = self.env.width
+        if blocked:
+            indices = [row * width + col for row, col in blocked]
+            self._open[indices] = False
+            if not self._raise(indices):
+                self._rebuild(goal)
+                return
+        if freed:
+            passable = self.env.passable_cells()
+            indices = [row * width + col for row, col in freed
+                       if passable[row * width + col]]
+            self._open[indices] = True
+            self._lower(indices)
+        self._newly_blocked, self._newly_freed = set(), set()
+
+    def _rebuild(self, goal: Tuple[int, int]):
+        """Full recomputation: wavefront from the goal, then all directions."""
+        env = self.env
+        height, width = env.height, env.width
+        self._open = np.frombuffer(env.passable_cells(), dtype=np.uint8).astype(bool)
+        if self.blocked:
+            self._open[[row * width + col for row, col in self.blocked]] = False
+
+        self._costs = env.cost_table()
+        self._integration = np.full(height * width, np.inf)
+        self._direction = np.full(height * width, NO_DIRECTION, dtype=np.int8)
+        goal_index = goal[0] * width + goal[1]
+        if self._open[goal_index]:
+            if env.has_uniform_cost():
+                dist, _ = wavefront(env, goal, blocked=self.blocked)
+                dist = dist.ravel()
+                self._integration[dist >= 0] = dist[dist >= 0]
+                self.settled += int(np.count_nonzero(dist >= 0))
+            else:
+                # Terrain: plain Dijkstra from the goal (counts its own settled cells)
+                self._integration[goal_index] = 0.0
+                self._propagate([(0.0, goal_index)])
+            self._direction = self._directions_for_all(goal_index)
+
+        self._version = env.version
+        self._field_goal = goal
+        self._newly_blocked, self._newly_freed = set(), set()
+        self.rebuilds += 1
+
+    def _directions_for_all(self, goal_index: int) -> np.ndarray:
+        """Vectorized direction field: step to the neighbor with the lowest total cost."""
+        height, width = self.env.height, self.env.width
+        # Cost to the goal through each cell: entering it, then its integration value
+        through = self._integration + np.frombuffer(self._costs, dtype=np.float64)
+        values = np.where(self._open, through, np.inf).reshape(height, width)
+        padded = np.pad(values, 1, constant_values=np.inf)
+        neighbor_values = np.stack([padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+                                    for dr, dc in DIRECTIONS])
+        direction = np.argmin(neighbor_values, axis=0).astype(np.int8).ravel()
+        no_step = ~np.isfinite(self._integration) | ~self._open
+        no_step[goal_index] = True
+        direction[no_step] = NO_DIRECTION
+        return direction
+
+    def _neighbors(self, index: int):
+        """(direction, neighbor index) pairs of in-bounds neighbors."""
+        row, col = divmod(index, self.env.width)
+        for k, (dr, dc) in enumerate(DIRECTIONS):
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < self.env.height and 0 <= nc < self.env.width:
+                yield k, nr * self.env.width + nc
+
+    def _raise(self, indices: List[int]) -> bool:
+        """
+        Cells became blocked: invalidate every cell whose flow passed
+        through them, then re-seed those cells from the valid border.
+
+        Returns:
+            False (nothing changed) if too much of the field depends on
+            the cells and a full rebuild is cheaper
+        """
+        limit = MAX_INCREMENTAL_FRACTION * self.env.width * self.env.height
+        integration, direction, is_open = self._integration, self._direction, self._open
+        costs = self._costs
+        width = self.env.width
+
+        # Collect the upstream subtree: cells whose direction leads into it
+        invalid = set()
+        stack = list(indices)
+        while stack:
+            index = stack.pop()
+            if index in invalid:
+                continue
+            invalid.add(index)
+            if len(invalid) > limit:
+                return False
+            for _, neighbor in self._neighbors(index):
+                if neighbor in invalid or direction[neighbor] == NO_DIRECTION:
+                    continue
+                dr, dc = DIRECTIONS[direction[neighbor]]
+                if neighbor + dr * width + dc == index:
+                    stack.append(neighbor)
+
+        for index in invalid:
+            integration[index] = np.inf
+            direction[index] = NO_DIRECTION
+
+        # Re-seed from the valid cells bordering the invalidated region
+        frontier = []
+        for index in invalid:
+            if not is_open[index]:
+                continue
+            for k, neighbor in self._neighbors(index):
+                if neighbor not in invalid and is_open[neighbor] and np.isfinite(integration[neighbor]):
+                    cost = integration[neighbor] + costs[neighbor]
+                    if cost < integration[index]:
+                        integration[index] = cost
+                        direction[index] = k
+            if np.isfinite(integration[index]):
+                heapq.heappush(frontier, (integration[index], index))
+        self._propagate(frontier)
+        return True
+
+    def _lower(self, indices: List[int]):
+        """Cells became free: pull them (and what gets closer through them) down."""
+        integration, direction, is_open = self._integration, self._direction, self._open
+        costs = self._costs
+        goal = self._field_goal
+        goal_index = goal[0] * self.env.width + goal[1]
+        frontier = []
+        for index in indices:
+            if index == goal_index:
+                integration[index] = 0.0
+                direction[index] = NO_DIRECTION
+            for k, neighbor in self._neighbors(index):
+                if is_open[neighbor] and integration[neighbor] + costs[neighbor] < integration[index]:
+                    integration[index] = integration[neighbor] + costs[neighbor]
+                    direction[index] = k
+            if np.isfinite(integration[index]):
+                heapq.heappush(frontier, (integration[index], index))
+        self._propagate(frontier)
+
+    def _propagate(self, frontier: list):
+        """Dijkstra outwards from the seeded cells, lowering costs where possible."""
+        integration, direction, is_open = self._integration, self._direction, self._open
+        while frontier:
+            cost, index = heapq.heappop(frontier)
+            if cost > integration[index]:
+                continue
+            self.settled += 1
+            # Neighbors reach the goal through index by moving into it
+            through = cost + self._costs[index]
+            for k, neighbor in self._neighbors(index):
+                if is_open[neighbor] and through < integration[neighbor]:
+                    integration[neighbor] = through
+                    # The neighbor steps back towards index: opposite direction
+                    direction[neighbor] = k ^ 1
+                    heapq.heappush(frontier, (through, neighbor))
@@ -0,0 +1,320 @@
+"""
+Hierarchical Pathfinding (HPA*) - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+For very large maps the grid is cut into square clusters. Cells where two
+neighboring clusters connect ("entrances") become nodes of a small
+abstract graph, linked inside each cluster by their local path costs.
+A query searches the abstract graph first and then refines only the
+cluster-sized segments the abstract path passes through.
+
+Paths are near-optimal: on large maps usually within a few percent of
+astar(), though short queries across a cluster border can detour through
+an entrance.
+"""
+
+from typing import Tuple, List, Optional, Dict
+import heapq
+
+import numpy as np
+
+from environment import OBSTACLE
+from ai_core.search_algorithms import make_heuristic
+
+
+# Entrances at least this wide get a transition at both ends, narrower
+# ones a single transition in the middle
+MAX_ENTRANCE_WIDTH = 6
+
+
+class HPAStar:
+    """
+    Abstract graph over a clustered GridWorld, kept in sync with the grid.
+
+    Entrances and intra-cluster edges are computed for every cluster when
+    the graph is built (with lazy=True, intra-cluster edges wait until a
+    search first reaches the cluster). When single cells change
+    (add_obstacle()), only the clusters around them are updated.
+    """
+
+    def __init__(self, env, cluster_size: int = 16, lazy: bool = False):
+        """
+        Build the abstract graph.
+
+        Args:
+            env: GridWorld environment
+            cluster_size: Width and height of a cluster, in cells
+            lazy: Defer each cluster's intra-cluster edges until a search
+                  needs them, instead of precomputing all of them
+        """
+        self.env = env
+        self.cluster_size = cluster_size
+        self.lazy = lazy
+        self._build()
+
+    # ------------------------------------------------------------------
+    # Construction and local updates
+    # ------------------------------------------------------------------
+
+    def _build(self):
+        """(Re)build every border's entrances and, unless lazy, all intra edges."""
+        size = self.cluster_size
+        self.cluster_rows = -(-self.env.height // size)
+        self.cluster_cols = -(-self.env.width // size)
+
+        # border key -> list of (cell_a, cell_b) transitions across it
+        self.transitions: Dict[tuple, List[tuple]] = {}
+        # abstract node -> set of nodes across a border (step cost via get_cost)
+        self.inter_edges: Dict[tuple, set] = {}
+        # cluster -> {node: {other_node: cost}}, missing = not computed yet
+        self.intra_edges: Dict[tuple, dict] = {}
+
+        for cr in range(self.cluster_rows):
+            for cc in range(self.cluster_cols):
+                for border in self._borders_of((cr, cc), right_and_down_only=True):
+                    self._scan_border(border)
+        if not self.lazy:
+            for cr in range(self.cluster_rows):
+                for cc in range(self.cluster_cols):
+                    self._intra((cr, cc))
+
+        self._version = self.env.version
+
+    def _sync(self):
+        """Bring the abstract graph up to date with the grid."""
+        if self._version == self.env.version:
+            return
+        changed = self.env.changes_since(self._version)
+        if changed is None:
+            self._build()
+            return
+
+        dirty_clusters = set()
+        for row, col in changed:
+            cluster = self.cluster_of((row, col))
+            for border in self._borders_of(cluster):
+                self._scan_border(border)
+                dirty_clusters.update(border)
+        for cluster in dirty_clusters:
+            self.intra_edges.pop(cluster, None)
+            if not self.lazy:
+                self._intra(cluster)
+        self._version = self.env.version
+
+    def _borders_of(self, cluster, right_and_down_only=False) -> List[tuple]:
+        """Border keys (cluster_a, cluster_b) of a cluster, a above/left of b."""
+        cr, cc = cluster
+        borders = []
+        if cc + 1 < self.cluster_cols:
+            borders.append(((cr, cc), (cr, cc + 1)))
+        if cr + 1 < self.cluster_rows:
+            borders.append(((cr, cc), (cr + 1, cc)))
+        if not right_and_down_only:
+            if cc > 0:
+                borders.append(((cr, cc - 1), (cr, cc)))
+            if cr > 0:
+                borders.append(((cr - 1, cc), (cr, cc)))
+        return borders
+
+    def _scan_border(self, border):
+        """Recompute the transitions across one border between two clusters."""
+        for a, b in self.transitions.pop(border, []):
+            self.inter_edges[a].discard(b)
+            self.inter_edges[b].discard(a)
+
+        size = self.cluster_size
+        grid = self.env.grid
+        (cr, cc), (cr2, cc2) = border
+        if cr == cr2:
+            # Vertical border: column c1 | column c1 + 1, rows of this cluster row
+            c1 = (cc + 1) * size - 1
+            r0, r1 = cr * size, min((cr + 1) * size, self.env.height)
+            open_cells = (grid[r0:r1, c1] != OBSTACLE) & (grid[r0:r1, c1 + 1] != OBSTACLE)
+            pair = lambda i: ((r0 + i, c1), (r0 + i, c1 + 1))
+        else:
+            # Horizontal border: row r1 over row r1 + 1, columns of this cluster column
+            r1 = (cr + 1) * size - 1
+            c0, c1 = cc * size, min((cc + 1) * size, self.env.width)
+            open_cells = (grid[r1, c0:c1] != OBSTACLE) & (grid[r1 + 1, c0:c1] != OBSTACLE)
+            pair = lambda i: ((r1, c0 + i), (r1 + 1, c0 + i))
+
+        # Maximal runs of open cells along the border
+        edges = np.diff(np.concatenate(([0], open_cells.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+
+        transitions = []
+        for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+            if end - start >= MAX_ENTRANCE_WIDTH:
+                transitions.append(pair(start))
+                transitions.append(pair(end - 1))
+            else:
+                transitions.append(pair((start + end - 1) // 2))
+
+        for a, b in transitions:
+            self.inter_edges.setdefault(a, set()).add(b)
+            self.inter_edges.setdefault(b, set()).add(a)
+        if transitions:
+            self.transitions[border] = transitions
+
+    def cluster_of(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Cluster (cluster_row, cluster_col) containing a cell."""
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def _cluster_nodes(self, cluster) -> set:
+        """Abstract nodes lying inside a cluster."""
+        nodes = set()
+        for border in self._borders_of(cluster):
+            for a, b in self.transitions.get(border, ()):
+                nodes.add(a if self.cluster_of(a) == cluster else b)
+        return nodes
+
+    def _intra(self, cluster) -> dict:
+        """Intra-cluster edges of a cluster, computed on first use."""
+        edges = self.intra_edges.get(cluster)
+        if edges is None:
+            nodes = self._cluster_nodes(cluster)
+            edges = {}
+            for node in nodes:
+                dist, _ = self._local_search(node, nodes - {node}, cluster)
+                edges[node] = {other: d for other, d in dist.items() if other != node and other in nodes}
+            self.intra_edges[cluster] = edges
+        return edges
+
+    def _local_search(self, source, targets, cluster):
+        """
+        Dijkstra from source that never leaves the given cluster.
+
+        Stops once every target is settled.
+
+        Returns:
+            dist: Settled cells -> cost from source
+            parent: Settled cells -> previous cell
+        """
+        size = self.cluster_size
+        r0, c0 = cluster[0] * size, cluster[1] * size
+        r1, c1 = r0 + size, c0 + size
+        remaining = set(targets)
+        dist, parent = {}, {source: None}
+        best = {source: 0.0}
+        frontier = [(0.0, source)]
+        while frontier and remaining:
+            d, current = heapq.heappop(frontier)
+            if current in dist:
+                continue
+            dist[current] = d
+            remaining.discard(current)
+            for neighbor in self.env.get_neighbors(current):
+                if neighbor in dist or not (r0 <= neighbor[0] < r1 and c0 <= neighbor[1] < c1):
+                    continue
+                nd = d + self.env.get_cost(current, neighbor)
+                if neighbor not in best or nd < best[neighbor]:
+                    best[neighbor] = nd
+                    parent[neighbor] = current
+                    heapq.heappush(frontier, (nd, neighbor))
+        return dist, parent
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[List], float, int]:
+        """
+        Find a path by searching the abstract graph, then refining it.
+
+        Args:
+            start: Starting position (row, col)
+            goal: Goal position (row, col)
+
+        Returns:
+            path: List of (row, col) tuples from start to goal (None if no path)
+            cost: Total path cost
+            expanded: Abstract nodes expanded plus cells expanded while refining
+        """
+        self._sync()
+        if not self.env.is_valid(start) or not self.env.is_reachable(start, goal):
+            return None, float('inf'), 0
+
+        # Temporary edges connecting start and goal to their clusters' entrances
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        extra: Dict[tuple, Dict[tuple, float]] = {start: {}, goal: {}}
+        terrain = self.env.terrain
+        for endpoint, cluster in ((start, start_cluster), (goal, goal_cluster)):
+            nodes = self._cluster_nodes(cluster) - {endpoint}
+            dist, _ = self._local_search(endpoint, nodes, cluster)
+            for node, d in dist.items():
+                if node not in nodes:
+                    continue
+                if endpoint == start:
+                    extra[start][node] = d
+                else:
+                    # d was measured leaving the goal; walked the other way,
+                    # the same cells enter the goal instead of node
+                    extra.setdefault(node, {})[goal] = d - float(terrain[node]) + float(terrain[goal])
+        if start_cluster == goal_cluster:
+            dist, _ = self._local_search(start, {goal}, start_cluster)
+            if goal in dist:
+                extra[start][goal] = dist[goal]
+
+        abstract_path, expanded = self._abstract_search(start, goal, extra)
+        if abstract_path is None:
+            return None, float('inf'), expanded
+
+        # Refine: adjacent abstract nodes are one step apart, the others
+        # are joined by a search inside their shared cluster
+        path = [start]
+        for a, b in zip(abstract_path, abstract_path[1:]):
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+                path.append(b)
+                continue
+            dist, parent = self._local_search(a, {b}, self.cluster_of(a))
+            expanded += len(dist)
+            segment = []
+            node = b
+            while node != a:
+                segment.append(node)
+                node = parent[node]
+            path.extend(reversed(segment))
+
+        cost = sum(self.env.get_cost(a, b) for a, b in zip(path, path[1:]))
+        return path, cost, expanded
+
+    def _abstract_search(self, start, goal, extra):
+        """A* over the abstract graph plus the temporary start/goal edges."""
+        h = make_heuristic(self.env, goal)
+        g_score = {start: 0.0}
+        parent = {start: None}
+        frontier = [(h(start), start)]
+        explored = set()
+        expanded = 0
+
+        while frontier:
+            current_f, current = heapq.heappop(frontier)
+            if current in explored:
+                continue
+            explored.add(current)
+            expanded += 1
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return path, expanded
+
+            edges = list(extra.get(current, {}).items())
+            if current in self.inter_edges:
+                edges.extend(self._intra(self.cluster_of(current)).get(current, {}).items())
+                edges.extend((other, self.env.get_cost(current, other))
+                             for other in self.inter_edges[current])
+
+            for neighbor, step in edges:
+                if neighbor in explored:
+                    continue
+                tentative_g = g_score[current] + step
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    heapq.heappush(frontier, (tentative_g + h(neighbor), neighbor))
+
+        return None, expanded
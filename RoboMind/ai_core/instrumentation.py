@@ -0,0 +1,186 @@
+"""
+Search Instrumentation - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Optional probes for bfs(), ucs() and astar(). Pass a SearchInstrument as
+instrument=... and the search reports every frontier push and pop, stale
+pops (outdated heap entries), re-openings, heuristic evaluations and the
+time spent per phase:
+
+    probe = SearchInstrument(trace=True)
+    astar(env, start, goal, instrument=probe)
+    print(probe.as_dict())
+    probe.save_trace('astar.trace')
+
+Without an instrument the searches only pay one `is not None` test per
+event. Subclass SearchInstrument and override the on_* methods to get
+callbacks instead of (or on top of) the counters.
+
+Trace files hold the expansion order: an 8-byte magic, the grid height
+and width as little-endian uint32, then one uint32 flat cell index
+(row * width + col) per expansion. load_trace() and expansion_heatmap()
+read them back.
+"""
+
+from typing import Tuple, Callable, Dict, Optional
+from array import array
+import time
+
+import numpy as np
+
+
+TRACE_MAGIC = b'RMTRACE1'
+
+
+class SearchInstrument:
+    """
+    Counters, phase timers and an optional expansion trace for one search.
+
+    Counters are reset by start(), which the searches call first, so one
+    instrument can be reused for several runs (it then describes the last).
+
+    Attributes:
+        pushes: Entries added to the frontier
+        pops: Entries taken from the frontier (including stale ones)
+        stale_pops: Popped entries skipped because the cell was already closed
+        reopenings: Cheaper paths found to already closed cells (these
+                    searches never reopen; non-zero means an inconsistent
+                    heuristic)
+        expansions: Cells expanded (same count as the search's 'expanded')
+        peak_frontier: Largest frontier size seen
+        heuristic_evals: Calls to the heuristic
+        phase_times: Seconds spent per phase ('setup', 'search', 'reconstruct')
+    """
+
+    def __init__(self, trace: bool = False):
+        """
+        Args:
+            trace: Record the expansion order (see save_trace())
+        """
+        self.trace_enabled = trace
+        self.shape = (0, 0)
+        self._width = 0
+        self.reset()
+
+    def reset(self):
+        """Zero all counters and clear the trace."""
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.reopenings = 0
+        self.expansions = 0
+        self.peak_frontier = 0
+        self.heuristic_evals = 0
+        self.phase_times: Dict[str, float] = {}
+        self.trace = array('I')
+        self._phase = None
+        self._phase_began = 0.0
+
+    # ------------------------------------------------------------------
+    # Called by the searches
+    # ------------------------------------------------------------------
+
+    def start(self, env):
+        """A search begins on env: reset and enter the 'setup' phase."""
+        self.reset()
+        self.shape = (env.height, env.width)
+        self._width = env.width
+        self.phase('setup')
+
+    def phase(self, name: Optional[str]):
+        """End the current phase and start timing the next one."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.phase_times[self._phase] = self.phase_times.get(self._phase, 0.0) + now - self._phase_began
+        self._phase, self._phase_began = name, now
+
+    def finish(self):
+        """The search returned: close the last phase."""
+        self.phase(None)
+
+    def on_push(self, cell: Tuple[int, int], frontier_size: int):
+        self.pushes += 1
+        if frontier_size > self.peak_frontier:
+            self.peak_frontier = frontier_size
+
+    def on_pop(self, cell: Tuple[int, int]):
+        self.pops += 1
+
+    def on_stale_pop(self, cell: Tuple[int, int]):
+        self.stale_pops += 1
+
+    def on_reopen(self, cell: Tuple[int, int]):
+        self.reopenings += 1
+
+    def on_expand(self, cell: Tuple[int, int]):
+        self.expansions += 1
+        if self.trace_enabled:
+            self.trace.append(cell[0] * self._width + cell[1])
+
+    def count_heuristic(self, h: Callable) -> Callable:
+        """Wrap a heuristic function so that its calls are counted."""
+        def counted(pos):
+            self.heuristic_evals += 1
+            return h(pos)
+        return counted
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def as_dict(self) -> dict:
+        """All counters and phase times as a plain dict."""
+        return {
+            'pushes': self.pushes,
+            'pops': self.pops,
+            'stale_pops': self.stale_pops,
+            'reopenings': self.reopenings,
+            'expansions': self.expansions,
+            'peak_frontier': self.peak_frontier,
+            'heuristic_evals': self.heuristic_evals,
+            'phase_times': dict(self.phase_times),
+        }
+
+    def save_trace(self, path: str):
+        """Write the expansion order to a binary trace file."""
+        if not self.trace_enabled:
+            raise ValueError("Tracing is off; create the instrument with trace=True")
+        with open(path, 'wb') as f:
+            f.write(TRACE_MAGIC)
+            np.array(self.shape, dtype='<u4').tofile(f)
+            np.frombuffer(self.trace, dtype=np.uint32).astype('<u4', copy=False).tofile(f)
+
+
+def load_trace(path: str) -> Tuple[Tuple[int, int], np.ndarray]:
+    """
+    Read a trace file written by SearchInstrument.save_trace().
+
+    Returns:
+        shape: (height, width) of the searched grid
+        order: uint32 array of flat cell indices, in expansion order
+
+    Raises:
+        ValueError: If the file is not a trace file
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f"{path} is not a search trace file")
+        height, width = np.fromfile(f, dtype='<u4', count=2)
+        order = np.fromfile(f, dtype='<u4')
+    return (int(height), int(width)), order
+
+
+def expansion_heatmap(path: str) -> np.ndarray:
+    """
+    Expansion order per cell from a trace file, for plotting.
+
+    Returns:
+        (height, width) int64 array: the step at which each cell was
+        expanded (its first expansion), -1 for cells never expanded
+    """
+    (height, width), order = load_trace(path)
+    heatmap = np.full(height * width, -1, dtype=np.int64)
+    # Reversed, so the first expansion of a cell wins
+    steps = np.arange(len(order), dtype=np.int64)
+    heatmap[order[::-1]] = steps[::-1]
+    return heatmap.reshape(height, width)
@@ -6,7 +6,164 @@ TODO: Implement propositional logic knowledge base with inference
 Phase 2 (Week 3-4)
 """
 
-from typing import Set, List
+from typing import Set, List, Optional, Tuple
+from collections import defaultdict, deque
+import re
+
+import numpy as np
+
+from environment import DIRECTIONS
+
+
+# Grid propositions accepted as strings: "free_3_4" and "Free(3,4)"
+_UNDERSCORE_ATOM = re.compile(r'^([A-Za-z]\w*?)_(\d+)_(\d+)$')
+_CALL_ATOM = re.compile(r'^([A-Za-z]\w*)\((\d+),\s*(\d+)\)$')
+
+# Rule templates: atoms like "Safe(X)" or "Adjacent(X,Y)"
+_TEMPLATE_ATOM = re.compile(r'^([A-Za-z]\w*)\(([^()]*)\)$')
+_VARIABLE = re.compile(r'^[A-Z]\w*$')
+
+# Relations between two cell variables, as the offsets that satisfy them
+RELATIONS = {
+    'Adjacent': DIRECTIONS,
+}
+
+
+def _parse_template_atom(atom):
+    """(name, args) of a string atom with at least one variable argument, else None."""
+    if not isinstance(atom, str):
+        return None
+    match = _TEMPLATE_ATOM.match(atom)
+    if not match:
+        return None
+    args = tuple(arg.strip() for arg in match.group(2).split(','))
+    if not any(_VARIABLE.match(arg) for arg in args):
+        return None
+    return match.group(1), args
+
+
+class RuleTemplate:
+    """
+    A rule over cell variables, compiled to whole-grid mask operations.
+    
+    Premises are unary cell predicates ("Safe(X)"), relations between two
+    variables ("Adjacent(X,Y)", see RELATIONS) and ground propositions
+    that gate the whole rule. The conclusion is a cell predicate of one
+    variable. Variables other than the conclusion's are existential:
+    
+        Free(Y) AND Adjacent(X,Y) AND Safe(X) -> Reachable(X)
+    
+    holds at every cell X that is safe and has a free neighbor.
+    
+    The relations must form a forest (no cycles), so the rule is evaluated
+    exactly by semi-joins: each variable's mask is the AND of its unary
+    predicates and, per child variable, the child's mask shifted over the
+    relation's offsets and OR-ed.
+    """
+    
+    def __init__(self, kb, premises: List, conclusion: str):
+        """
+        Compile a template against the grids of kb.
+        
+        Raises:
+            ValueError: If an atom cannot be part of a template, the
+                        conclusion's variable is not bound by the premises,
+                        or the relations contain a cycle
+        """
+        self.premises = premises
+        self.conclusion = conclusion
+        self.shape = kb.shape
+        
+        parsed = _parse_template_atom(conclusion)
+        if parsed is None or len(parsed[1]) != 1:
+            raise ValueError(f"Template conclusion must be a cell predicate of one variable: {conclusion}")
+        self.predicate, (self.head,) = parsed
+        self.target = kb.declare(self.predicate)
+        
+        self.gates = []          # Ground premises (interned atoms)
+        unary = defaultdict(list)
+        edges = {}               # Unordered variable pair -> offsets
+        for premise in premises:
+            parsed = _parse_template_atom(premise)
+            if parsed is None:
+                self.gates.append(kb._atom(premise))
+                continue
+            name, args = parsed
+            if not all(_VARIABLE.match(arg) for arg in args):
+                raise ValueError(f"Template atoms cannot mix variables and constants: {premise}")
+            if len(args) == 1:
+                unary[args[0]].append((name, kb.declare(name)))
+            elif len(args) == 2 and name in RELATIONS:
+                if args[0] == args[1]:
+                    raise ValueError(f"Relation of a variable with itself: {premise}")
+                # Only symmetric relations, so the pair is unordered
+                edges[frozenset(args)] = RELATIONS[name]
+            else:
+                raise ValueError(f"Unknown relation {name}/{len(args)} in template: {premise}")
+        
+        variables = set(unary)
+        for pair in edges:
+            variables |= pair
+        if self.head not in variables:
+            raise ValueError(f"Variable {self.head} of {conclusion} does not occur in the premises")
+        
+        neighbors = defaultdict(list)
+        for pair, offsets in edges.items():
+            a, b = tuple(pair)
+            neighbors[a].append((b, offsets))
+            neighbors[b].append((a, offsets))
+        
+        # One rooted tree per connected component; the head's tree gives the
+        # mask, the others only need to be satisfiable somewhere
+        seen = set()
+        self.plan = None
+        self.conditions = []
+        for root in [self.head] + sorted(variables - {self.head}):
+            if root in seen:
+                continue
+            tree = self._compile(root, None, neighbors, unary, seen)
+            if root == self.head:
+                self.plan = tree
+            else:
+                self.conditions.append(tree)
+    
+    def _compile(self, variable, parent, neighbors, unary, seen):
+        """Plan for one variable: ([(unary predicate, grid)], [(child plan, offsets)])."""
+        seen.add(variable)
+        children = []
+        for other, offsets in neighbors[variable]:
+            if other == parent:
+                continue
+            if other in seen:
+                raise ValueError(f"Relations in template form a cycle through {other}: {self.premises}")
+            children.append((self._compile(other, variable, neighbors, unary, seen), offsets))
+        return unary[variable], children
+    
+    def _mask(self, plan) -> np.ndarray:
+        """Cells where a variable's subtree of premises can be satisfied."""
+        grids, children = plan
+        height, width = self.shape
+        mask = np.ones(self.shape, dtype=bool)
+        for _, grid in grids:
+            mask &= grid
+        for child, offsets in children:
+            padded = np.pad(self._mask(child), 1, constant_values=False)
+            shifted = np.zeros(self.shape, dtype=bool)
+            for dr, dc in offsets:
+                shifted |= padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+            mask &= shifted
+        return mask
+    
+    def evaluate(self, kb) -> np.ndarray:
+        """Cells where the conclusion follows and is not known yet."""
+        if not all(kb._known(gate) for gate in self.gates):
+            return np.zeros(self.shape, dtype=bool)
+        if not all(self._mask(condition).any() for condition in self.conditions):
+            return np.zeros(self.shape, dtype=bool)
+        return self._mask(self.plan) & ~self.target
+    
+    def __str__(self) -> str:
+        return f"{' AND '.join(self.premises)} → {self.conclusion}"
 
 
 class KnowledgeBase:
@@ -14,71 +171,424 @@ class KnowledgeBase:
     A simple knowledge base for propositional logic.
     
     Stores facts and rules, performs forward chaining inference.
+    Rules are indexed by premise, so inference only looks at the rules
+    that mention a newly known fact.
+    
+    Inference is incremental: every rule keeps a counter of its premises
+    not known yet, and tell() propagates a new fact through the rules that
+    mention it right away. infer() only has work to do for rules added
+    after their premises were already known. Add facts through tell()
+    (not self.facts directly) so the counters stay in sync.
+    
+    Grid facts: with a grid shape, propositions about one cell are
+    interned as (predicate, row, col) and stored in one NumPy bool array
+    per predicate instead of as strings:
+    
+        kb.tell('free', 3, 4)          # O(1), no string built
+        kb.ask('free', 3, 4)
+        kb.tell("free_3_4")            # same fact, parsed once and cached
+        kb.ask("Free(3,4)")            # a different predicate, 'Free'
+    
+    Any other proposition is kept as a string in self.facts. So with a
+    grid shape self.facts no longer lists every fact: "free_3_4" is set in
+    the 'free' grid instead. Check a fact with `proposition in kb` or
+    ask(), which look in both places, and count them with len(kb).
+    
+    Rule templates: with a grid shape, add_rule() also takes rules over
+    cell variables, which stand for every cell at once (see RuleTemplate):
+    
+        kb.add_rule(["Safe(X)", "Free(X)"], "CanMove(X)")
+        kb.add_rule(["CanMove(Y)", "Adjacent(X,Y)", "Free(X)"], "Frontier(X)")
+    
+    infer() evaluates each template over the whole grid with NumPy masks,
+    repeating until no template derives anything new.
+    
+    Backward chaining: ask(query, backward=True) proves just the query
+    from the rules and templates that conclude it, without running
+    infer() first.
     """
     
-    def __init__(self):
-        """Initialize empty knowledge base."""
-        self.facts = set()   # Known facts: "Safe(2,3)", "Obstacle(4,5)"
+    def __init__(self, shape: Optional[Tuple[int, int]] = None, verbose: bool = True):
+        """
+        Initialize empty knowledge base.
+        
+        Args:
+            shape: (height, width) of the grid for cell predicates; None
+                   stores every proposition as a string
+            verbose: Print every added fact, rule and inferred fact
+        """
+        self.facts = set()   # Known string facts: "Safe(2,3)", "Obstacle(4,5)"
         self.rules = []      # Rules: ("A", "B", "C") means "A AND B → C"
+        self.shape = tuple(shape) if shape is not None else None
+        self.verbose = verbose
+        
+        # Grid facts: predicate -> (height, width) bool array
+        self._grid = {}
+        self._grid_count = 0
+        self._atoms = {}     # Parsed string -> interned atom (compatibility shim)
+        
+        # Rule index, keyed by interned atom: string facts directly, grid
+        # facts per predicate by flat cell index (row * width + col)
+        self._rules_by_premise = defaultdict(list)  # premise -> indices into self.rules
+        self._grid_rules = {}    # predicate -> {flat index: [rule indices]}
+        self._conclusions = []   # Per rule: interned conclusion
+        self._premises = []      # Per rule: distinct interned premises
+        self._rules_by_conclusion = defaultdict(list)  # conclusion -> rule indices
+        self._remaining = []     # Per rule: distinct premises not known yet
+        self._pending = deque()  # Rules whose premises all hold, not fired yet
+        
+        # Rule templates over cell variables, and len(self) when they were
+        # last run to a fixpoint (facts only grow, so equal means no news)
+        self.templates = []
+        self._templates_seen = -1
+        self._templates_by_conclusion = defaultdict(list)   # predicate -> templates
+        
+        # Backward chaining memo. Facts and rules only grow, so proved goals
+        # stay proved; disproved goals are forgotten when the version (new
+        # facts and rules) changes
+        self._proved = set()
+        self._disproved = set()
+        self._memo_version = 0
+        self._low = 0            # Shallowest in-progress goal a subproof ran into
+        
+        # Inference counters
+        self.tells = 0           # Facts added by tell() (new ones only)
+        self.rules_fired = 0     # Rules fired in total
+        self.last_fired = 0      # Rules fired by the most recent tell()
+        self.goals_explored = 0  # Goals backward chaining tried rules for
+    
+    def __len__(self) -> int:
+        """Number of known facts, string and grid."""
+        return len(self.facts) + self._grid_count
     
-    def tell(self, fact: str):
+    def __contains__(self, proposition) -> bool:
+        """Whether a proposition (string or (predicate, row, col)) is a known fact."""
+        if isinstance(proposition, tuple):
+            predicate, row, col = proposition
+            if self.shape is None or not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]):
+                return False
+        return self._known(self._atom(proposition))
+    
+    # ------------------------------------------------------------------
+    # Grid predicates
+    # ------------------------------------------------------------------
+    
+    def declare(self, predicate: str) -> np.ndarray:
+        """
+        Intern a cell predicate (done automatically on first use).
+        
+        Returns:
+            The predicate's (height, width) bool array of known facts;
+            read-only for callers
+        """
+        cells = self._grid.get(predicate)
+        if cells is None:
+            if self.shape is None:
+                raise ValueError("Cell predicates need a KnowledgeBase created with a grid shape")
+            cells = np.zeros(self.shape, dtype=bool)
+            self._grid[predicate] = cells
+        return cells
+    
+    def grid_facts(self, predicate: str) -> np.ndarray:
+        """(height, width) bool array of the cells where predicate is known (read-only)."""
+        cells = self._grid.get(predicate)
+        return cells if cells is not None else np.zeros(self.shape, dtype=bool)
+    
+    def _atom(self, proposition, row: Optional[int] = None, col: Optional[int] = None):
+        """
+        Intern a proposition: (predicate, row, col) for a grid fact, else the string.
+        
+        Strings like "free_3_4" or "Free(3,4)" are grid facts when the cell
+        is on the grid; the result is cached per string.
+        """
+        if row is not None:
+            if self.shape is None or not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]):
+                raise IndexError(f"Cell ({row}, {col}) is not on the knowledge base grid")
+            return proposition, row, col
+        if not isinstance(proposition, str):
+            return self._atom(*proposition)
+        
+        atom = self._atoms.get(proposition)
+        if atom is None:
+            atom = proposition
+            match = self.shape is not None and (_UNDERSCORE_ATOM.match(proposition) or
+                                                _CALL_ATOM.match(proposition))
+            if match:
+                predicate, r, c = match.group(1), int(match.group(2)), int(match.group(3))
+                if r < self.shape[0] and c < self.shape[1]:
+                    atom = (predicate, r, c)
+            self._atoms[proposition] = atom
+        return atom
+    
+    def _known(self, atom) -> bool:
+        if isinstance(atom, tuple):
+            cells = self._grid.get(atom[0])
+            return cells is not None and bool(cells[atom[1], atom[2]])
+        return atom in self.facts
+    
+    def _add(self, atom):
+        """Record a fact known to be new."""
+        if isinstance(atom, tuple):
+            self.declare(atom[0])[atom[1], atom[2]] = True
+            self._grid_count += 1
+        else:
+            self.facts.add(atom)
+    
+    def _dependents(self, atom):
+        """Indices of the rules with atom among their premises."""
+        if isinstance(atom, tuple):
+            by_cell = self._grid_rules.get(atom[0])
+            if by_cell is None:
+                return ()
+            return by_cell.get(atom[1] * self.shape[1] + atom[2], ())
+        return self._rules_by_premise.get(atom, ())
+    
+    # ------------------------------------------------------------------
+    # Facts and rules
+    # ------------------------------------------------------------------
+    
+    def tell(self, fact, row: Optional[int] = None, col: Optional[int] = None) -> int:
         """
         Add a fact to the knowledge base.
         
+        Only the rules that mention the fact are checked; the ones it
+        completes fire, and their conclusions cascade the same way.
+        
         Args:
-            fact: A proposition like "Safe(2,3)" or "Explored(5,6)"
+            fact: A proposition like "Safe(2,3)" or "Explored(5,6)", or a
+                  cell predicate name like 'free' together with row and col
+            row: Row of a cell fact
+            col: Column of a cell fact
+        
+        Returns:
+            Number of rules fired by this fact (also in self.last_fired)
         
         Example:
             >>> kb = KnowledgeBase()
             >>> kb.tell("Safe(2,3)")
             >>> kb.tell("Free(2,3)")
         """
-        # TODO: Implement
-        self.facts.add(fact)
-        print(f"Added fact: {fact}")
+        if row is not None:
+            # Fast path: no parsing, no atom unless a rule needs it
+            cells = self._grid.get(fact)
+            if cells is None:
+                cells = self.declare(fact)
+            if not (0 <= row < cells.shape[0] and 0 <= col < cells.shape[1]):
+                raise IndexError(f"Cell ({row}, {col}) is not on the knowledge base grid")
+            if self.verbose:
+                print(f"Added fact: {fact}({row},{col})")
+            if cells[row, col]:
+                self.last_fired = 0
+                return 0
+            cells[row, col] = True
+            self._grid_count += 1
+            self.tells += 1
+            by_cell = self._grid_rules.get(fact)
+            if by_cell is None or row * cells.shape[1] + col not in by_cell:
+                self.last_fired = 0
+                return 0
+            self.last_fired = self._propagate(deque([(fact, row, col)]))
+            return self.last_fired
+        
+        if self.verbose:
+            print(f"Added fact: {fact}")
+        atom = self._atom(fact)
+        if self._known(atom):
+            self.last_fired = 0
+            return 0
+        self._add(atom)
+        self.tells += 1
+        self.last_fired = self._propagate(deque([atom]))
+        return self.last_fired
     
-    def add_rule(self, premises: List[str], conclusion: str):
+    def add_rule(self, premises: List, conclusion):
         """
         Add an inference rule.
         
+        With a grid shape, a rule whose atoms use variables (capitalized
+        arguments like X) becomes a RuleTemplate, applied to every cell.
+        
         Args:
-            premises: List of propositions that must all be true
+            premises: List of propositions that must all be true (strings
+                      or (predicate, row, col) cell facts)
             conclusion: Proposition that follows from premises
         
         Example:
             >>> kb.add_rule(["Safe(X)", "Free(X)"], "CanMove(X)")
             This means: If Safe(X) AND Free(X) then CanMove(X)
         """
-        # TODO: Implement
+        if self.shape is not None and any(_parse_template_atom(atom) is not None
+                                          for atom in list(premises) + [conclusion]):
+            template = RuleTemplate(self, list(premises), conclusion)
+            self.templates.append(template)
+            self._templates_seen = -1
+            self._templates_by_conclusion[template.predicate].append(template)
+            if self.verbose:
+                print(f"Added rule template: {template}")
+            return
+        
+        index = len(self.rules)
         self.rules.append((premises, conclusion))
-        print(f"Added rule: {' AND '.join(premises)} → {conclusion}")
+        distinct = {self._atom(premise) for premise in premises}
+        for premise in distinct:
+            if isinstance(premise, tuple):
+                predicate, row, col = premise
+                by_cell = self._grid_rules.setdefault(predicate, {})
+                by_cell.setdefault(row * self.shape[1] + col, []).append(index)
+            else:
+                self._rules_by_premise[premise].append(index)
+        self._premises.append(tuple(distinct))
+        self._conclusions.append(self._atom(conclusion))
+        self._rules_by_conclusion[self._conclusions[index]].append(index)
+        remaining = sum(1 for premise in distinct if not self._known(premise))
+        self._remaining.append(remaining)
+        if remaining == 0:
+            # Already satisfied: fired by the next infer()
+            self._pending.append(index)
+        if self.verbose:
+            print(f"Added rule: {' AND '.join(map(str, premises))} → {conclusion}")
     
-    def ask(self, query: str) -> bool:
+    def ask(self, query, row: Optional[int] = None, col: Optional[int] = None,
+            backward: bool = False) -> bool:
         """
         Check if a query can be inferred from the knowledge base.
         
+        By default only known facts count, so rules added after their
+        premises and rule templates need an infer() first. With backward
+        chaining the query is proved from the rules concluding it instead,
+        touching only the goals it depends on (see _solve()).
+        
         Args:
-            query: A proposition to check
+            query: A proposition to check, or a cell predicate name
+                   together with row and col
+            row: Row of a cell query
+            col: Column of a cell query
+            backward: Prove the query by backward chaining
         
         Returns:
             True if query is known or can be inferred, False otherwise
         
+        Raises:
+            IndexError: If row and col are not on the grid (as in tell())
+        
         Example:
             >>> kb.ask("Safe(2,3)")
             True
+            >>> kb.ask('free', 3, 4)
+            False
+            >>> kb.ask("CanMove(2,3)", backward=True)
+            True
         """
-        # TODO: Implement proper inference
-        # For now, just check if it's in facts
-        return query in self.facts
+        if row is not None:
+            if self.shape is None or not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]):
+                raise IndexError(f"Cell ({row}, {col}) is not on the knowledge base grid")
+            cells = self._grid.get(query)
+            if cells is not None and cells[row, col]:
+                return True
+            return backward and self._prove(self._atom(query, row, col))
+        atom = self._atom(query)
+        if self._known(atom):
+            return True
+        return backward and self._prove(atom)
+    
+    def _prove(self, goal) -> bool:
+        """Backward chaining entry point: refresh the memo, then solve goal."""
+        version = self.tells + len(self.rules) + len(self.templates)
+        if version != self._memo_version:
+            self._disproved = set()
+            self._memo_version = version
+        self._low = 0
+        return self._solve(goal, {})
     
-    def infer(self):
+    def _solve(self, goal, in_progress: dict) -> bool:
+        """
+        Prove goal from known facts and the rules that conclude it.
+        
+        A goal met again while it is being proved fails on that branch
+        (cycle). Failures that relied on such an unfinished goal further
+        up are not memoized, since that goal may still turn out true.
+        
+        A cell goal is also proved by any template concluding its
+        predicate, from the template's premises at that cell (see
+        _solve_template()); the templates are not run over the grid.
+        Proofs recurse once per goal on the path, so very long chains
+        (e.g. reachability across a large grid) are better left to infer().
+        
+        Args:
+            goal: Interned atom
+            in_progress: Goals on the current proof path -> their depth
+        """
+        if self._known(goal) or goal in self._proved:
+            return True
+        if goal in self._disproved:
+            return False
+        if goal in in_progress:
+            self._low = min(self._low, in_progress[goal])
+            return False
+        self.goals_explored += 1
+        depth = len(in_progress)
+        in_progress[goal] = depth
+        outer_low, self._low = self._low, depth
+        proved = any(all(self._solve(premise, in_progress) for premise in self._premises[index])
+                     for index in self._rules_by_conclusion.get(goal, ()))
+        if not proved and isinstance(goal, tuple):
+            proved = any(self._solve_template(template, goal[1], goal[2], in_progress)
+                         for template in self._templates_by_conclusion.get(goal[0], ()))
+        del in_progress[goal]
+        if proved:
+            self._proved.add(goal)
+        elif self._low >= depth:
+            self._disproved.add(goal)
+        self._low = min(outer_low, self._low)
+        return proved
+    
+    def _solve_template(self, template: RuleTemplate, row: int, col: int, in_progress: dict) -> bool:
+        """
+        Prove a template's conclusion at one cell from its premises there.
+        
+        The head variable is bound to (row, col), each related variable to
+        the cells the relation's offsets reach from its parent, and every
+        unary premise is a goal of its own. Variables not connected to the
+        head only need to be satisfiable at some cell.
+        """
+        if not all(self._solve(gate, in_progress) for gate in template.gates):
+            return False
+        if not self._satisfies(template.plan, row, col, in_progress):
+            return False
+        height, width = self.shape
+        return all(template._mask(condition).any()
+                   or any(self._satisfies(condition, r, c, in_progress)
+                          for r in range(height) for c in range(width))
+                   for condition in template.conditions)
+    
+    def _satisfies(self, plan, row: int, col: int, in_progress: dict) -> bool:
+        """Prove a template variable's subtree of premises with the variable at (row, col)."""
+        grids, children = plan
+        if not all(self._solve((predicate, row, col), in_progress) for predicate, _ in grids):
+            return False
+        height, width = self.shape
+        return all(any(0 <= row + dr < height and 0 <= col + dc < width
+                       and self._satisfies(child, row + dr, col + dc, in_progress)
+                       for dr, dc in offsets)
+                   for child, offsets in children)
+    
+    def infer(self) -> int:
         """
         Apply forward chaining to derive new facts from rules.
         
-        Forward chaining:
-            1. For each rule: check if all premises are satisfied
-            2. If yes, add conclusion to facts
-            3. Repeat until no new facts can be derived
+        Forward chaining (counter-based, linear in the size of the KB):
+            1. Every rule counts the premises it still waits for
+            2. Each new fact is taken from an agenda once and decrements
+               the counters of the rules it appears in
+            3. A rule whose counter reaches zero fires: its conclusion,
+               if new, is added to facts and to the agenda
+            4. Stop when the agenda is empty
+        
+        Facts added by tell() are propagated immediately, so this only
+        fires rules added after their premises were known. Rule templates
+        are applied here, one vectorized pass over the grid per template
+        and round, until a round derives nothing; each derived cell fact
+        counts as one fired rule. Returns at once when nothing changed.
         
         Example:
             >>> kb.tell("Safe(2,3)")
@@ -87,26 +597,95 @@ class KnowledgeBase:
             >>> kb.infer()
             >>> kb.ask("CanMove(2,3)")
             True
+        
+        Returns:
+            Number of rules fired
         """
-        changed = True
-
-        # Keep looping until no new facts are added
-        while changed:
-            changed = False
-
-            # Check all rules
-            for premises, conclusion in self.rules:
-                # If all premises are known
-                if all(p in self.facts for p in premises):
-                    # And the conclusion is new
-                    if conclusion not in self.facts:
-                        self.facts.add(conclusion)
-                        print(f"Inferred new fact: {conclusion}")
-                        changed = True
+        fired = 0
+        if self._pending:
+            agenda = deque()
+            fired = len(self._pending)
+            while self._pending:
+                self._conclude(self._pending.popleft(), agenda)
+            self.rules_fired += fired
+            fired += self._propagate(agenda)
+        
+        if self.templates and len(self) != self._templates_seen:
+            derived = True
+            while derived:
+                derived = False
+                for template in self.templates:
+                    count = self._apply_template(template)
+                    if count:
+                        fired += count
+                        derived = True
+            self._templates_seen = len(self)
+        return fired
+    
+    def _apply_template(self, template: RuleTemplate) -> int:
+        """
+        Add the cell facts a template derives now, and propagate them
+        through the ground rules that mention them.
+        
+        Returns:
+            Number of rules fired (template cells plus ground rules)
+        """
+        new = template.evaluate(self)
+        count = int(np.count_nonzero(new))
+        if count == 0:
+            return 0
+        template.target |= new
+        self._grid_count += count
+        self.rules_fired += count
+        if self.verbose:
+            print(f"Inferred {count} new facts: {template.conclusion}")
+        
+        by_cell = self._grid_rules.get(template.predicate)
+        if not by_cell:
+            return count
+        width = self.shape[1]
+        flat = new.ravel()
+        if len(by_cell) < count:
+            cells = [index for index in by_cell if flat[index]]
+        else:
+            cells = [index for index in np.flatnonzero(flat).tolist() if index in by_cell]
+        agenda = deque((template.predicate, index // width, index % width) for index in cells)
+        return count + self._propagate(agenda)
+    
+    def _propagate(self, agenda: deque) -> int:
+        """
+        Fire every rule completed by the agenda's facts, cascading.
+        
+        Args:
+            agenda: Interned facts just added (conclusions are appended)
+        
+        Returns:
+            Number of rules fired
+        """
+        fired = 0
+        remaining = self._remaining
+        while agenda:
+            fact = agenda.popleft()
+            for index in self._dependents(fact):
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    fired += 1
+                    self._conclude(index, agenda)
+        self.rules_fired += fired
+        return fired
+    
+    def _conclude(self, index: int, agenda: deque):
+        """All premises of rule `index` hold: add its conclusion if it is new."""
+        conclusion = self._conclusions[index]
+        if not self._known(conclusion):
+            self._add(conclusion)
+            if self.verbose:
+                print(f"Inferred new fact: {self.rules[index][1]}")
+            agenda.append(conclusion)
     
     def __str__(self) -> str:
         """String representation of KB."""
-        return f"KB with {len(self.facts)} facts and {len(self.rules)} rules"
+        return f"KB with {len(self)} facts and {len(self.rules) + len(self.templates)} rules"
 
 
 # ============================================================================
@@ -0,0 +1,228 @@
+"""
+Landmark Heuristic (ALT) - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+ALT = A*, Landmarks and the Triangle inequality. A few landmark cells are
+chosen once per map and the exact distance from each of them to every
+cell is stored. For any landmark L the triangle inequality gives
+
+    d(n, goal) >= |d(L, n) - d(L, goal)|
+
+so the largest of these bounds is an admissible (and consistent)
+heuristic. On maze-like maps it is far tighter than Manhattan distance,
+which ignores walls.
+
+Distances are counted in steps; on maps with terrain the bounds are
+multiplied by the cheapest move cost, which keeps them admissible.
+"""
+
+from typing import Tuple, List, Optional
+from array import array
+import hashlib
+
+import numpy as np
+
+from environment import OBSTACLE
+from ai_core.search_algorithms import wavefront
+
+
+# Number of goals whose bound maps are kept by heuristic()
+GOAL_CACHE_SIZE = 16
+
+class LandmarkHeuristic:
+    """
+    Landmark distance tables for one GridWorld, reusable across queries.
+
+    Distances are stored as uint16 (uint32 on maps with paths longer than
+    65534 steps), one row per landmark, with the dtype's maximum marking
+    cells a landmark cannot reach. The bounds for a goal are evaluated for
+    every cell at once and cached, so A* only does a lookup per node.
+
+    The tables stay admissible when obstacles are added (distances can
+    only grow), but not when cells are freed or a new map is loaded -
+    call rebuild() then.
+    """
+
+    def __init__(self, env, num_landmarks: int = 8,
+                 landmarks: Optional[List[Tuple[int, int]]] = None):
+        """
+        Select the landmarks and compute their distance tables.
+
+        Args:
+            env: GridWorld environment
+            num_landmarks: How many landmarks to select
+            landmarks: Explicit landmark cells instead of automatic selection
+        """
+        self.env = env
+        self.num_landmarks = num_landmarks
+        self.landmarks: List[Tuple[int, int]] = []
+        self.distances = None    # (num_landmarks, height * width) uint16/uint32
+        self._goal_cache = {}    # goal -> flat array('d') of bounds
+        self.rebuild(landmarks)
+
+    def rebuild(self, landmarks: Optional[List[Tuple[int, int]]] = None):
+        """Recompute the distance tables for the current grid."""
+        if landmarks is None:
+            landmarks, rows = self._select_landmarks(self.num_landmarks)
+        else:
+            rows = [wavefront(self.env, landmark)[0].ravel() for landmark in landmarks]
+        self.landmarks = [tuple(landmark) for landmark in landmarks]
+        self.distances = self._pack(rows)
+        self.version = self.env.version      # Grid version the tables match
+        self._grid_hash = self._hash_grid(self.env)
+        self._goal_cache.clear()
+
+    def _select_landmarks(self, count: int):
+        """
+        Farthest-point selection in the largest open region: the first
+        landmark is the cell farthest from an arbitrary seed, each next one
+        the cell farthest from all landmarks chosen so far. Landmarks on
+        the edge of the map give the tightest bounds.
+
+        Returns:
+            landmarks: Selected cells
+            rows: Flat int32 distance array of each landmark (-1 = unreached)
+        """
+        labels = self.env.component_labels().ravel()
+        if not (labels >= 0).any():
+            return [], []
+        largest = np.bincount(labels[labels >= 0]).argmax()
+        seed = divmod(int(np.flatnonzero(labels == largest)[0]), self.env.width)
+
+        # Steps from each cell to the nearest landmark (-1 outside the region)
+        nearest = wavefront(self.env, seed)[0].ravel().astype(np.int64)
+        landmarks, rows = [], []
+        for _ in range(count):
+            candidate = int(np.argmax(nearest))
+            if landmarks and nearest[candidate] <= 0:
+                break    # Every cell of the region is a landmark already
+            landmark = divmod(candidate, self.env.width)
+            dist = wavefront(self.env, landmark)[0].ravel()
+            nearest = dist.astype(np.int64) if not landmarks else np.minimum(nearest, dist)
+            landmarks.append(landmark)
+            rows.append(dist)
+        return landmarks, rows
+
+    def _pack(self, rows) -> np.ndarray:
+        """Store int32 distance rows (-1 = unreached) in the smallest fitting dtype."""
+        n = self.env.height * self.env.width
+        if not rows:
+            return np.zeros((0, n), dtype=np.uint16)
+        stacked = np.stack(rows)
+        dtype = np.uint16 if stacked.max() < np.iinfo(np.uint16).max else np.uint32
+        packed = stacked.astype(dtype)
+        packed[stacked < 0] = np.iinfo(dtype).max
+        return packed
+
+    @staticmethod
+    def _hash_grid(env) -> str:
+        """Fingerprint of the obstacle layout the tables were computed for."""
+        return hashlib.sha1(np.ascontiguousarray(env.grid == OBSTACLE).tobytes()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Bounds
+    # ------------------------------------------------------------------
+
+    def heuristic_map(self, goal: Tuple[int, int]) -> np.ndarray:
+        """
+        Lower bound on the distance to goal for every cell, vectorized.
+
+        Returns:
+            (height, width) float64 array: the max over landmarks of
+            |d(L, n) - d(L, goal)|, and never below the Manhattan distance,
+            times GridWorld.min_cost()
+        """
+        height, width = self.env.height, self.env.width
+        unreached = np.iinfo(self.distances.dtype).max
+        goal_index = goal[0] * width + goal[1]
+
+        rows, cols = np.divmod(np.arange(height * width), width)
+        bound = (np.abs(rows - goal[0]) + np.abs(cols - goal[1])).astype(np.int64)
+        for row in self.distances:
+            if row[goal_index] == unreached:
+                continue
+            # Cells the landmark cannot reach are not in the goal's region;
+            # they keep the Manhattan bound
+            diff = np.abs(row.astype(np.int64) - int(row[goal_index]))
+            diff[row == unreached] = 0
+            np.maximum(bound, diff, out=bound)
+        return (bound * self.env.min_cost()).reshape(height, width)
+
+    def heuristic(self, goal: Tuple[int, int]):
+        """
+        Get h(pos) for one goal, for use inside a search.
+
+        The bounds for the goal are computed once (heuristic_map()) and
+        cached, so each call is a single array lookup.
+
+        Returns:
+            Function (row, col) -> float lower bound on the distance to goal
+        """
+        flat = self.flat_bounds(goal)
+        width = self.env.width
+        return lambda pos: flat[pos[0] * width + pos[1]]
+
+    def flat_bounds(self, goal: Tuple[int, int]) -> array:
+        """Bounds for goal as a flat array('d') indexed by row * width + col."""
+        flat = self._goal_cache.get(goal)
+        if flat is None:
+            if len(self._goal_cache) >= GOAL_CACHE_SIZE:
+                self._goal_cache.pop(next(iter(self._goal_cache)))
+            flat = array('d', self.heuristic_map(goal).tobytes())
+            self._goal_cache[goal] = flat
+        return flat
+
+    def bound(self, pos: Tuple[int, int], goal: Tuple[int, int]) -> float:
+        """Lower bound on the distance from pos to goal, without caching a map."""
+        width = self.env.width
+        unreached = np.iinfo(self.distances.dtype).max
+        column = self.distances[:, [pos[0] * width + pos[1], goal[0] * width + goal[1]]].astype(np.int64)
+        valid = (column != unreached).all(axis=1)
+        best = abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
+        if valid.any():
+            best = max(best, int(np.abs(column[valid, 0] - column[valid, 1]).max()))
+        return best * self.env.min_cost()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str):
+        """Save the landmarks and distance tables to a .npz file."""
+        np.savez_compressed(path,
+                            landmarks=np.array(self.landmarks, dtype=np.int64).reshape(-1, 2),
+                            distances=self.distances,
+                            shape=np.array([self.env.height, self.env.width]),
+                            grid_hash=np.array(self._grid_hash))
+
+    @classmethod
+    def load(cls, path: str, env) -> 'LandmarkHeuristic':
+        """
+        Load tables saved with save() for the same map.
+
+        Raises:
+            ValueError: If the file was computed for a different grid
+        """
+        with np.load(path) as data:
+            if tuple(data['shape']) != (env.height, env.width) or \
+                    str(data['grid_hash']) != cls._hash_grid(env):
+                raise ValueError(f"Landmark file {path} does not match this grid")
+            return cls.from_tables(env, data['landmarks'], data['distances'])
+
+    @classmethod
+    def from_tables(cls, env, landmarks, distances: np.ndarray) -> 'LandmarkHeuristic':
+        """
+        Wrap existing distance tables (as in self.distances) without recomputing them.
+
+        The tables are used as given, not copied, so they can live in a
+        file or in shared memory. The caller guarantees they match env.
+        """
+        instance = cls.__new__(cls)
+        instance.env = env
+        instance.landmarks = [tuple(int(v) for v in landmark) for landmark in landmarks]
+        instance.num_landmarks = len(instance.landmarks)
+        instance.distances = distances
+        instance.version = env.version
+        instance._grid_hash = cls._hash_grid(env)
+        instance._goal_cache = {}
+        return instance
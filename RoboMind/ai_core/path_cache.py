@@ -0,0 +1,107 @@
+"""
+Path Cache - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+A bounded LRU cache of search results for one GridWorld, each stored
+with the extra statistics its search reported. Entries are
+keyed by (start, goal, algorithm, heuristic) and belong to one version of
+the grid: as soon as GridWorld.version changes (add_obstacle(),
+load_map(), ...) every cached path is dropped.
+"""
+
+from typing import Tuple, List, Optional
+from collections import OrderedDict
+
+
+class PathCache:
+    """
+    Least-recently-used cache of (path, cost, expanded) search results.
+    """
+
+    def __init__(self, env, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            env: GridWorld environment whose searches are cached
+            maxsize: Maximum number of cached results
+        """
+        self.env = env
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._version = env.version
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, start: Tuple[int, int], goal: Tuple[int, int],
+            algorithm: str, heuristic: Optional[str] = None,
+            stats: Optional[dict] = None) -> Optional[Tuple[Optional[List], float, int]]:
+        """
+        Look up a cached search result.
+
+        Args:
+            stats: Optional dict, filled on a hit with the statistics stored
+                   alongside the result
+
+        Returns:
+            (path, cost, expanded) as returned by the original search, or
+            None on a miss. The path is a fresh list the caller may modify.
+        """
+        self._check_version()
+        key = (start, goal, algorithm, heuristic)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        path, cost, expanded, entry_stats = entry
+        if stats is not None:
+            stats.update(entry_stats)
+        return (list(path) if path is not None else None), cost, expanded
+
+    def put(self, start: Tuple[int, int], goal: Tuple[int, int],
+            algorithm: str, heuristic: Optional[str],
+            result: Tuple[Optional[List], float, int], stats: Optional[dict] = None):
+        """Store a search result and its statistics, evicting the least recently used one if full."""
+        self._check_version()
+        path, cost, expanded = result
+        key = (start, goal, algorithm, heuristic)
+        self._entries[key] = (tuple(path) if path is not None else None, cost, expanded,
+                              dict(stats) if stats else {})
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self):
+        """Invalidate all entries if the grid changed since they were stored."""
+        if self.env.version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = self.env.version
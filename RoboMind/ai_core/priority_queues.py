@@ -0,0 +1,196 @@
+"""
+Priority Queues (Open Lists) - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Interchangeable open lists for UCS and A*. All of them share one small
+interface:
+
+    push(item, priority)  insert item, or lower its priority if it is queued
+    pop()                 remove and return (priority, item) with the lowest priority
+    len(queue)            number of entries held
+    queue.peak            largest number of entries held at any time
+
+Only 'heap' can return an item a second time (an outdated entry); the
+searches already skip items they have closed.
+
+Available kinds (see make_open_list()):
+    'heap'     binary heap with lazy deletion - old entries stay in the heap
+               and are skipped when popped (the classic heapq approach)
+    'bucket'   bucket queue (Dial's algorithm) - O(1) push/pop, integer
+               priorities only (e.g. unit move costs + Manhattan heuristic)
+    'indexed'  indexed binary heap with a real decrease-key - one entry per
+               item, any float priority
+"""
+
+from typing import Any, Tuple
+import heapq
+
+
+class HeapQueue:
+    """
+    Binary heap with lazy deletion.
+
+    Lowering an item's priority pushes a second entry; the outdated one
+    stays in the heap and is popped later as a duplicate, which the
+    searches skip because the item is already closed.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self.peak = 0
+
+    def push(self, item: Any, priority: float):
+        heapq.heappush(self._heap, (priority, item))
+        if len(self._heap) > self.peak:
+            self.peak = len(self._heap)
+
+    def pop(self) -> Tuple[float, Any]:
+        return heapq.heappop(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketQueue:
+    """
+    Bucket queue (Dial's algorithm) for integer priorities.
+
+    One bucket per priority value; pop() scans forward from the lowest
+    non-empty bucket. Ties pop last-in first-out, which favors the deepest
+    node in A*.
+    """
+
+    def __init__(self):
+        self._buckets = {}       # priority -> {item: None} (insertion ordered)
+        self._where = {}         # item -> priority
+        self._cursor = None      # Lowest possibly non-empty bucket
+        self.peak = 0
+
+    def push(self, item: Any, priority: float):
+        key = int(priority)
+        if key != priority:
+            raise ValueError(f"BucketQueue needs integer priorities, got {priority}")
+
+        old = self._where.get(item)
+        if old is not None:
+            if old <= key:
+                return
+            bucket = self._buckets[old]
+            del bucket[item]
+            if not bucket:
+                del self._buckets[old]
+
+        self._buckets.setdefault(key, {})[item] = None
+        self._where[item] = key
+        if self._cursor is None or key < self._cursor:
+            self._cursor = key
+        if len(self._where) > self.peak:
+            self.peak = len(self._where)
+
+    def pop(self) -> Tuple[float, Any]:
+        if not self._where:
+            raise IndexError("pop from an empty BucketQueue")
+        while self._cursor not in self._buckets:
+            self._cursor += 1
+        key = self._cursor
+        bucket = self._buckets[key]
+        item, _ = bucket.popitem()
+        if not bucket:
+            del self._buckets[key]
+        del self._where[item]
+        return key, item
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+
+class IndexedHeap:
+    """
+    Binary heap with a position index per item, supporting decrease-key.
+
+    Ties are broken by the item itself, like the (priority, item) tuples
+    of HeapQueue.
+    """
+
+    def __init__(self):
+        self._heap = []          # [(priority, item), ...]
+        self._index = {}         # item -> position in self._heap
+        self.peak = 0
+
+    def push(self, item: Any, priority: float):
+        position = self._index.get(item)
+        if position is None:
+            self._heap.append((priority, item))
+            position = len(self._heap) - 1
+            self._index[item] = position
+            if len(self._heap) > self.peak:
+                self.peak = len(self._heap)
+        elif priority < self._heap[position][0]:
+            self._heap[position] = (priority, item)
+        else:
+            return
+        self._sift_up(position)
+
+    def pop(self) -> Tuple[float, Any]:
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        del self._index[top[1]]
+        if heap:
+            heap[0] = last
+            self._index[last[1]] = 0
+            self._sift_down(0)
+        return top
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _sift_up(self, position: int):
+        heap, index = self._heap, self._index
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[position] = heap[parent]
+            index[heap[position][1]] = position
+            position = parent
+        heap[position] = entry
+        index[entry[1]] = position
+
+    def _sift_down(self, position: int):
+        heap, index = self._heap, self._index
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[position] = heap[child]
+            index[heap[position][1]] = position
+            position = child
+        heap[position] = entry
+        index[entry[1]] = position
+
+
+OPEN_LISTS = {
+    'heap': HeapQueue,
+    'bucket': BucketQueue,
+    'indexed': IndexedHeap,
+}
+
+
+def make_open_list(kind: str = 'heap'):
+    """
+    Create an empty open list.
+
+    Args:
+        kind: 'heap', 'bucket' or 'indexed' (see module docstring)
+    """
+    if kind not in OPEN_LISTS:
+        raise ValueError(f"Unknown open list: {kind}")
+    return OPEN_LISTS[kind]()
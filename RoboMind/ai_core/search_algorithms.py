@@ -2,33 +2,112 @@
 Search Algorithms - RoboMind Project
 SE444 - Artificial Intelligence Course Project
 
-TODO: Implement the following search algorithms:
-1. Breadth-First Search (BFS)
-2. Uniform Cost Search (UCS)
-3. A* Search
+Path search on a GridWorld. Every search takes (env, start, goal) and
+returns (path, cost, expanded): the path from start to goal (None if
+there is none), its cost (moving into a cell costs its terrain cost) and
+the number of nodes expanded.
+
+Uninformed and informed searches:
+    bfs, ucs                    - Breadth-first and uniform cost search
+    astar                       - A* (open list choice, instrumentation)
+    astar_array                 - A* on flat cell indices and arrays, for large maps
+    arastar                     - Anytime weighted A* with a deadline
+    idastar                     - Memory-bounded IDA* with a capped transposition table
+    jps                         - Jump Point Search (uniform-cost grids only)
+    bidirectional_bfs/_astar    - Searches from both ends
+    wavefront, wavefront_bfs    - Vectorized NumPy BFS distance transform
+
+Incremental replanning:
+    DStarLite                   - D* Lite, repairs its path after grid changes
+
+Heuristics for the informed searches come from make_heuristic().
 
 This is the CORE of Phase 1 (Week 1-2)
 """
 
 from typing import Tuple, List, Optional
 from collections import deque
+from array import array
 import heapq
+import math
+import sys
+import time
+import weakref
+
+import numpy as np
+
+from environment import OBSTACLE, UP, DOWN, LEFT, RIGHT, DIRECTIONS, DIRECTION_BITS
+from ai_core.priority_queues import make_open_list
+
 
-def bfs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[List], float, int]:
+def make_heuristic(env, goal: Tuple[int, int], heuristic='manhattan', landmarks=None):
+    """
+    Build h(pos) for a search towards goal.
+
+    Manhattan and Euclidean distances count steps; on maps with terrain
+    they are scaled by the cheapest move (GridWorld.min_cost()) so they
+    never overestimate. Landmark bounds are scaled by LandmarkHeuristic.
+
+    Args:
+        env: GridWorld environment
+        goal: Goal position (row, col)
+        heuristic: 'manhattan', 'euclidean' or 'alt' (landmark bounds)
+        landmarks: LandmarkHeuristic for the map, required for 'alt'
+
+    Returns:
+        Function (row, col) -> float lower bound on the cost to goal
+    """
+    scale = env.min_cost()
+    if heuristic == 'manhattan':
+        distance = env.manhattan_distance
+    elif heuristic == 'euclidean':
+        distance = env.euclidean_distance
+    elif heuristic == 'alt':
+        if landmarks is None:
+            raise ValueError("The 'alt' heuristic needs a LandmarkHeuristic (landmarks=...)")
+        return landmarks.heuristic(goal)
+    else:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    if scale == 1.0:
+        return lambda pos: distance(pos, goal)
+    return lambda pos: scale * distance(pos, goal)
+
+
+def bfs(env, start: Tuple[int, int], goal: Tuple[int, int],
+        instrument=None) -> Tuple[Optional[List], float, int]:
     """
     Breadth-First Search - Find shortest path in terms of number of steps.
+
+    Args:
+        instrument: Optional SearchInstrument (see ai_core.instrumentation)
     """
+    if instrument is not None:
+        instrument.start(env)
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        if instrument is not None:
+            instrument.finish()
+        return None, float("inf"), 0
+
     queue = deque([start])
     visited = {start}
     parent = {start: None}
     expanded = 0
+    if instrument is not None:
+        instrument.on_push(start, 1)
+        instrument.phase('search')
 
     while queue:
         current = queue.popleft()
         expanded += 1
+        if instrument is not None:
+            instrument.on_pop(current)
+            instrument.on_expand(current)
 
         # Check goal
         if current == goal:
+            if instrument is not None:
+                instrument.phase('reconstruct')
             path = []
 
             # Backtracking
@@ -41,6 +120,8 @@ def bfs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[Li
 
             # BFS cost = number of steps
             cost = len(path) - 1
+            if instrument is not None:
+                instrument.finish()
             return path, cost, expanded
 
         # Explore neighbors
@@ -49,194 +130,755 @@ def bfs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[Li
                 visited.add(neighbor)
                 parent[neighbor] = current
                 queue.append(neighbor)
+                if instrument is not None:
+                    instrument.on_push(neighbor, len(queue))
 
     # No path found
+    if instrument is not None:
+        instrument.finish()
     return None, float("inf"), expanded
 
 
-def ucs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[List], float, int]:
+def ucs(env, start: Tuple[int, int], goal: Tuple[int, int],
+        open_list='heap', stats: Optional[dict] = None,
+        instrument=None) -> Tuple[Optional[List], float, int]:
     """
     Uniform Cost Search - Find path with lowest total cost.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        open_list: Frontier implementation - 'heap', 'bucket' (integer
+                   costs only) or 'indexed' (see ai_core.priority_queues)
+        stats: Optional dict, filled with 'peak_open' (largest frontier size)
+        instrument: Optional SearchInstrument (see ai_core.instrumentation)
     """
-    # Priority queue: (cost, position)
-    frontier = [(0, start)]
+    if instrument is not None:
+        instrument.start(env)
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        if stats is not None:
+            stats['peak_open'] = 0
+        if instrument is not None:
+            instrument.finish()
+        return None, float("inf"), 0
+
+    # Priority queue: cost -> position
+    frontier = make_open_list(open_list)
+    frontier.push(start, 0)
     explored = set()
     cost_so_far = {start: 0}
     parent = {start: None}
     expanded = 0
+    costs, width = env.cost_table(), env.width
+    if instrument is not None:
+        instrument.on_push(start, len(frontier))
+        instrument.phase('search')
 
     while frontier:
-        current_cost, current = heapq.heappop(frontier)
+        _, current = frontier.pop()
+        if instrument is not None:
+            instrument.on_pop(current)
 
         if current in explored:
+            if instrument is not None:
+                instrument.on_stale_pop(current)
             continue
 
         explored.add(current)
+        current_cost = cost_so_far[current]
 
         # Check reached goal
         if current == goal:
+            if instrument is not None:
+                instrument.phase('reconstruct')
             path = []
             # Backtrack
             while current is not None:
                 path.append(current)
                 current = parent[current]
             path.reverse()
+            if stats is not None:
+                stats['peak_open'] = frontier.peak
+            if instrument is not None:
+                instrument.finish()
             return path, current_cost, expanded
 
         expanded += 1
+        if instrument is not None:
+            instrument.on_expand(current)
 
         # Explore neighbors
         for neighbor in env.get_neighbors(current):
-            new_cost = current_cost + env.get_cost(current, neighbor)
+            new_cost = current_cost + costs[neighbor[0] * width + neighbor[1]]
 
             if neighbor not in explored:
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
                     parent[neighbor] = current
-                    heapq.heappush(frontier, (new_cost, neighbor))
+                    frontier.push(neighbor, new_cost)
+                    if instrument is not None:
+                        instrument.on_push(neighbor, len(frontier))
+            elif instrument is not None and new_cost < cost_so_far[neighbor]:
+                instrument.on_reopen(neighbor)
 
     # Path not found
+    if stats is not None:
+        stats['peak_open'] = frontier.peak
+    if instrument is not None:
+        instrument.finish()
     return None, float("inf"), expanded
 
 
 
 def astar(env, start: Tuple[int, int], goal: Tuple[int, int], 
-          heuristic='manhattan') -> Tuple[Optional[List], float, int]:
+          heuristic='manhattan', open_list='heap',
+          stats: Optional[dict] = None, landmarks=None,
+          instrument=None) -> Tuple[Optional[List], float, int]:
+    """
+    A* Search - Find optimal path using cost + heuristic.
+    
+    Algorithm:
+        1. Like UCS but uses f(n) = g(n) + h(n)
+        2. g(n) = cost from start to n
+        3. h(n) = heuristic estimate from n to goal
+        4. Expands nodes in order of f(n) value
+    
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan', 'euclidean' or 'alt' (landmark bounds)
+        open_list: Frontier implementation - 'heap', 'bucket' (integer
+                   f-values only, e.g. Manhattan) or 'indexed'
+        stats: Optional dict, filled with 'peak_open' (largest frontier size)
+        landmarks: LandmarkHeuristic for the map, required for 'alt'
+        instrument: Optional SearchInstrument (see ai_core.instrumentation)
+    
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path)
+        cost: Total path cost (actual g(n), not f(n))
+        expanded: Number of nodes expanded
+    
+    Heuristics:
+        Manhattan: |x1-x2| + |y1-y2| (for 4-connected grid)
+        Euclidean: sqrt((x1-x2)² + (y1-y2)²)
+        (both times the cheapest terrain cost, see make_heuristic())
+        ALT: max over landmarks L of |d(L,n) - d(L,goal)| (see ai_core.landmarks)
+    
+    Properties:
+        - If h(n) is admissible (never overestimates), A* is optimal
+        - If h(n) is consistent (monotonic), A* is optimally efficient
+        - Manhattan distance is admissible for 4-connected grids
+    """
 
-    if heuristic == 'manhattan':
-        h = lambda pos: env.manhattan_distance(pos, goal)
-    elif heuristic == 'euclidean':
-        h = lambda pos: env.euclidean_distance(pos,goal)
+    if instrument is not None:
+        instrument.start(env)
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        if stats is not None:
+            stats['peak_open'] = 0
+        if instrument is not None:
+            instrument.finish()
+        return None, float('inf'), 0
+
+    h = make_heuristic(env, goal, heuristic, landmarks)
+    if instrument is not None:
+        h = instrument.count_heuristic(h)
     g_score = {start:0}
     f_score = {start:h(start)}
-    frontier = [ (f_score[start],start)]
+    frontier = make_open_list(open_list)
+    frontier.push(start, f_score[start])
     expanded = 0
     explored = set()
     parent = {start:None}
+    costs, width = env.cost_table(), env.width
+    if instrument is not None:
+        instrument.on_push(start, len(frontier))
+        instrument.phase('search')
     while frontier:
-        current_f,current = heapq.heappop(frontier)
+        current_f,current = frontier.pop()
+        if instrument is not None:
+            instrument.on_pop(current)
         if current in explored:
+            if instrument is not None:
+                instrument.on_stale_pop(current)
             continue
         explored.add(current)
         expanded +=1
+        if instrument is not None:
+            instrument.on_expand(current)
         if current == goal:
+            if instrument is not None:
+                instrument.phase('reconstruct')
             path = reconstruct_path(parent,start,goal)
+            if stats is not None:
+                stats['peak_open'] = frontier.peak
+            if instrument is not None:
+                instrument.finish()
             return path,g_score[current],expanded
         for neighbor in env.get_neighbors(current):
             if neighbor in explored:
+                if instrument is not None and \
+                        g_score[current] + costs[neighbor[0] * width + neighbor[1]] < g_score[neighbor]:
+                    instrument.on_reopen(neighbor)
                 continue
-            tentative_g = g_score[current] + env.get_cost(current,neighbor)
+            tentative_g = g_score[current] + costs[neighbor[0] * width + neighbor[1]]
             if neighbor not in g_score or tentative_g < g_score[neighbor]:
                 g_score[neighbor] = tentative_g
                 f_score[neighbor] = tentative_g + h(neighbor)
                 parent[neighbor] = current
-                heapq.heappush(frontier,(f_score[neighbor],neighbor))
+                frontier.push(neighbor, f_score[neighbor])
+                if instrument is not None:
+                    instrument.on_push(neighbor, len(frontier))
     
+    if stats is not None:
+        stats['peak_open'] = frontier.peak
+    if instrument is not None:
+        instrument.finish()
     return None,float('inf'),expanded
 
-           
-             
 
-          
+def arastar(env, start: Tuple[int, int], goal: Tuple[int, int],
+            heuristic='manhattan', deadline: Optional[float] = None,
+            max_expansions: Optional[int] = None,
+            initial_weight: float = 3.0, weight_step: float = 0.5,
+            stats: Optional[dict] = None) -> Tuple[Optional[List], float, int]:
+    """
+    Anytime Repairing A* (ARA*) - a fast first path, improved until the budget runs out.
 
+    The first pass is weighted A* with f(n) = g(n) + w * h(n) and w =
+    initial_weight, which finds a path quickly. Each later pass lowers w by
+    weight_step and repairs the previous search instead of starting over:
+    only nodes whose g-value improved since they were expanded (the
+    "inconsistent" ones) are reopened. With w = 1 the path is optimal.
 
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan' or 'euclidean'
+        deadline: Time budget in seconds (None = no time limit)
+        max_expansions: Expansion budget over all passes (None = no limit)
+        initial_weight: Heuristic weight of the first pass (>= 1)
+        weight_step: Amount the weight is lowered after each pass
+        stats: Optional dict, filled with 'epsilon' (the path costs at most
+               epsilon times the optimum), 'solutions' (number of improved
+               paths found), 'weight' (weight of the last pass) and
+               'peak_open' (largest frontier size)
 
+    Returns:
+        path: Best path found within the budget (None if none was found)
+        cost: Total path cost
+        expanded: Number of nodes expanded over all passes
+    """
+    if stats is not None:
+        stats.update(epsilon=float('inf'), solutions=0, weight=initial_weight, peak_open=0)
+
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        return None, float('inf'), 0
+
+    if heuristic not in ('manhattan', 'euclidean'):
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    h = make_heuristic(env, goal, heuristic)
+    costs, width = env.cost_table(), env.width
+
+    stop_time = time.perf_counter() + deadline if deadline is not None else None
+    weight = max(1.0, initial_weight)
+
+    g_score = {start: 0.0}
+    parent = {start: None}
+    open_nodes = {start}      # Live members of the heap
+    closed = set()            # Expanded during the current pass
+    incons = set()            # Improved after being expanded this pass
+    frontier = [(weight * h(start), 0.0, start)]
+    expanded = 0
+    peak_open = 1
+
+    best_path, best_cost = None, float('inf')
+    epsilon = float('inf')
+    solutions = 0
+
+    while True:
+        # One weighted A* pass; stops once no open node can beat g(goal)
+        out_of_budget = False
+        while frontier:
+            f, g, current = frontier[0]
+            if current not in open_nodes or g != g_score[current]:
+                heapq.heappop(frontier)
+                continue
+            if f >= g_score.get(goal, math.inf):
+                break
+            if ((max_expansions is not None and expanded >= max_expansions) or
+                    (stop_time is not None and time.perf_counter() >= stop_time)):
+                out_of_budget = True
+                break
 
- 
+            heapq.heappop(frontier)
+            open_nodes.discard(current)
+            closed.add(current)
+            expanded += 1
 
+            for neighbor in env.get_neighbors(current):
+                tentative_g = g + costs[neighbor[0] * width + neighbor[1]]
+                if tentative_g < g_score.get(neighbor, math.inf):
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    if neighbor in closed:
+                        incons.add(neighbor)
+                    else:
+                        open_nodes.add(neighbor)
+                        heapq.heappush(frontier, (tentative_g + weight * h(neighbor), tentative_g, neighbor))
+            if len(frontier) > peak_open:
+                peak_open = len(frontier)
+
+        if goal in g_score and g_score[goal] < best_cost:
+            best_path = reconstruct_path(parent, start, goal)
+            best_cost = g_score[goal]
+            solutions += 1
+        if out_of_budget:
+            break
+
+        # The pass completed: bound the suboptimality of g(goal)
+        lower_bound = min((g_score[node] + h(node) for node in open_nodes | incons), default=best_cost)
+        epsilon = min(weight, best_cost / lower_bound) if lower_bound > 0 else 1.0
+        if epsilon <= 1.0 or weight <= 1.0:
+            epsilon = 1.0 if weight <= 1.0 else epsilon
+            break
 
+        # Next pass: lower the weight (a weight above the bound already
+        # achieved cannot improve the path), reopen inconsistent nodes and
+        # reuse everything else
+        weight = max(1.0, min(weight - weight_step, epsilon))
+        open_nodes |= incons
+        incons = set()
+        closed = set()
+        frontier = [(g_score[node] + weight * h(node), g_score[node], node) for node in open_nodes]
+        heapq.heapify(frontier)
 
+    if stats is not None:
+        stats.update(epsilon=epsilon, solutions=solutions, weight=weight, peak_open=peak_open)
+    return best_path, best_cost, expanded
+
+
+def bidirectional_bfs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[List], float, int]:
     """
-    A* Search - Find optimal path using cost + heuristic.
-    
-    Algorithm:
-        1. Like UCS but uses f(n) = g(n) + h(n)
-        2. g(n) = cost from start to n
-        3. h(n) = heuristic estimate from n to goal
-        4. Expands nodes in order of f(n) value
-    
+    Bidirectional Breadth-First Search - BFS from both ends, meeting in the middle.
+
+    Each round expands one whole BFS level of the smaller frontier. When a
+    level touches the other search, the rest of that level is still scanned
+    so the cheapest meeting cell is used, which keeps the result optimal.
+    Two discs of radius d/2 cover far fewer cells than one of radius d.
+
     Args:
         env: GridWorld environment
         start: Starting position (row, col)
         goal: Goal position (row, col)
-        heuristic: 'manhattan' or 'euclidean'
-    
+
     Returns:
         path: List of (row, col) tuples from start to goal (None if no path)
-        cost: Total path cost (actual g(n), not f(n))
-        expanded: Number of nodes expanded
-    
-    Heuristics:
-        Manhattan: |x1-x2| + |y1-y2| (for 4-connected grid)
-        Euclidean: sqrt((x1-x2)² + (y1-y2)²)
-    
-    Properties:
-        - If h(n) is admissible (never overestimates), A* is optimal
-        - If h(n) is consistent (monotonic), A* is optimally efficient
-        - Manhattan distance is admissible for 4-connected grids
+        cost: Number of steps
+        expanded: Number of nodes expanded by both searches
     """
-    
-    # TODO: Implement A*
-    #
-    # Hints:
-    # - Very similar to UCS, but priority is f(n) = g(n) + h(n)
-    # - Use env.manhattan_distance(pos, goal) or env.euclidean_distance(pos, goal)
-    # - Store g(n) separately (actual cost from start)
-    # - Priority queue contains f(n), but track g(n) for path cost
-    # - When reconstructing path, return actual g(goal), not f(goal)
-    
-    # Your code here:
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        return None, float("inf"), 0
 
+    if start == goal:
+        return [start], 0, 1
 
-    
-    raise NotImplementedError("A* not implemented yet - this is your task!")
-    
-    # Example structure (delete and implement properly):
+    parent_fwd, parent_bwd = {start: None}, {goal: None}
+    depth_fwd, depth_bwd = {start: 0}, {goal: 0}
+    frontier_fwd, frontier_bwd = [start], [goal]
+    expanded = 0
+
+    while frontier_fwd and frontier_bwd:
+        # Grow the cheaper side by one full level
+        if len(frontier_fwd) <= len(frontier_bwd):
+            frontier, parent, depth, other_depth = frontier_fwd, parent_fwd, depth_fwd, depth_bwd
+        else:
+            frontier, parent, depth, other_depth = frontier_bwd, parent_bwd, depth_bwd, depth_fwd
+
+        next_frontier = []
+        meeting = None
+        for current in frontier:
+            expanded += 1
+            next_depth = depth[current] + 1
+            for neighbor in env.get_neighbors(current):
+                if neighbor in depth:
+                    continue
+                depth[neighbor] = next_depth
+                parent[neighbor] = current
+                next_frontier.append(neighbor)
+                if neighbor in other_depth and (
+                        meeting is None or other_depth[neighbor] < other_depth[meeting]):
+                    meeting = neighbor
+
+        if meeting is not None:
+            path = reconstruct_path(parent_fwd, start, meeting)
+            node = parent_bwd[meeting]
+            while node is not None:
+                path.append(node)
+                node = parent_bwd[node]
+            return path, len(path) - 1, expanded
+
+        if frontier is frontier_fwd:
+            frontier_fwd = next_frontier
+        else:
+            frontier_bwd = next_frontier
+
+    # One side ran out: start and goal are not connected
+    return None, float("inf"), expanded
+
+
+def bidirectional_astar(env, start: Tuple[int, int], goal: Tuple[int, int],
+                        heuristic='manhattan') -> Tuple[Optional[List], float, int]:
+    """
+    Bidirectional A* - front-to-end A* from the start and from the goal.
+
+    The forward search estimates the distance to the goal, the backward
+    search the distance to the start. Whenever an edge connects the two
+    searches the best complete path cost (mu) is updated. The search stops
+    as soon as either open list has a smallest f(n) >= mu: every path still
+    unexplored on that side costs at least mu, so the best path is optimal.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan' or 'euclidean'
+
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path)
+        cost: Total path cost
+        expanded: Number of nodes expanded by both searches
     """
-    # Choose heuristic function
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        return None, float('inf'), 0
+
     if heuristic == 'manhattan':
-        h = lambda pos: env.manhattan_distance(pos, goal)
+        steps_between = env.manhattan_distance
     elif heuristic == 'euclidean':
-        h = lambda pos: env.euclidean_distance(pos, goal)
+        steps_between = env.euclidean_distance
     else:
         raise ValueError(f"Unknown heuristic: {heuristic}")
-    
-    # A* uses f(n) = g(n) + h(n) as priority
-    g_score = {start: 0}
-    f_score = {start: h(start)}
-    frontier = [(f_score[start], start)]  # (f_score, position)
-    explored = set()
-    parent = {start: None}
+    # Scaled by the cheapest move so it stays a lower bound on terrain
+    scale = env.min_cost()
+    distance = steps_between if scale == 1.0 else lambda a, b: scale * steps_between(a, b)
+    costs, width = env.cost_table(), env.width
+
+    # Per direction: g-scores, parents, closed set, open list, heuristic target
+    g_fwd, g_bwd = {start: 0}, {goal: 0}
+    parent_fwd, parent_bwd = {start: None}, {goal: None}
+    closed_fwd, closed_bwd = set(), set()
+    open_fwd = [(distance(start, goal), start)]
+    open_bwd = [(distance(goal, start), goal)]
+    best_cost = 0 if start == goal else float('inf')
+    meeting = start if start == goal else None
     expanded = 0
-    
-    while frontier:
+
+    while open_fwd and open_bwd:
+        # Drop stale entries so the heap tops are the true minimum f-values
+        while open_fwd and open_fwd[0][1] in closed_fwd:
+            heapq.heappop(open_fwd)
+        while open_bwd and open_bwd[0][1] in closed_bwd:
+            heapq.heappop(open_bwd)
+        if not open_fwd or not open_bwd:
+            break
+        if open_fwd[0][0] >= best_cost or open_bwd[0][0] >= best_cost:
+            break
+
+        if len(open_fwd) <= len(open_bwd):
+            g, other_g, parent, closed, frontier, target = g_fwd, g_bwd, parent_fwd, closed_fwd, open_fwd, goal
+            forward = True
+        else:
+            g, other_g, parent, closed, frontier, target = g_bwd, g_fwd, parent_bwd, closed_bwd, open_bwd, start
+            forward = False
+
         current_f, current = heapq.heappop(frontier)
-        
-        if current in explored:
-            continue
-        
-        explored.add(current)
+        closed.add(current)
         expanded += 1
-        
-        if current == goal:
-            # Reconstruct path and return ACTUAL cost (g_score), not f_score
-            # ... your code ...
-            return path, g_score[current], expanded
-        
+
         for neighbor in env.get_neighbors(current):
-            if neighbor in explored:
+            if neighbor in closed:
                 continue
-            
-            tentative_g = g_score[current] + env.get_cost(current, neighbor)
-            
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + h(neighbor)
+            # Backward edges run against the direction of travel: the
+            # move enters current, not neighbor
+            if forward:
+                step = costs[neighbor[0] * width + neighbor[1]]
+            else:
+                step = costs[current[0] * width + current[1]]
+            tentative_g = g[current] + step
+            if neighbor not in g or tentative_g < g[neighbor]:
+                g[neighbor] = tentative_g
                 parent[neighbor] = current
-                heapq.heappush(frontier, (f_score[neighbor], neighbor))
-    
-    return None, float('inf'), expanded
+                heapq.heappush(frontier, (tentative_g + distance(neighbor, target), neighbor))
+                if neighbor in other_g and tentative_g + other_g[neighbor] < best_cost:
+                    best_cost = tentative_g + other_g[neighbor]
+                    meeting = neighbor
+
+    if meeting is None:
+        return None, float('inf'), expanded
+
+    path = reconstruct_path(parent_fwd, start, meeting)
+    node = parent_bwd[meeting]
+    while node is not None:
+        path.append(node)
+        node = parent_bwd[node]
+    return path, best_cost, expanded
+
+
+# Index into DIRECTIONS of the opposite move (up <-> down, left <-> right)
+_OPPOSITE_DIRECTION = [1, 0, 3, 2]
+
+
+def wavefront(env, source: Tuple[int, int], blocked=None,
+              stop_at: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized BFS - advance the whole frontier one level per iteration.
+
+    The frontier is a NumPy array of flat cell indices. Each iteration
+    tests every frontier cell's passability bits at once, shifts the
+    indices by one step per direction and keeps the cells not reached yet,
+    so the Python loop runs once per BFS level instead of once per node.
+
+    Args:
+        env: GridWorld environment
+        source: Cell the distances are measured from (row, col)
+        blocked: Optional iterable of extra (row, col) cells to treat as obstacles
+        stop_at: Optional cell; stop after the level that reaches it
+
+    Returns:
+        dist: (height, width) int32 array of steps from source (-1 = not reached)
+        parent_dir: (height, width) int8 array; for a reached cell, the index
+                    into DIRECTIONS of the step back towards source (-1 for
+                    source and unreached cells)
     """
+    width = env.width
+    n = env.height * width
+    neighbor_mask = np.frombuffer(env.neighbor_mask(), dtype=np.uint8)
+    offsets = [dr * width + dc for dr, dc in DIRECTIONS]
+
+    dist = np.full(n, -1, dtype=np.int32)
+    parent_dir = np.full(n, -1, dtype=np.int8)
+    if blocked:
+        dist[[row * width + col for row, col in blocked]] = -2
+
+    source_index = source[0] * width + source[1]
+    stop_index = stop_at[0] * width + stop_at[1] if stop_at is not None else None
+    dist[source_index] = 0
+    frontier = np.array([source_index], dtype=np.intp)
+    level = 0
+
+    while frontier.size:
+        if stop_index is not None and dist[stop_index] >= 0:
+            break
+        level += 1
+        bits = neighbor_mask[frontier]
+        reached = []
+        for k, (bit, offset) in enumerate(zip(DIRECTION_BITS, offsets)):
+            candidates = frontier[(bits & bit) != 0] + offset
+            candidates = candidates[dist[candidates] == -1]
+            dist[candidates] = level
+            parent_dir[candidates] = _OPPOSITE_DIRECTION[k]
+            reached.append(candidates)
+        frontier = np.concatenate(reached)
+
+    dist[dist == -2] = -1
+    return dist.reshape(env.height, width), parent_dir.reshape(env.height, width)
+
+
+def wavefront_bfs(env, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[Optional[List], float, int]:
+    """
+    Breadth-First Search on top of wavefront(), with the same contract as bfs().
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path)
+        cost: Number of steps
+        expanded: Number of cells reached by the wavefront
+    """
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        return None, float("inf"), 0
+
+    dist, parent_dir = wavefront(env, start, stop_at=goal)
+    expanded = int(np.count_nonzero(dist >= 0))
+    if dist[goal] < 0:
+        return None, float("inf"), expanded
+
+    path = [goal]
+    row, col = goal
+    while (row, col) != start:
+        dr, dc = DIRECTIONS[parent_dir[row, col]]
+        row, col = row + dr, col + dc
+        path.append((row, col))
+    path.reverse()
+    return path, len(path) - 1, expanded
+
+
+class DStarLite:
+    """
+    D* Lite - incremental replanning towards a fixed goal.
+
+    The search runs backwards from the goal and keeps its g/rhs tables and
+    priority queue between calls. When cells become blocked (or free), only
+    the vertices whose distances actually change are re-expanded, so a
+    replan after a small change costs far less than a fresh astar().
+
+    Cells are traversable if they are passable in the grid and not
+    reported as blocked by the optional is_blocked callback (e.g. cells
+    the agent believes are obstacles). Grid changes made through
+    GridWorld.add_obstacle() are picked up automatically; changes in what
+    is_blocked reports must be passed to plan() as changed cells.
+    """
+
+    def __init__(self, env, goal: Tuple[int, int], is_blocked=None):
+        """
+        Initialize the planner.
+
+        Args:
+            env: GridWorld environment
+            goal: Goal position (row, col)
+            is_blocked: Optional callable pos -> bool for extra blocked cells
+        """
+        self.env = env
+        self.goal = goal
+        self.is_blocked = is_blocked
+
+        self.g = {}
+        self.rhs = {goal: 0.0}
+        self.km = 0.0
+        self._queue = []          # Heap of (key, cell), lazily deleted
+        self._queued = {}         # cell -> key of its live heap entry
+        self._last_start = None
+        self._version = env.version
+        self._scale = env.min_cost()   # Heuristic scale for terrain costs
+        self.expanded = 0         # Total expansions over all plan() calls
+
+    def _h(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
+        return self._scale * (abs(a[0] - b[0]) + abs(a[1] - b[1]))
+
+    def _traversable(self, pos: Tuple[int, int]) -> bool:
+        return self.env.is_valid(pos) and not (self.is_blocked and self.is_blocked(pos))
+
+    def _adjacent(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """In-bounds 4-neighbors, traversable or not."""
+        row, col = pos
+        return [(row + dr, col + dc) for dr, dc in DIRECTIONS
+                if 0 <= row + dr < self.env.height and 0 <= col + dc < self.env.width]
+
+    def _cost(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
+        if not (self._traversable(a) and self._traversable(b)):
+            return math.inf
+        return self.env.cost_table()[b[0] * self.env.width + b[1]]
+
+    def _key(self, pos: Tuple[int, int], start: Tuple[int, int]) -> Tuple[float, float]:
+        best = min(self.g.get(pos, math.inf), self.rhs.get(pos, math.inf))
+        return best + self._h(start, pos) + self.km, best
+
+    def _update_vertex(self, pos: Tuple[int, int], start: Tuple[int, int]):
+        if pos != self.goal:
+            self.rhs[pos] = min((self._cost(pos, nxt) + self.g.get(nxt, math.inf)
+                                 for nxt in self._adjacent(pos)), default=math.inf)
+        self._queued.pop(pos, None)
+        if self.g.get(pos, math.inf) != self.rhs.get(pos, math.inf):
+            key = self._key(pos, start)
+            self._queued[pos] = key
+            heapq.heappush(self._queue, (key, pos))
+
+    def _top_key(self) -> Tuple[float, float]:
+        while self._queue:
+            key, pos = self._queue[0]
+            if self._queued.get(pos) == key:
+                return key
+            heapq.heappop(self._queue)
+        return math.inf, math.inf
+
+    def _compute_shortest_path(self, start: Tuple[int, int]) -> int:
+        expanded = 0
+        while (self._top_key() < self._key(start, start) or
+               self.rhs.get(start, math.inf) != self.g.get(start, math.inf)):
+            if not self._queue:
+                break
+            old_key, pos = heapq.heappop(self._queue)
+            del self._queued[pos]
+            expanded += 1
+
+            new_key = self._key(pos, start)
+            if old_key < new_key:
+                self._queued[pos] = new_key
+                heapq.heappush(self._queue, (new_key, pos))
+            elif self.g.get(pos, math.inf) > self.rhs.get(pos, math.inf):
+                self.g[pos] = self.rhs[pos]
+                for prev in self._adjacent(pos):
+                    self._update_vertex(prev, start)
+            else:
+                self.g[pos] = math.inf
+                self._update_vertex(pos, start)
+                for prev in self._adjacent(pos):
+                    self._update_vertex(prev, start)
+        return expanded
+
+    def plan(self, start: Tuple[int, int], changed_cells=()) -> Tuple[Optional[List], float, int]:
+        """
+        Repair the shortest path from the agent's current position.
+
+        Args:
+            start: Current position (row, col)
+            changed_cells: Cells whose blocked state changed since the
+                           previous call (grid changes are found automatically)
+
+        Returns:
+            path: List of (row, col) tuples from start to goal (None if no path)
+            cost: Total path cost
+            expanded: Number of vertices expanded by this call
+        """
+        changed = set(changed_cells)
+        if self._version != self.env.version:
+            grid_changes = self.env.changes_since(self._version)
+            if grid_changes is None:
+                # Whole grid replaced: start over
+                self.__init__(self.env, self.goal, self.is_blocked)
+            else:
+                changed.update(grid_changes)
+            self._version = self.env.version
+
+        if self._last_start is None:
+            # First call: seed the queue with the goal
+            self._last_start = start
+            self._update_vertex(self.goal, start)
+        # Keys computed for the old start stay valid lower bounds after km grows
+        self.km += self._h(self._last_start, start)
+        self._last_start = start
+
+        for cell in changed:
+            self._update_vertex(cell, start)
+            for prev in self._adjacent(cell):
+                self._update_vertex(prev, start)
+
+        expanded = self._compute_shortest_path(start)
+        self.expanded += expanded
+
+        cost = self.g.get(start, math.inf) if start != self.goal else 0.0
+        if cost == math.inf:
+            return None, float('inf'), expanded
+
+        # Walk down the g-values from start to goal
+        path = [start]
+        current = start
+        while current != self.goal:
+            current = min(self._adjacent(current),
+                          key=lambda nxt: self._cost(current, nxt) + self.g.get(nxt, math.inf))
+            path.append(current)
+        return path, cost, expanded
 
 
 def reconstruct_path(parent: dict, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
@@ -262,10 +904,564 @@ def reconstruct_path(parent: dict, start: Tuple[int, int], goal: Tuple[int, int]
     while current is not None:
         path.append(current)
         current = parent.get(current)
-        current = parent.get(current)
     path.reverse()
     return path
-    raise NotImplementedError("Path reconstruction not implemented yet!")
+
+
+class _SearchBuffers:
+    """
+    Flat per-cell buffers for astar_array(), reused across its queries.
+
+    A cell's g-score and parent are only valid if its `seen` stamp equals
+    the current generation, and it is closed if its `closed` stamp does,
+    so starting a query is one increment instead of an O(H*W) reset.
+    """
+
+    def __init__(self, size: int):
+        self.g_score = array('d', [0.0]) * size
+        self.parent = array('l', [-1]) * size
+        self.seen = array('I', [0]) * size
+        self.closed = array('I', [0]) * size
+        self.generation = 0
+        self.in_use = False
+
+    def next_generation(self) -> int:
+        """Start a new query; every cell reads as unseen and open."""
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF:
+            # Stamps wrapped around: clear them once
+            self.seen = array('I', [0]) * len(self.seen)
+            self.closed = array('I', [0]) * len(self.closed)
+            self.generation = 1
+        return self.generation
+
+
+# Buffers per GridWorld, dropped with the environment
+_search_buffers = weakref.WeakKeyDictionary()
+
+
+def _buffers_for(env) -> _SearchBuffers:
+    """The env's reusable buffers, or fresh ones if its size changed or they are busy."""
+    size = env.height * env.width
+    buffers = _search_buffers.get(env)
+    if buffers is not None and buffers.in_use:
+        return _SearchBuffers(size)   # Re-entrant call: do not share
+    if buffers is None or len(buffers.seen) != size:
+        buffers = _SearchBuffers(size)
+        _search_buffers[env] = buffers
+    return buffers
+
+
+def astar_array(env, start: Tuple[int, int], goal: Tuple[int, int],
+                heuristic='manhattan', open_list='heap',
+                stats: Optional[dict] = None, landmarks=None) -> Tuple[Optional[List], float, int]:
+    """
+    A* Search over flat cell indices with preallocated buffers.
+
+    Same contract (and same expansion order) as astar(), but every cell is
+    the integer ``row * width + col`` and the g-scores, parent pointers and
+    closed flags live in flat arrays sized to the grid. No per-node dict,
+    set, neighbor list or position tuple is built during the search, which
+    is what dominates astar() on very large maps.
+
+    The arrays are kept per environment and reused by the next query
+    (generation stamps mark which entries are current), so a short query
+    on a huge map costs its own expansions, not a pass over the grid.
+    They stay valid when the grid changes; only a new grid size
+    reallocates them.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan', 'euclidean' or 'alt' (landmark bounds)
+        open_list: Frontier implementation - 'heap', 'bucket' (integer
+                   f-values only, e.g. Manhattan) or 'indexed'
+        stats: Optional dict, filled with 'peak_open' (largest frontier size)
+        landmarks: LandmarkHeuristic for the map, required for 'alt'
+
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path)
+        cost: Total path cost
+        expanded: Number of nodes expanded
+    """
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        if stats is not None:
+            stats['peak_open'] = 0
+        return None, float('inf'), 0
+
+    width = env.width
+    goal_row, goal_col = goal
+    scale = env.min_cost()
+
+    if heuristic == 'manhattan':
+        h = lambda r, c: scale * (abs(r - goal_row) + abs(c - goal_col))
+    elif heuristic == 'euclidean':
+        h = lambda r, c: scale * math.sqrt((r - goal_row) ** 2 + (c - goal_col) ** 2)
+    elif heuristic == 'alt':
+        if landmarks is None:
+            raise ValueError("The 'alt' heuristic needs a LandmarkHeuristic (landmarks=...)")
+        bounds = landmarks.flat_bounds(goal)
+        h = lambda r, c: bounds[r * width + c]
+    else:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+
+    # Flat buffers: one slot per cell, reused from the previous query
+    buffers = _buffers_for(env)
+    buffers.in_use = True
+    try:
+        return _astar_array_search(env, start, goal, h, open_list, stats, buffers)
+    finally:
+        buffers.in_use = False
+
+
+def _astar_array_search(env, start, goal, h, open_list, stats, buffers):
+    """The search loop of astar_array() on a set of reusable buffers."""
+    width = env.width
+    # Cached passability bits per cell, same neighbor order as get_neighbors()
+    neighbor_mask = env.neighbor_mask()
+    costs = env.cost_table()
+    steps = ((UP, -width, -1, 0), (DOWN, width, 1, 0),
+             (LEFT, -1, 0, -1), (RIGHT, 1, 0, 1))
+    g_score, parent = buffers.g_score, buffers.parent
+    seen, closed = buffers.seen, buffers.closed
+    generation = buffers.next_generation()
+
+    start_idx = start[0] * width + start[1]
+    goal_idx = goal[0] * width + goal[1]
+
+    g_score[start_idx] = 0.0
+    parent[start_idx] = -1
+    seen[start_idx] = generation
+    frontier = make_open_list(open_list)
+    push, pop = frontier.push, frontier.pop
+    push(start_idx, h(start[0], start[1]))
+    expanded = 0
+
+    while frontier:
+        current_f, current = pop()
+        if closed[current] == generation:
+            continue
+        closed[current] = generation
+        expanded += 1
+
+        if current == goal_idx:
+            path = []
+            while current != -1:
+                path.append(divmod(current, width))
+                current = parent[current]
+            path.reverse()
+            if stats is not None:
+                stats['peak_open'] = frontier.peak
+            return path, g_score[goal_idx], expanded
+
+        row, col = divmod(current, width)
+        current_g = g_score[current]
+        mask = neighbor_mask[current]
+
+        for bit, offset, dr, dc in steps:
+            if not mask & bit:
+                continue
+            neighbor = current + offset
+            if closed[neighbor] == generation:
+                continue
+            tentative_g = current_g + costs[neighbor]
+            if seen[neighbor] != generation or tentative_g < g_score[neighbor]:
+                seen[neighbor] = generation
+                g_score[neighbor] = tentative_g
+                parent[neighbor] = current
+                push(neighbor, tentative_g + h(row + dr, col + dc))
+
+    if stats is not None:
+        stats['peak_open'] = frontier.peak
+    return None, float('inf'), expanded
+
+
+def idastar(env, start: Tuple[int, int], goal: Tuple[int, int],
+            heuristic='manhattan', max_nodes: int = 1_000_000,
+            stats: Optional[dict] = None) -> Tuple[Optional[List], float, int]:
+    """
+    Memory-bounded IDA* - iterative deepening A* with a bounded transposition table.
+
+    Repeated depth-first searches, each cut off at f(n) = g(n) + h(n) >
+    threshold; the next threshold is the smallest f-value that was cut.
+    Only the current path plus a transposition table of the best g-value
+    per visited cell are kept in memory, and together they never hold more
+    than max_nodes cells. The table persists across iterations, so a cell
+    is not searched again via a route already known to be worse. Once it
+    is full it stops growing (and its oldest entries make room for a
+    deeper path): the search still finds the optimal path, it just
+    re-expands more cells.
+
+    Time is traded for memory: every iteration raises the threshold by
+    the smallest possible amount, so maps whose optimal path detours far
+    from the heuristic estimate (long mazes) need many iterations.
+
+    Neighbors and costs are read straight from env.grid and env.terrain,
+    so none of the environment's per-cell caches are built. When the
+    whole grid fits in max_nodes, the connected components rule out an
+    unreachable goal up front. Otherwise the current path is capped too:
+    a breadth-first ball around the goal, at most a quarter of max_nodes
+    cells, gives the exact step distance to the goal inside it and a
+    lower bound (its radius, or the Manhattan distance) outside it. Cells
+    from which the goal cannot be reached within the cap are cut off by
+    the cap, not by the threshold. When an iteration has no threshold
+    cut-offs left, no path fits in memory and the search stops.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan' or 'euclidean'
+        max_nodes: Hard cap on cells held in memory (path + table + ball)
+        stats: Optional dict, filled with 'iterations', 'peak_nodes' (most
+               cells held at once), 'peak_bytes' (approximate peak size of
+               every structure the search keeps, component labels
+               included) and 'truncated' (True if a path
+               longer than max_nodes had to be cut off)
+
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path
+              within the memory limit)
+        cost: Total path cost
+        expanded: Number of nodes expanded over all iterations
+    """
+    if stats is not None:
+        stats.update(iterations=0, peak_nodes=0, peak_bytes=0, truncated=False)
+
+    width = env.width
+    size = env.height * width
+    goal_row, goal_col = goal
+    scale = float(env.terrain.min())
+    if heuristic == 'manhattan':
+        h = lambda idx: scale * (abs(idx // width - goal_row) + abs(idx % width - goal_col))
+    elif heuristic == 'euclidean':
+        h = lambda idx: scale * math.sqrt((idx // width - goal_row) ** 2 + (idx % width - goal_col) ** 2)
+    else:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+
+    # Flat views of the map itself: nothing is allocated per cell
+    grid = env.grid.reshape(-1)
+    costs = env.terrain.reshape(-1)
+    start_idx = start[0] * width + start[1]
+    goal_idx = goal_row * width + goal_col
+    int_bytes = sys.getsizeof(size)
+
+    def neighbors(idx):
+        """Passable cells next to idx."""
+        col = idx % width
+        found = []
+        if idx >= width and grid.item(idx - width) != OBSTACLE:
+            found.append(idx - width)
+        if idx + width < size and grid.item(idx + width) != OBSTACLE:
+            found.append(idx + width)
+        if col > 0 and grid.item(idx - 1) != OBSTACLE:
+            found.append(idx - 1)
+        if col < width - 1 and grid.item(idx + 1) != OBSTACLE:
+            found.append(idx + 1)
+        return found
+
+    fixed_bytes = 0
+    near_goal = None
+    if max_nodes >= size:
+        # Start and goal in different connected components: nothing to search
+        if not env.is_reachable(start, goal):
+            return None, float('inf'), 0
+        fixed_bytes = (env.component_labels().nbytes + len(env.passable_cells()) +
+                       len(env.neighbor_mask()))
+    elif grid.item(goal_idx) == OBSTACLE:
+        return None, float('inf'), 0
+    else:
+        # Exact step distances to the goal from every cell within radius
+        # steps of it, grown level by level until the ball budget runs out
+        near_goal = {goal_idx: 0}
+        ball_budget = max(1, max_nodes // 4)
+        level = [goal_idx]
+        radius = 0
+        full = False
+        while level and not full:
+            next_level = []
+            for idx in level:
+                for neighbor in neighbors(idx):
+                    if neighbor in near_goal:
+                        continue
+                    if len(near_goal) >= ball_budget:
+                        full = True
+                        break
+                    near_goal[neighbor] = radius + 1
+                    next_level.append(neighbor)
+                if full:
+                    break
+            if not full:
+                radius += 1
+            level = next_level
+        # Not full: the ball is the goal's whole component
+        ball_complete = not full
+        fixed_bytes = sys.getsizeof(near_goal) + len(near_goal) * int_bytes
+        if ball_complete and start_idx not in near_goal:
+            if stats is not None:
+                stats.update(peak_nodes=len(near_goal), peak_bytes=fixed_bytes)
+            return None, float('inf'), 0
+
+    def steps_left(idx):
+        """Lower bound on the steps from idx to the goal (-1 = unreachable)."""
+        steps = near_goal.get(idx)
+        if steps is not None:
+            return steps
+        if ball_complete:
+            return -1
+        return max(radius + 1, abs(idx // width - goal_row) + abs(idx % width - goal_col))
+
+    # Cells the path and the transposition table may hold between them
+    room = max_nodes - (len(near_goal) if near_goal is not None else 0)
+
+    def children(idx):
+        """Passable neighbors, most promising (lowest h) last so they pop first."""
+        return sorted(neighbors(idx), key=h, reverse=True)
+
+    # Transposition table, kept across iterations: cell -> (best g seen, last
+    # iteration it was expanded with that g). A cell reached with a worse g
+    # is a dominated route and is skipped.
+    table = {start_idx: (0.0, 0)}
+    threshold = h(start_idx)
+    expanded = 0
+    iterations = 0
+    peak_nodes = max_nodes - room
+    peak_bytes = fixed_bytes
+    truncated = False
+    path_idx = [start_idx] if start_idx == goal_idx else None
+    path_cost = 0.0
+
+    while path_idx is None:
+        iterations += 1
+        next_threshold = math.inf
+        # Current DFS path: cell, its g-value and its children still to try
+        cells = array('l', [start_idx])
+        g_values = array('d', [0.0])
+        pending = [children(start_idx)]
+        on_path = {start_idx}
+
+        while cells:
+            todo = pending[-1]
+            if not todo:
+                on_path.discard(cells.pop())
+                g_values.pop()
+                pending.pop()
+                continue
+            neighbor = todo.pop()
+            if neighbor in on_path:
+                continue
+            if near_goal is not None and neighbor != goal_idx:
+                remaining = steps_left(neighbor)
+                if remaining < 0:
+                    continue
+                if len(cells) + remaining > room:
+                    # No path through neighbor fits in max_nodes cells
+                    truncated = True
+                    continue
+            g = g_values[-1] + costs.item(neighbor)
+            f = g + h(neighbor)
+            if f > threshold:
+                if f < next_threshold:
+                    next_threshold = f
+                continue
+            entry = table.get(neighbor)
+            if entry is not None and (g > entry[0] or (g == entry[0] and entry[1] == iterations)):
+                continue
+
+            if neighbor == goal_idx:
+                path_idx = list(cells) + [neighbor]
+                path_cost = g
+                break
+            if entry is not None or len(table) + len(cells) < room:
+                table[neighbor] = (g, iterations)
+            if len(table) + len(cells) >= room:
+                # Make room for the deeper path: forget the oldest table entry
+                del table[next(iter(table))]
+
+            cells.append(neighbor)
+            g_values.append(g)
+            pending.append(children(neighbor))
+            on_path.add(neighbor)
+            expanded += 1
+
+            held = len(table) + len(cells) + max_nodes - room
+            if held > peak_nodes:
+                peak_nodes = held
+                peak_bytes = (fixed_bytes + sys.getsizeof(table) +
+                              len(table) * (sys.getsizeof((g, iterations)) + int_bytes) +
+                              sys.getsizeof(on_path) + sys.getsizeof(cells) +
+                              sys.getsizeof(g_values) + len(pending) * sys.getsizeof(todo))
+
+        if path_idx is None and next_threshold == math.inf:
+            # Nothing was cut by the threshold: raising it cannot help
+            break
+        threshold = next_threshold
+
+    if stats is not None:
+        stats.update(iterations=iterations, peak_nodes=peak_nodes,
+                     peak_bytes=peak_bytes, truncated=truncated)
+    if path_idx is None:
+        return None, float('inf'), expanded
+    return [divmod(idx, width) for idx in path_idx], path_cost, expanded
+
+
+# Successor directions for Jump Point Search, keyed by the (normalized)
+# direction the node was entered from. None = the start node.
+_JPS4_SUCCESSORS = {None: [(-1, 0), (1, 0), (0, -1), (0, 1)]}
+_JPS8_SUCCESSORS = {None: [(-1, 0), (1, 0), (0, -1), (0, 1),
+                           (-1, -1), (-1, 1), (1, -1), (1, 1)]}
+for _d in (-1, 1):
+    _JPS4_SUCCESSORS[(0, _d)] = [(-1, 0), (1, 0), (0, _d)]
+    _JPS4_SUCCESSORS[(_d, 0)] = [(0, -1), (0, 1), (_d, 0)]
+    _JPS8_SUCCESSORS[(0, _d)] = [(0, _d), (-1, _d), (1, _d), (-1, 0), (1, 0)]
+    _JPS8_SUCCESSORS[(_d, 0)] = [(_d, 0), (_d, -1), (_d, 1), (0, -1), (0, 1)]
+    for _e in (-1, 1):
+        _JPS8_SUCCESSORS[(_d, _e)] = [(_d, 0), (0, _e), (_d, _e)]
+
+
+def jps(env, start: Tuple[int, int], goal: Tuple[int, int],
+        diagonal=False) -> Tuple[Optional[List], float, int]:
+    """
+    Jump Point Search - A* that skips the symmetric paths of uniform-cost grids.
+
+    Instead of pushing every neighbor, JPS "jumps" in a straight line until
+    it reaches the goal or a cell with a forced neighbor (an obstacle corner
+    that makes a turn necessary). Only those jump points enter the open
+    list, so open areas cost a handful of expansions instead of thousands.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        diagonal: False for 4-connected moves (same moves as
+                  env.get_neighbors(), same optimal cost as astar());
+                  True for 8-connected moves, where a diagonal step costs
+                  sqrt(2) and may not cut an obstacle corner
+
+    Returns:
+        path: List of (row, col) tuples from start to goal (None if no path)
+        cost: Total path cost
+        expanded: Number of jump points expanded
+
+    Raises:
+        ValueError: If the map has terrain costs - jumping over cells is
+                    only valid when every move costs the same
+    """
+    if not env.has_uniform_cost():
+        raise ValueError("Jump Point Search needs uniform move costs; use astar() on maps with terrain")
+
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        return None, float('inf'), 0
+
+    width = env.width
+    height = env.height
+    passable = env.passable_cells()
+    goal_row, goal_col = goal
+
+    def walkable(r, c):
+        return 0 <= r < height and 0 <= c < width and passable[r * width + c]
+
+    def forced(r, c, dr, dc):
+        """True if a straight move entering (r, c) has a forced neighbor."""
+        if dc:
+            return ((walkable(r - 1, c) and not walkable(r - 1, c - dc)) or
+                    (walkable(r + 1, c) and not walkable(r + 1, c - dc)))
+        return ((walkable(r, c - 1) and not walkable(r - dr, c - 1)) or
+                (walkable(r, c + 1) and not walkable(r - dr, c + 1)))
+
+    def jump4(r, c, dr, dc):
+        while True:
+            r += dr
+            c += dc
+            if not walkable(r, c):
+                return None
+            if r == goal_row and c == goal_col:
+                return r, c
+            if forced(r, c, dr, dc):
+                return r, c
+            # Vertical moves stop wherever a horizontal jump finds something
+            if dr and (jump4(r, c, 0, 1) or jump4(r, c, 0, -1)):
+                return r, c
+
+    def jump8(r, c, dr, dc):
+        while True:
+            if not walkable(r + dr, c + dc):
+                return None
+            if dr and dc and not (walkable(r + dr, c) and walkable(r, c + dc)):
+                return None  # No corner cutting
+            r += dr
+            c += dc
+            if r == goal_row and c == goal_col:
+                return r, c
+            if dr and dc:
+                # Diagonal moves stop wherever a straight jump finds something
+                if jump8(r, c, dr, 0) or jump8(r, c, 0, dc):
+                    return r, c
+            elif forced(r, c, dr, dc):
+                return r, c
+
+    if diagonal:
+        jump, successors = jump8, _JPS8_SUCCESSORS
+
+        def distance(a, b):
+            dr, dc = abs(a[0] - b[0]), abs(a[1] - b[1])
+            return math.sqrt(2) * min(dr, dc) + abs(dr - dc)
+    else:
+        jump, successors = jump4, _JPS4_SUCCESSORS
+
+        def distance(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    g_score = {start: 0.0}
+    parent = {start: None}
+    frontier = [(distance(start, goal), start)]
+    explored = set()
+    expanded = 0
+
+    while frontier:
+        current_f, current = heapq.heappop(frontier)
+        if current in explored:
+            continue
+        explored.add(current)
+        expanded += 1
+
+        if current == goal:
+            return _expand_jump_path(reconstruct_path(parent, start, goal)), \
+                g_score[goal], expanded
+
+        row, col = current
+        came_from = None
+        if parent[current] is not None:
+            pr, pc = parent[current]
+            came_from = ((row > pr) - (row < pr), (col > pc) - (col < pc))
+
+        for dr, dc in successors[came_from]:
+            jump_point = jump(row, col, dr, dc)
+            if jump_point is None or jump_point in explored:
+                continue
+            tentative_g = g_score[current] + distance(current, jump_point)
+            if jump_point not in g_score or tentative_g < g_score[jump_point]:
+                g_score[jump_point] = tentative_g
+                parent[jump_point] = current
+                heapq.heappush(frontier, (tentative_g + distance(jump_point, goal), jump_point))
+
+    return None, float('inf'), expanded
+
+
+def _expand_jump_path(jump_points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Fill in the straight (or diagonal) cells between consecutive jump points."""
+    path = [jump_points[0]]
+    for (r, c), (nr, nc) in zip(jump_points, jump_points[1:]):
+        dr = (nr > r) - (nr < r)
+        dc = (nc > c) - (nc < c)
+        while (r, c) != (nr, nc):
+            r += dr
+            c += dc
+            path.append((r, c))
+    return path
 
 
 # ============================================================================
@@ -300,6 +1496,13 @@ if __name__ == "__main__":
         ('UCS', lambda: ucs(env, start, goal)),
         ('A* (Manhattan)', lambda: astar(env, start, goal, 'manhattan')),
         ('A* (Euclidean)', lambda: astar(env, start, goal, 'euclidean')),
+        ('A* (Array)', lambda: astar_array(env, start, goal, 'manhattan')),
+        ('JPS', lambda: jps(env, start, goal)),
+        ('Bidirectional BFS', lambda: bidirectional_bfs(env, start, goal)),
+        ('Wavefront BFS', lambda: wavefront_bfs(env, start, goal)),
+        ('Bidirectional A*', lambda: bidirectional_astar(env, start, goal)),
+        ('ARA*', lambda: arastar(env, start, goal, deadline=0.05)),
+        ('IDA*', lambda: idastar(env, start, goal)),
     ]
     
     results = []
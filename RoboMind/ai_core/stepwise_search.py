@@ -0,0 +1,221 @@
+"""
+Step-wise Search - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Generator versions of BFS, UCS and A* for interactive visualization.
+Instead of running to completion, each search yields a SearchStep after
+every k expansions, describing what changed since the previous step:
+
+    steps = astar_steps(env, start, goal, k=50)
+    for step in steps:
+        draw(step.visited_delta, step.frontier_delta)
+        if step.done:
+            print(step.path, step.cost, step.expanded)
+        elif user_pressed_escape():
+            steps.close()    # cancels the search
+            break
+
+A UI loop can therefore interleave searching with rendering and event
+handling without threads. Leaving the loop (or calling close() on the
+generator) cancels the search; nothing else needs cleaning up.
+
+Paths, costs and expansion counts are the same as bfs(), ucs() and astar()
+in ai_core.search_algorithms.
+"""
+
+from typing import Tuple, List, Optional, Iterator
+from collections import deque
+
+from ai_core.priority_queues import make_open_list
+from ai_core.search_algorithms import reconstruct_path, make_heuristic
+
+
+class SearchStep:
+    """
+    Progress report of a step-wise search.
+
+    Attributes:
+        visited_delta: Cells expanded since the previous step
+        frontier_delta: Cells added to the frontier since the previous step
+        frontier_size: Number of entries currently in the frontier
+        expanded: Total nodes expanded so far
+        done: True on the last step; path and cost are set then
+        path: Path from start to goal (None while running or if no path)
+        cost: Path cost (inf while running or if no path)
+    """
+
+    def __init__(self, visited_delta: List[Tuple[int, int]], frontier_delta: List[Tuple[int, int]],
+                 frontier_size: int, expanded: int, done: bool = False,
+                 path: Optional[List[Tuple[int, int]]] = None, cost: float = float('inf')):
+        self.visited_delta = visited_delta
+        self.frontier_delta = frontier_delta
+        self.frontier_size = frontier_size
+        self.expanded = expanded
+        self.done = done
+        self.path = path
+        self.cost = cost
+
+    def __repr__(self) -> str:
+        return (f"SearchStep(expanded={self.expanded}, visited+={len(self.visited_delta)}, "
+                f"frontier+={len(self.frontier_delta)}, done={self.done})")
+
+
+def run_steps(steps: Iterator[SearchStep]) -> Tuple[Optional[List], float, int]:
+    """
+    Drain a step-wise search without visualization.
+
+    Returns:
+        (path, cost, expanded) like the blocking searches
+    """
+    step = None
+    for step in steps:
+        pass
+    return step.path, step.cost, step.expanded
+
+
+def bfs_steps(env, start: Tuple[int, int], goal: Tuple[int, int],
+              k: int = 1) -> Iterator[SearchStep]:
+    """
+    Breadth-First Search, yielding after every k expansions.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        k: Expansions between two yielded steps
+
+    Yields:
+        SearchStep; the last one has done=True
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        yield SearchStep([], [], 0, 0, done=True)
+        return
+
+    queue = deque([start])
+    visited = {start}
+    parent = {start: None}
+    expanded = 0
+    visited_delta, frontier_delta = [], [start]
+
+    while queue:
+        current = queue.popleft()
+        expanded += 1
+        visited_delta.append(current)
+
+        if current == goal:
+            path = reconstruct_path(parent, start, goal)
+            yield SearchStep(visited_delta, frontier_delta, len(queue), expanded,
+                             done=True, path=path, cost=len(path) - 1)
+            return
+
+        for neighbor in env.get_neighbors(current):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                parent[neighbor] = current
+                queue.append(neighbor)
+                frontier_delta.append(neighbor)
+
+        if expanded % k == 0:
+            yield SearchStep(visited_delta, frontier_delta, len(queue), expanded)
+            visited_delta, frontier_delta = [], []
+
+    yield SearchStep(visited_delta, frontier_delta, 0, expanded, done=True)
+
+
+def ucs_steps(env, start: Tuple[int, int], goal: Tuple[int, int],
+              k: int = 1, open_list: str = 'heap') -> Iterator[SearchStep]:
+    """
+    Uniform Cost Search, yielding after every k expansions.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        k: Expansions between two yielded steps
+        open_list: Frontier implementation (see ai_core.priority_queues)
+
+    Yields:
+        SearchStep; the last one has done=True
+    """
+    return _best_first_steps(env, start, goal, lambda pos: 0, k, open_list, goal_counts=False)
+
+
+def astar_steps(env, start: Tuple[int, int], goal: Tuple[int, int],
+                heuristic: str = 'manhattan', k: int = 1, open_list: str = 'heap',
+                landmarks=None) -> Iterator[SearchStep]:
+    """
+    A* Search, yielding after every k expansions.
+
+    Args:
+        env: GridWorld environment
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        heuristic: 'manhattan', 'euclidean' or 'alt' (landmark bounds)
+        k: Expansions between two yielded steps
+        open_list: Frontier implementation (see ai_core.priority_queues)
+        landmarks: LandmarkHeuristic for the map, required for 'alt'
+
+    Yields:
+        SearchStep; the last one has done=True
+    """
+    h = make_heuristic(env, goal, heuristic, landmarks)
+    return _best_first_steps(env, start, goal, h, k, open_list, goal_counts=True)
+
+
+def _best_first_steps(env, start, goal, h, k, open_list, goal_counts):
+    """
+    Shared loop of ucs_steps() and astar_steps(), ordered by g + h.
+
+    goal_counts says whether popping the goal counts as an expansion
+    (it does in astar(), not in ucs()).
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    # Start and goal in different connected components: nothing to search
+    if not env.is_reachable(start, goal):
+        yield SearchStep([], [], 0, 0, done=True)
+        return
+
+    frontier = make_open_list(open_list)
+    frontier.push(start, h(start))
+    g_score = {start: 0}
+    parent = {start: None}
+    explored = set()
+    expanded = 0
+    costs, width = env.cost_table(), env.width
+    visited_delta, frontier_delta = [], [start]
+
+    while frontier:
+        _, current = frontier.pop()
+        if current in explored:
+            continue
+        explored.add(current)
+        visited_delta.append(current)
+
+        if current == goal:
+            if goal_counts:
+                expanded += 1
+            yield SearchStep(visited_delta, frontier_delta, len(frontier), expanded, done=True,
+                             path=reconstruct_path(parent, start, goal), cost=g_score[goal])
+            return
+
+        expanded += 1
+        current_g = g_score[current]
+        for neighbor in env.get_neighbors(current):
+            if neighbor in explored:
+                continue
+            tentative_g = current_g + costs[neighbor[0] * width + neighbor[1]]
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                parent[neighbor] = current
+                frontier.push(neighbor, tentative_g + h(neighbor))
+                frontier_delta.append(neighbor)
+
+        if expanded % k == 0:
+            yield SearchStep(visited_delta, frontier_delta, len(frontier), expanded)
+            visited_delta, frontier_delta = [], []
+
+    yield SearchStep(visited_delta, frontier_delta, 0, expanded, done=True)
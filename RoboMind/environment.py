@@ -8,8 +8,15 @@ Students should NOT modify this file - use it to test your agents.
 
 import pygame
 import numpy as np
+from collections import deque
+from array import array
 from typing import Tuple, List, Optional
 
+try:
+    from scipy import ndimage  # Optional: faster connected-component labeling
+except ImportError:
+    ndimage = None
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (50, 50, 50)
@@ -29,6 +36,68 @@ PATH = 4
 VISITED = 5
 UNCERTAIN = 6
 
+# Neighbor directions in get_neighbors() order (up, down, left, right) and
+# the bit each one occupies in a cell's passability mask
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+DIRECTION_BITS = [UP, DOWN, LEFT, RIGHT]
+_OPPOSITE_BIT = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Neighbor offsets for each of the 16 possible masks, in DIRECTIONS order
+_MASK_OFFSETS = [tuple(offset for offset, bit in zip(DIRECTIONS, DIRECTION_BITS) if mask & bit)
+                 for mask in range(16)]
+
+# Number of single-cell changes GridWorld.changes_since() can look back over
+MAX_CHANGE_LOG = 4096
+
+# A local split check that would visit more than this fraction of the grid
+# gives up; the region is then relabeled (vectorized) on the next query
+MAX_SPLIT_CHECK_FRACTION = 0.05
+
+
+def label_components(passable: np.ndarray) -> np.ndarray:
+    """
+    Label the 4-connected regions of passable cells.
+    
+    Args:
+        passable: (height, width) boolean array
+    
+    Returns:
+        (height, width) int32 array; cells of the same region share a label,
+        obstacles are -1
+    """
+    if ndimage is not None:
+        labels, _ = ndimage.label(passable)
+        return (labels - 1).astype(np.int32)
+    
+    # Pure NumPy: every cell starts as its own root; each round hooks the
+    # larger root of every edge that still joins two regions onto the
+    # smaller one, then pointer-jumps until each cell points at its root
+    height, width = passable.shape
+    index = np.arange(height * width).reshape(height, width)
+    across = passable[:, :-1] & passable[:, 1:]
+    down = passable[:-1, :] & passable[1:, :]
+    u = np.concatenate([index[:, :-1][across], index[:-1, :][down]])
+    v = np.concatenate([index[:, 1:][across], index[1:, :][down]])
+    
+    labels = np.arange(height * width)
+    while u.size:
+        lu, lv = labels[u], labels[v]
+        crossing = lu != lv
+        if not crossing.any():
+            break
+        np.minimum.at(labels, np.maximum(lu, lv)[crossing], np.minimum(lu, lv)[crossing])
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        # Edges inside one region stay that way - drop them
+        u, v = u[crossing], v[crossing]
+    
+    labels[~passable.ravel()] = -1
+    return labels.reshape(height, width).astype(np.int32)
+
 
 class GridWorld:
     """
@@ -48,8 +117,12 @@ class GridWorld:
         self.height = height
         self.cell_size = cell_size
         
-        # Create empty grid
-        self.grid = np.zeros((height, width), dtype=int)
+        # Create empty grid (assigning self.grid later counts as a full change)
+        self._grid = np.zeros((height, width), dtype=int)
+        
+        # Terrain layer: cost of moving into each cell (1.0 = normal floor);
+        # change it through set_terrain() / load_terrain()
+        self.terrain = np.ones((height, width), dtype=np.float32)
         
         # Agent position
         self.start = (0, 0)
@@ -59,8 +132,24 @@ class GridWorld:
         # State tracking
         self.path = []
         self.visited = set()
+        self.frontier = set()        # Cells waiting in a running search's frontier
         self.expanded = 0
         
+        # Grid change tracking and cached neighbor structure
+        self.version = 0
+        self._change_log = deque(maxlen=MAX_CHANGE_LOG)  # (version, cell) pairs
+        self._log_start = 0          # Oldest version the log fully covers
+        self._cache_grid = None
+        self._passable = None
+        self._neighbor_mask = None
+        self._components = None      # Flat component labels, None = stale
+        self._next_label = 0         # First label not used in _components yet
+        self._stale_labels = set()   # Labels of regions that may have split
+        self._cost_terrain = None    # Terrain array the cost caches were built from
+        self._cost_table = None
+        self._min_cost = 1.0
+        self._uniform_cost = True
+        
         # Pygame setup
         self.screen = None
         self.clock = None
@@ -76,13 +165,18 @@ class GridWorld:
             S = start
             G = goal
             ? = uncertain
+            any other positive number = free space with that movement
+                cost (e.g. 3 or 2.5 = slow floor)
+        
+        Blank lines are ignored.
         """
         with open(map_file, 'r') as f:
-            lines = f.readlines()
+            lines = [line for line in f.readlines() if line.strip()]
         
         self.height = len(lines)
         self.width = len(lines[0].strip().split())
-        self.grid = np.zeros((self.height, self.width), dtype=int)
+        self._grid = np.zeros((self.height, self.width), dtype=int)
+        self.terrain = np.ones((self.height, self.width), dtype=np.float32)
         
         for i, line in enumerate(lines):
             cells = line.strip().split()
@@ -96,11 +190,250 @@ class GridWorld:
                     self.goal = (i, j)
                 elif cell == '?':
                     self.grid[i][j] = UNCERTAIN
+                elif cell != '0':
+                    cost = float(cell)
+                    if not cost > 0:
+                        raise ValueError(f"Invalid terrain cost {cell!r} at ({i}, {j}) in {map_file}")
+                    self.terrain[i][j] = cost
+        
+        self._grid_changed()
+    
+    @property
+    def grid(self) -> np.ndarray:
+        """(height, width) array of cell types (FREE, OBSTACLE, ...)."""
+        return self._grid
+    
+    @grid.setter
+    def grid(self, grid: np.ndarray):
+        """Replace the whole grid; caches keyed on version rebuild from scratch."""
+        self._grid = grid
+        self._grid_changed()
     
     def add_obstacle(self, row: int, col: int):
         """Add an obstacle at (row, col)."""
         if 0 <= row < self.height and 0 <= col < self.width:
+            if self.grid[row][col] == OBSTACLE:
+                return
             self.grid[row][col] = OBSTACLE
+            self._grid_changed((row, col))
+    
+    def _grid_changed(self, cell: Optional[Tuple[int, int]] = None):
+        """
+        Record a change to the grid and update the neighbor cache.
+        
+        Args:
+            cell: The single cell that became an obstacle, or None if the
+                  whole grid was replaced (the cache is then rebuilt lazily)
+        """
+        self.version += 1
+        if cell is None:
+            self._change_log.clear()
+            self._log_start = self.version
+        else:
+            if len(self._change_log) == MAX_CHANGE_LOG:
+                # The oldest entry is about to fall off the log
+                self._log_start = self._change_log[0][0]
+            self._change_log.append((self.version, cell))
+        
+        if cell is None or self._cache_grid is not self.grid:
+            self._cache_grid = None
+            return
+        
+        # Patch in place: the cell's neighbors lose the edge pointing into it
+        row, col = cell
+        index = row * self.width + col
+        self._passable[index] = 0
+        for (dr, dc), bit in zip(DIRECTIONS, DIRECTION_BITS):
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < self.height and 0 <= nc < self.width:
+                neighbor = nr * self.width + nc
+                # The neighbor reaches this cell in the opposite direction
+                self._neighbor_mask[neighbor] &= ~_OPPOSITE_BIT[bit] & 0xF
+        
+        # Removing a cell with at most one open neighbor cannot split its
+        # region; otherwise check locally whether it did
+        if self._components is not None:
+            label = int(self._components[index])
+            self._components[index] = -1
+            if label not in self._stale_labels and bin(self._neighbor_mask[index]).count('1') >= 2:
+                self._split_component(index, label)
+    
+    def _split_component(self, index: int, label: int):
+        """
+        The cell at flat index became an obstacle while two or more of its
+        neighbors are open: relabel the parts of its region it cut off.
+        
+        One BFS per open neighbor runs in lockstep, and searches that meet
+        are merged. Work stops as soon as all of them have met (no split),
+        or once all groups but one ran out of cells - each exhausted group
+        is a region of its own and gets a new label. The cost is bounded by
+        the detour around the cell, or by the size of the smaller parts;
+        past MAX_SPLIT_CHECK_FRACTION of the grid the region is marked
+        stale instead, and component_labels() relabels just that region.
+        """
+        budget = max(64, int(MAX_SPLIT_CHECK_FRACTION * self.height * self.width))
+        mask = self._neighbor_mask
+        steps = [(bit, step) for bit, step in zip(DIRECTION_BITS, (-self.width, self.width, -1, 1))]
+        starts = [index + step for bit, step in steps if mask[index] & bit]
+        owner = {cell: search for search, cell in enumerate(starts)}
+        queues = [deque([cell]) for cell in starts]
+        group = list(range(len(starts)))     # Union-find parent per search
+        retired = set()
+        
+        def find(search):
+            while group[search] != search:
+                group[search] = group[group[search]]
+                search = group[search]
+            return search
+        
+        groups = len(starts)
+        while groups > 1:
+            for search, queue in enumerate(queues):
+                if not queue:
+                    continue
+                cell = queue.popleft()
+                cell_mask = mask[cell]
+                for bit, step in steps:
+                    if not cell_mask & bit:
+                        continue
+                    neighbor = cell + step
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = search
+                        queue.append(neighbor)
+                        if len(owner) > budget:
+                            self._stale_labels.add(label)
+                            return
+                        continue
+                    root, other_root = find(search), find(other)
+                    if root != other_root:
+                        group[other_root] = root
+                        groups -= 1
+                        if groups == 1:
+                            return
+            
+            live = {find(search) for search, queue in enumerate(queues) if queue}
+            for root in {find(search) for search in range(len(starts))} - live - retired:
+                if groups == 1:
+                    break
+                cells = [cell for cell, search in owner.items() if find(search) == root]
+                self._components[cells] = self._next_label
+                self._next_label += 1
+                retired.add(root)
+                groups -= 1
+        
+    def changes_since(self, version: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get the cells changed after a given grid version.
+        
+        Lets caches built at `version` patch themselves locally instead of
+        rebuilding from scratch.
+        
+        Args:
+            version: A value of self.version seen earlier
+        
+        Returns:
+            List of changed (row, col) cells (possibly empty), or None if the
+            whole grid was replaced since then or the log no longer reaches
+            back that far - the caller must then rebuild everything
+        """
+        if version < self._log_start:
+            return None
+        return [cell for v, cell in self._change_log if v > version]
+    
+    def _ensure_neighbor_cache(self):
+        """Build the neighbor mask if the grid was replaced or never indexed."""
+        if self._cache_grid is self.grid and self.grid.shape == (self.height, self.width):
+            return
+        
+        # One 4-bit mask per cell: bit set = that neighbor is in bounds and passable
+        passable = (self.grid != OBSTACLE).astype(np.uint8)
+        mask = np.zeros((self.height, self.width), dtype=np.uint8)
+        mask[1:, :] |= passable[:-1, :] * UP
+        mask[:-1, :] |= passable[1:, :] * DOWN
+        mask[:, 1:] |= passable[:, :-1] * LEFT
+        mask[:, :-1] |= passable[:, 1:] * RIGHT
+        
+        self._passable = bytearray(passable.tobytes())
+        self._neighbor_mask = bytearray(mask.tobytes())
+        self._components = None
+        self._cache_grid = self.grid
+    
+    def passable_cells(self) -> bytearray:
+        """
+        Get a flat 0/1 passability buffer, indexed by row * width + col.
+        
+        Read-only for callers; kept in sync with the grid like neighbor_mask().
+        """
+        self._ensure_neighbor_cache()
+        return self._passable
+    
+    def component_labels(self) -> np.ndarray:
+        """
+        Get connected-component labels for every cell (obstacles are -1).
+        
+        Computed vectorized on first use or after the grid is replaced;
+        add_obstacle() relabels only the parts of a region it splits off.
+        
+        Returns:
+            (height, width) int32 array; read-only for callers
+        """
+        self._ensure_neighbor_cache()
+        if self._components is None:
+            passable = np.frombuffer(self._passable, dtype=np.uint8).reshape(self.height, self.width)
+            self._components = label_components(passable.astype(bool)).ravel()
+            self._next_label = self.height * self.width
+            self._stale_labels = set()
+        for label in self._stale_labels:
+            self._relabel_region(label)
+        self._stale_labels = set()
+        return self._components.reshape(self.height, self.width)
+    
+    def _relabel_region(self, label: int):
+        """Split one region into its connected parts, labeling only its bounding box."""
+        region = (self._components == label).reshape(self.height, self.width)
+        rows, cols = np.nonzero(region.any(axis=1))[0], np.nonzero(region.any(axis=0))[0]
+        if rows.size == 0:
+            return
+        box = region[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        parts = label_components(box)
+        # Compact the part labels to 0..k-1 before offsetting them
+        _, inverse = np.unique(parts[box], return_inverse=True)
+        labels = self._components.reshape(self.height, self.width)
+        labels[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1][box] = self._next_label + inverse
+        self._next_label += int(inverse.max()) + 1
+    
+    def is_reachable(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        """
+        Check whether any path leads from start to goal, in O(1).
+        
+        A start on an obstacle cell can still step to its open neighbors,
+        as the search algorithms allow; a goal on an obstacle cannot be
+        reached.
+        """
+        if start == goal:
+            return True
+        if not (0 <= start[0] < self.height and 0 <= start[1] < self.width and
+                0 <= goal[0] < self.height and 0 <= goal[1] < self.width):
+            return False
+        labels = self.component_labels()
+        goal_label = labels[goal]
+        if goal_label < 0:
+            return False
+        if labels[start] >= 0:
+            return bool(labels[start] == goal_label)
+        return any(labels[neighbor] == goal_label for neighbor in self.get_neighbors(start))
+    
+    def neighbor_mask(self) -> bytearray:
+        """
+        Get the per-cell passability mask, indexed by row * width + col.
+        
+        Each entry holds the UP/DOWN/LEFT/RIGHT bits of the neighbors that
+        get_neighbors() would return. Read-only for callers; it is patched
+        in place when the grid changes through add_obstacle().
+        """
+        self._ensure_neighbor_cache()
+        return self._neighbor_mask
     
     def add_random_obstacles(self, num_obstacles: int):
         """Add random obstacles to the grid."""
@@ -127,25 +460,101 @@ class GridWorld:
         return pos == self.goal
     
     def get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring positions (4-connected: up, down, left, right)."""
+        """
+        Get valid neighboring positions (4-connected: up, down, left, right).
+        
+        Read from the cell's 4-bit neighbor mask, so nothing is stored per cell.
+        """
         row, col = pos
-        neighbors = []
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return [(row + dr, col + dc) for dr, dc in DIRECTIONS
+                    if self.is_valid((row + dr, col + dc))]
+        
+        self._ensure_neighbor_cache()
+        return [(row + dr, col + dc)
+                for dr, dc in _MASK_OFFSETS[self._neighbor_mask[row * self.width + col]]]
+    
+    def get_cost(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
+        """Get movement cost between two adjacent positions (the terrain cost of pos2)."""
+        return self.cost_table()[pos2[0] * self.width + pos2[1]]
+    
+    def get_costs(self, cells) -> np.ndarray:
+        """
+        Terrain costs of many cells at once.
         
-        # Four directions: up, down, left, right
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        Args:
+            cells: (N, 2) array-like of (row, col) cells
         
-        for dr, dc in directions:
-            new_pos = (row + dr, col + dc)
-            if self.is_valid(new_pos):
-                neighbors.append(new_pos)
+        Returns:
+            (N,) float64 array: the cost of moving into each cell
+        """
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        return self.terrain[cells[:, 0], cells[:, 1]].astype(np.float64)
+    
+    def cost_table(self) -> array:
+        """
+        Get the flat cost of moving into each cell, indexed by row * width + col.
         
-        return neighbors
+        Searches index this array('d') in their inner loops instead of
+        calling get_cost() per edge. Read-only for callers.
+        """
+        self._ensure_cost_cache()
+        return self._cost_table
     
-    def get_cost(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
-        """Get movement cost between two adjacent positions."""
-        # Base cost is 1
-        # You can modify this for terrain costs (e.g., rough terrain = 2)
-        return 1.0
+    def min_cost(self) -> float:
+        """Cheapest terrain cost; heuristics counting steps are scaled by it."""
+        self._ensure_cost_cache()
+        return self._min_cost
+    
+    def has_uniform_cost(self) -> bool:
+        """True if every move costs 1.0 (no terrain), as step-counting searches assume."""
+        self._ensure_cost_cache()
+        return self._uniform_cost
+    
+    def set_terrain(self, row: int, col: int, cost: float):
+        """Set the cost of moving into (row, col)."""
+        if not cost > 0:
+            raise ValueError(f"Terrain cost must be positive, got {cost}")
+        if self.terrain[row, col] == np.float32(cost):
+            return
+        self.terrain[row, col] = cost
+        self._terrain_changed()
+    
+    def load_terrain(self, costs):
+        """
+        Replace the whole terrain layer.
+        
+        Args:
+            costs: (height, width) array-like of positive movement costs
+        """
+        costs = np.asarray(costs, dtype=np.float32)
+        if costs.shape != (self.height, self.width):
+            raise ValueError(f"Terrain shape {costs.shape} does not match the grid "
+                             f"{(self.height, self.width)}")
+        if not (costs > 0).all():
+            raise ValueError("Terrain costs must be positive")
+        self.terrain = costs.copy()
+        self._terrain_changed()
+    
+    def _terrain_changed(self):
+        """
+        Record a terrain change. Costs are not tracked per cell, so caches
+        built on an older version are told to rebuild (changes_since() = None).
+        """
+        self.version += 1
+        self._change_log.clear()
+        self._log_start = self.version
+        self._cost_terrain = None
+    
+    def _ensure_cost_cache(self):
+        """Rebuild the flat cost table if the terrain was replaced or changed."""
+        if self._cost_terrain is self.terrain:
+            return
+        flat = self.terrain.astype(np.float64).ravel()
+        self._cost_table = array('d', flat.tobytes())
+        self._min_cost = float(flat.min()) if flat.size else 1.0
+        self._uniform_cost = bool((flat == 1.0).all())
+        self._cost_terrain = self.terrain
     
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         """Calculate Manhattan distance heuristic."""
@@ -160,6 +569,7 @@ class GridWorld:
         self.agent_pos = self.start
         self.path = []
         self.visited = set()
+        self.frontier = set()
         self.expanded = 0
     
     def init_display(self):
@@ -216,12 +626,16 @@ class GridWorld:
                     color = RED
                 elif pos in self.visited:
                     color = (200, 230, 255)  # Light blue for visited
+                elif pos in self.frontier:
+                    color = (255, 224, 178)  # Light orange for frontier
                 elif pos in self.path:
                     color = YELLOW
                 elif self.grid[row][col] == OBSTACLE:
                     color = BLACK
                 elif self.grid[row][col] == UNCERTAIN:
                     color = ORANGE
+                elif self.terrain[row][col] > 1.0:
+                    color = (225, 215, 195)  # Beige for slow terrain
                 else:
                     color = WHITE
                 
@@ -277,6 +691,103 @@ class GridWorld:
             self.running = False
 
 
+class MultiAgentGridWorld(GridWorld):
+    """
+    A grid world shared by several agents, each with its own start and goal.
+    
+    start/goal/agent_pos keep referring to agent 0, so single-agent code
+    still works on a multi-agent world.
+    """
+    
+    # Colors for agents 1, 2, ... (agent 0 is drawn BLUE as usual)
+    AGENT_COLORS = [ORANGE, GREEN, RED, YELLOW, (156, 39, 176), (0, 150, 136)]
+    
+    def __init__(self, width=10, height=10, cell_size=50):
+        super().__init__(width, height, cell_size)
+        self.starts: List[Tuple[int, int]] = []
+        self.goals: List[Tuple[int, int]] = []
+        self.agent_positions: List[Tuple[int, int]] = []
+    
+    @property
+    def num_agents(self) -> int:
+        return len(self.starts)
+    
+    def add_agent(self, start: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        """
+        Add an agent.
+        
+        Returns:
+            The new agent's id (its index in starts/goals/agent_positions)
+        
+        Raises:
+            ValueError: If a cell is blocked or already another agent's start/goal
+        """
+        if not self.is_valid(start) or not self.is_valid(goal):
+            raise ValueError(f"Agent start {start} and goal {goal} must be free cells")
+        if start in self.starts or goal in self.goals:
+            raise ValueError(f"Start {start} or goal {goal} already belongs to another agent")
+        self.starts.append(start)
+        self.goals.append(goal)
+        self.agent_positions.append(start)
+        if len(self.starts) == 1:
+            self.start, self.goal, self.agent_pos = start, goal, start
+        return len(self.starts) - 1
+    
+    def move_agents(self, positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Move every agent one step (or let it wait) simultaneously.
+        
+        Args:
+            positions: New position of each agent
+        
+        Returns:
+            Pairs of agent ids that collided (same cell, or swapped cells)
+        
+        Raises:
+            ValueError: If a move is not a wait or a step to a free neighbor
+        """
+        for old, new in zip(self.agent_positions, positions):
+            if new != old and new not in self.get_neighbors(old):
+                raise ValueError(f"Illegal move {old} -> {new}")
+        collisions = self.collisions(self.agent_positions, positions)
+        self.agent_positions = list(positions)
+        self.agent_pos = self.agent_positions[0]
+        return collisions
+    
+    @staticmethod
+    def collisions(previous: List[Tuple[int, int]],
+                   current: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Agent pairs sharing a cell in current, or swapping cells between the two."""
+        found = []
+        occupied = {}
+        for agent, cell in enumerate(current):
+            if cell in occupied:
+                found.append((occupied[cell], agent))
+            else:
+                occupied[cell] = agent
+        moved_from = {cell: agent for agent, cell in enumerate(previous)}
+        for agent, (old, new) in enumerate(zip(previous, current)):
+            other = moved_from.get(new)
+            if other is not None and other < agent and current[other] == old and old != new:
+                found.append((other, agent))
+        return found
+    
+    def reset(self):
+        """Reset every agent to its start."""
+        super().reset()
+        self.agent_positions = list(self.starts)
+    
+    def draw_agent(self):
+        """Draw every agent as a circle, agent 0 in blue."""
+        for agent, (row, col) in enumerate(self.agent_positions):
+            color = BLUE if agent == 0 else self.AGENT_COLORS[(agent - 1) % len(self.AGENT_COLORS)]
+            center_x = col * self.cell_size + self.cell_size // 2
+            center_y = row * self.cell_size + self.cell_size // 2
+            pygame.draw.circle(self.screen, color,
+                               (center_x, center_y),
+                               self.cell_size // 3)
+
+
 def demo():
     """Run a simple demo of the environment."""
     # Create a small grid world
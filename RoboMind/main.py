@@ -215,7 +215,7 @@ def test_hybrid():
     print(f"Final position: {env.agent_pos}")
     print(f"Final strategy: {agent.strategy}")
     print(f"Beliefs tracked: {len(agent.beliefs)} cells")
-    print(f"Knowledge base facts: {len(agent.kb.facts)}")
+    print(f"Knowledge base facts: {len(agent.kb)}")
     print("-" * 60)
 
 
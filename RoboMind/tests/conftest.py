@@ -0,0 +1,13 @@
+"""
+Test configuration - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Run from the RoboMind folder with: python -m pytest tests
+"""
+
+import os
+import sys
+
+# Modules import each other from the RoboMind folder (from environment import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
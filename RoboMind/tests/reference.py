@@ -0,0 +1,167 @@
+"""
+Reference Implementations - RoboMind Project
+SE444 - Artificial Intelligence Course Project
+
+Deliberately simple versions of the optimized algorithms, used by the
+tests as ground truth, plus a few deterministic test maps.
+"""
+
+from typing import Tuple, List
+import heapq
+import itertools
+import random
+import re
+
+import numpy as np
+
+from environment import GridWorld, OBSTACLE
+
+
+def dijkstra(env, start: Tuple[int, int], goal: Tuple[int, int]) -> float:
+    """Cost of the cheapest path from start to goal (inf if none); moving into a cell costs its terrain."""
+    dist = {start: 0.0}
+    frontier = [(0.0, start)]
+    while frontier:
+        d, (row, col) = heapq.heappop(frontier)
+        if (row, col) == goal:
+            return d
+        if d > dist[(row, col)]:
+            continue
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < env.height and 0 <= nc < env.width and env.grid[nr, nc] != OBSTACLE:
+                nd = d + float(env.terrain[nr, nc])
+                if nd < dist.get((nr, nc), float('inf')):
+                    dist[(nr, nc)] = nd
+                    heapq.heappush(frontier, (nd, (nr, nc)))
+    return float('inf')
+
+
+def joint_optimal_cost(env, starts: List[Tuple[int, int]], goals: List[Tuple[int, int]]) -> float:
+    """
+    Optimal sum of costs for a few agents, by Dijkstra over joint states.
+
+    Every step each unfinished agent moves or waits and pays the terrain of
+    the cell it ends in; an agent on its goal may finish (stay there for
+    good, paying nothing more). No two agents share a cell or swap cells.
+    Exponential in the number of agents - only for tiny instances.
+    """
+    count = len(starts)
+
+    def moves(cell):
+        row, col = cell
+        options = [cell]
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < env.height and 0 <= nc < env.width and env.grid[nr, nc] != OBSTACLE:
+                options.append((nr, nc))
+        return options
+
+    start = (tuple(starts), (False,) * count)
+    dist = {start: 0.0}
+    tie = itertools.count()
+    frontier = [(0.0, next(tie), start)]
+    while frontier:
+        d, _, state = heapq.heappop(frontier)
+        if d > dist[state]:
+            continue
+        positions, done = state
+        if all(done):
+            return d
+        successors = []
+        for agent in range(count):
+            if not done[agent] and positions[agent] == goals[agent]:
+                finished = done[:agent] + (True,) + done[agent + 1:]
+                successors.append((d, (positions, finished)))
+        options = [[positions[a]] if done[a] else moves(positions[a]) for a in range(count)]
+        for combo in itertools.product(*options):
+            if len(set(combo)) < count or combo == positions:
+                continue
+            if any(combo[a] == positions[b] and combo[b] == positions[a]
+                   for a in range(count) for b in range(a + 1, count)):
+                continue
+            step = sum(float(env.terrain[combo[a]]) for a in range(count) if not done[a])
+            successors.append((d + step, (combo, done)))
+        for nd, successor in successors:
+            if nd < dist.get(successor, float('inf')):
+                dist[successor] = nd
+                heapq.heappush(frontier, (nd, next(tie), successor))
+    return float('inf')
+
+
+def path_cost(env, path) -> float:
+    """Cost of a path, checking that it is a connected walk over passable cells."""
+    cost = 0.0
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1, f"Path jumps from {(r1, c1)} to {(r2, c2)}"
+        assert env.grid[r2, c2] != OBSTACLE, f"Path enters obstacle {(r2, c2)}"
+        cost += float(env.terrain[r2, c2])
+    return cost
+
+
+def random_world(seed: int, width: int = 12, height: int = 10, density: float = 0.25,
+                 terrain: bool = False) -> GridWorld:
+    """A random map with free start and goal corners, optionally with terrain costs 1-5."""
+    rng = np.random.default_rng(seed)
+    env = GridWorld(width=width, height=height)
+    grid = (rng.random((height, width)) < density).astype(int) * OBSTACLE
+    grid[env.start] = 0
+    grid[env.goal] = 0
+    env.grid = grid
+    if terrain:
+        env.load_terrain(rng.integers(1, 6, size=(height, width)).astype(np.float32))
+    return env
+
+
+def random_query(env, seed: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """A random (start, goal) pair of free cells."""
+    rng = random.Random(seed)
+    free = [tuple(int(v) for v in cell) for cell in np.argwhere(env.grid != OBSTACLE)]
+    return rng.choice(free), rng.choice(free)
+
+
+def closure(facts, rules) -> set:
+    """Every fact derivable from facts with ground (premises, conclusion) rules, by naive fixpoint."""
+    known = set(facts)
+    changed = True
+    while changed:
+        changed = False
+        for premises, conclusion in rules:
+            if conclusion not in known and all(premise in known for premise in premises):
+                known.add(conclusion)
+                changed = True
+    return known
+
+
+def ground_template(premises, conclusion, shape) -> list:
+    """
+    The ground rules of a rule template: one per assignment of grid cells
+    to its variables that satisfies its Adjacent relations. Cell atoms are
+    written "Name(row,col)".
+    """
+    def parse(atom):
+        match = re.match(r'^(\w+)\((.*)\)$', atom)
+        if not match:
+            return atom, ()
+        return match.group(1), tuple(arg.strip() for arg in match.group(2).split(','))
+
+    atoms = [parse(atom) for atom in premises]
+    head = parse(conclusion)
+    variables = sorted({arg for _, args in atoms + [head] for arg in args if arg[:1].isupper()})
+    cells = [(r, c) for r in range(shape[0]) for c in range(shape[1])]
+    rules = []
+    for assignment in itertools.product(cells, repeat=len(variables)):
+        value = dict(zip(variables, assignment))
+        ground, holds = [], True
+        for atom, (name, args) in zip(premises, atoms):
+            if not args:
+                ground.append(atom)
+            elif name == 'Adjacent':
+                (r1, c1), (r2, c2) = value[args[0]], value[args[1]]
+                holds = holds and abs(r1 - r2) + abs(c1 - c2) == 1
+            else:
+                ground.append(f"{name}({value[args[0]][0]},{value[args[0]][1]})")
+        if holds:
+            cell = value[head[1][0]]
+            rules.append((ground, f"{head[0]}({cell[0]},{cell[1]})"))
+    return rules
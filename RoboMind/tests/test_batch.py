@@ -0,0 +1,63 @@
+"""
+Tests for batch path queries and the landmark tables they share.
+"""
+
+import numpy as np
+import pytest
+
+from ai_core.batch import batch_search
+from ai_core.landmarks import LandmarkHeuristic
+from ai_core.search_algorithms import astar
+from reference import dijkstra, random_world, random_query
+
+
+def test_batch_costs_match_reference():
+    env = random_world(2, width=16, height=14)
+    pairs = [random_query(env, seed) for seed in range(40)]
+    expected = [dijkstra(env, start, goal) for start, goal in pairs]
+    for algorithm, heuristic, workers in (('astar', 'manhattan', 1), ('ucs', 'manhattan', 2),
+                                          ('astar', 'alt', 2)):
+        _, costs, _ = batch_search(env, pairs, algorithm, heuristic, workers=workers, chunksize=8)
+        assert np.allclose(costs, expected)
+
+
+def test_batch_with_terrain():
+    env = random_world(5, width=14, height=12, terrain=True)
+    pairs = [random_query(env, seed) for seed in range(30)]
+    _, costs, _ = batch_search(env, pairs, 'astar', 'alt', workers=2, chunksize=8)
+    assert np.allclose(costs, [dijkstra(env, start, goal) for start, goal in pairs])
+
+
+def test_landmark_bounds_admissible():
+    env = random_world(7, width=20, height=16, terrain=True)
+    landmarks = LandmarkHeuristic(env, num_landmarks=4)
+    for seed in range(20):
+        start, goal = random_query(env, seed)
+        best = dijkstra(env, start, goal)
+        if best < float('inf'):
+            assert landmarks.bound(start, goal) <= best + 1e-9
+            assert landmarks.heuristic(goal)(start) <= best + 1e-9
+
+
+def test_landmark_tables_wrap_without_recompute():
+    env = random_world(8)
+    landmarks = LandmarkHeuristic(env, num_landmarks=3)
+    shared = LandmarkHeuristic.from_tables(env, landmarks.landmarks, landmarks.distances)
+    assert shared.distances is landmarks.distances
+    assert np.array_equal(shared.heuristic_map(env.goal), landmarks.heuristic_map(env.goal))
+
+
+def test_landmarks_save_load_and_alt_search(tmp_path):
+    env = random_world(9, width=18, height=14, terrain=True)
+    landmarks = LandmarkHeuristic(env, num_landmarks=4)
+    landmarks.save(str(tmp_path / "landmarks.npz"))
+    loaded = LandmarkHeuristic.load(str(tmp_path / "landmarks.npz"), env)
+    assert loaded.landmarks == landmarks.landmarks
+    assert np.array_equal(loaded.distances, landmarks.distances)
+    for seed in range(15):
+        start, goal = random_query(env, seed)
+        _, cost, _ = astar(env, start, goal, heuristic='alt', landmarks=loaded)
+        assert cost == dijkstra(env, start, goal)
+    env.add_obstacle(*random_query(env, 99)[0])
+    with pytest.raises(ValueError):
+        LandmarkHeuristic.load(str(tmp_path / "landmarks.npz"), env)
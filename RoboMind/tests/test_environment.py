@@ -0,0 +1,113 @@
+"""
+Tests for GridWorld change tracking and neighbor caches.
+"""
+
+import random
+import tracemalloc
+
+import numpy as np
+
+from environment import GridWorld, OBSTACLE, label_components
+from ai_core.path_cache import PathCache
+from ai_core.search_algorithms import astar, bfs, bidirectional_astar, ucs
+from reference import dijkstra, random_world, random_query
+
+
+def test_neighbors_follow_obstacles():
+    env = GridWorld(width=5, height=5)
+    assert set(env.get_neighbors((2, 2))) == {(1, 2), (3, 2), (2, 1), (2, 3)}
+    env.add_obstacle(1, 2)
+    assert set(env.get_neighbors((2, 2))) == {(3, 2), (2, 1), (2, 3)}
+    assert env.changes_since(0) == [(1, 2)]
+
+
+def test_neighbors_match_validity_everywhere():
+    env = random_world(6, density=0.3)
+    for row in range(env.height):
+        for col in range(env.width):
+            expected = [(row + dr, col + dc) for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                        if env.is_valid((row + dr, col + dc))]
+            assert env.get_neighbors((row, col)) == expected
+
+
+def test_neighbor_cache_stays_compact():
+    env = GridWorld(width=150, height=150)
+    env.component_labels()       # Flat per-grid buffers, built once
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bfs(env, env.start, env.goal)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # A search over every cell leaves nothing per cell behind (a cached
+    # list per cell would be megabytes; this allows for interpreter free lists)
+    assert retained < 500_000
+
+
+def test_grid_assignment_is_a_full_change():
+    env = GridWorld(width=6, height=6)
+    env.get_neighbors((0, 0))
+    version = env.version
+    grid = env.grid.copy()
+    grid[0, 1] = OBSTACLE
+    env.grid = grid
+    assert env.version > version
+    assert env.changes_since(version) is None
+    assert (0, 1) not in env.get_neighbors((0, 0))
+
+
+def test_path_cache_dropped_after_grid_swap():
+    env = GridWorld(width=6, height=6)
+    cache = PathCache(env)
+    result = astar(env, env.start, env.goal)
+    cache.put(env.start, env.goal, 'astar', 'manhattan', result)
+    assert cache.get(env.start, env.goal, 'astar', 'manhattan') is not None
+    grid = env.grid.copy()
+    grid[1:, 2] = OBSTACLE
+    env.grid = grid
+    assert cache.get(env.start, env.goal, 'astar', 'manhattan') is None
+
+
+def test_component_labels_match_reachability():
+    env = random_world(3, density=0.35)
+    labels = env.component_labels()
+    assert (labels[env.grid == OBSTACLE] == -1).all()
+    free = np.argwhere(env.grid != OBSTACLE)
+    for (r1, c1), (r2, c2) in zip(free[:20], free[-20:]):
+        found = astar(env, (r1, c1), (r2, c2))[0] is not None
+        assert env.is_reachable((r1, c1), (r2, c2)) == found
+
+
+def test_reachability_tracks_new_walls():
+    env = random_world(4, density=0.2)
+    for seed in range(30):
+        start, goal = random_query(env, seed)
+        assert env.is_reachable(start, goal) == (dijkstra(env, start, goal) < float('inf'))
+    # A wall across the map splits it in two
+    for row in range(env.height):
+        env.add_obstacle(row, env.width // 2)
+    for seed in range(30):
+        start, goal = random_query(env, seed)
+        reachable = dijkstra(env, start, goal) < float('inf')
+        assert env.is_reachable(start, goal) == reachable
+        if not reachable:
+            for search in (astar, ucs, bidirectional_astar):
+                assert search(env, start, goal) == (None, float('inf'), 0)
+
+
+def same_partition(a, b):
+    """Two label arrays group the cells the same way (labels themselves may differ)."""
+    pairs = np.unique(np.stack([a.ravel(), b.ravel()]), axis=1)
+    return len(pairs[0]) == len(np.unique(a)) == len(np.unique(b))
+
+
+def test_labels_updated_locally_on_add_obstacle():
+    rng = random.Random(0)
+    for seed in range(5):
+        env = random_world(seed, width=40, height=30, density=0.15)
+        labels = env.component_labels()
+        for _ in range(120):
+            env.add_obstacle(rng.randrange(env.height), rng.randrange(env.width))
+            expected = label_components(env.grid != OBSTACLE)
+            assert same_partition(env.component_labels(), expected)
+        # Patched in place, never relabeled from scratch
+        assert env.component_labels().base is labels.base
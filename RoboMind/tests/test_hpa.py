@@ -0,0 +1,62 @@
+"""
+Tests for HPA* hierarchical pathfinding.
+"""
+
+from ai_core.hpa import HPAStar
+from reference import dijkstra, path_cost, random_world, random_query
+
+
+def test_intra_edges_precomputed_by_default():
+    env = random_world(1, width=20, height=20)
+    hpa = HPAStar(env, cluster_size=5)
+    assert len(hpa.intra_edges) == hpa.cluster_rows * hpa.cluster_cols
+    lazy = HPAStar(env, cluster_size=5, lazy=True)
+    assert not lazy.intra_edges
+
+
+def test_paths_valid_and_never_below_optimal():
+    for seed in range(10):
+        env = random_world(seed, width=24, height=20, terrain=seed % 2 == 1)
+        hpa = HPAStar(env, cluster_size=6)
+        for query in range(5):
+            start, goal = random_query(env, seed * 10 + query)
+            path, cost, _ = hpa.search(start, goal)
+            best = dijkstra(env, start, goal)
+            if best == float('inf'):
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert abs(path_cost(env, path) - cost) < 1e-6
+            assert cost >= best - 1e-6
+
+
+
+def test_abstract_edges_match_refined_costs_on_terrain():
+    for seed in range(10):
+        env = random_world(seed, width=24, height=20, terrain=True)
+        hpa = HPAStar(env, cluster_size=6)
+        abstract_search = hpa._abstract_search
+        weights = []
+
+        def weighed_search(start, goal, extra):
+            """Record the summed edge weights of the abstract path."""
+            path, expanded = abstract_search(start, goal, extra)
+            if path is not None:
+                total = 0.0
+                for a, b in zip(path, path[1:]):
+                    steps = [extra.get(a, {}).get(b)]
+                    if a in hpa.inter_edges:
+                        steps.append(hpa._intra(hpa.cluster_of(a)).get(a, {}).get(b))
+                        if b in hpa.inter_edges[a]:
+                            steps.append(env.get_cost(a, b))
+                    total += min(step for step in steps if step is not None)
+                weights.append(total)
+            return path, expanded
+
+        hpa._abstract_search = weighed_search
+        for query in range(5):
+            start, goal = random_query(env, seed * 10 + query)
+            path, cost, _ = hpa.search(start, goal)
+            if path is not None:
+                # Every abstract edge costs what its refined segment costs
+                assert abs(weights[-1] - cost) < 1e-6, (seed, query)
@@ -0,0 +1,44 @@
+"""
+Tests for search instrumentation counters and expansion traces.
+"""
+
+import numpy as np
+import pytest
+
+from ai_core.instrumentation import SearchInstrument, expansion_heatmap, load_trace
+from ai_core.search_algorithms import astar, bfs, ucs
+from reference import random_world, random_query
+
+
+@pytest.mark.parametrize("search", [bfs, ucs, astar])
+def test_counters_agree_with_search(search):
+    for seed in range(6):
+        env = random_world(seed, terrain=seed % 2 == 1 and search is not bfs)
+        start, goal = random_query(env, seed)
+        probe = SearchInstrument()
+        result = search(env, start, goal, instrument=probe)
+        # Instrumented and plain runs give the same result
+        assert result == search(env, start, goal)
+        assert probe.expansions == result[2]
+        # ucs() pops the goal without counting it as an expansion
+        assert probe.pops == probe.expansions + probe.stale_pops + (search is ucs and result[0] is not None)
+        assert probe.pops <= probe.pushes
+        assert probe.reopenings == 0
+        assert set(probe.as_dict()['phase_times']) <= {'setup', 'search', 'reconstruct'}
+
+
+def test_trace_round_trip(tmp_path):
+    env = random_world(2, width=16, height=12)
+    probe = SearchInstrument(trace=True)
+    path, _, expanded = astar(env, env.start, env.goal, instrument=probe)
+    probe.save_trace(str(tmp_path / "astar.trace"))
+    shape, order = load_trace(str(tmp_path / "astar.trace"))
+    assert shape == (12, 16) and len(order) == expanded
+    heatmap = expansion_heatmap(str(tmp_path / "astar.trace"))
+    assert heatmap[env.start] == 0
+    assert np.count_nonzero(heatmap >= 0) == len(set(order.tolist()))
+    with pytest.raises(ValueError):
+        SearchInstrument().save_trace(str(tmp_path / "off.trace"))
+    (tmp_path / "bad.trace").write_bytes(b"not a trace")
+    with pytest.raises(ValueError):
+        load_trace(str(tmp_path / "bad.trace"))
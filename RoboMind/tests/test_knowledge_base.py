@@ -0,0 +1,171 @@
+"""
+Tests for the knowledge base: grid facts, forward chaining, rule
+templates and backward chaining.
+"""
+
+import random
+
+import pytest
+
+from ai_core.knowledge_base import KnowledgeBase
+from reference import closure, ground_template
+
+
+SHAPE = (4, 5)
+CELL_PREDICATES = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+
+# Conjunction, relation, recursion, a ground gate and a variable that is
+# not connected to the head
+TEMPLATES = [
+    (["A(X)", "B(X)"], "C(X)"),
+    (["C(Y)", "Adjacent(X,Y)", "B(X)"], "D(X)"),
+    (["D(Y)", "Adjacent(X,Y)", "A(X)"], "D(X)"),
+    (["Flag", "A(X)"], "F(X)"),
+    (["E(X)", "B(Y)", "C(Y)"], "G(X)"),
+]
+
+
+def random_facts(seed):
+    rng = random.Random(seed)
+    facts = [f"{name}({r},{c})" for name in ('A', 'B') for r in range(SHAPE[0])
+             for c in range(SHAPE[1]) if rng.random() < 0.5]
+    if rng.random() < 0.5:
+        facts.append("Flag")
+    ground = [(["D(1,1)", "Flag"], "E(0,0)"), (["F(2,2)"], "E(3,4)")]
+    return facts, ground
+
+
+def expected_closure(facts, ground):
+    rules = list(ground)
+    for premises, conclusion in TEMPLATES:
+        rules += ground_template(premises, conclusion, SHAPE)
+    return closure(facts, rules)
+
+
+def test_grid_strings_share_the_cell_fact():
+    kb = KnowledgeBase(shape=(5, 6), verbose=False)
+    kb.tell("free_3_4")
+    assert kb.ask('free', 3, 4)
+    assert kb.grid_facts('free')[3, 4]
+    assert not kb.ask("Free(3,4)")       # a different predicate
+    assert "free_3_4" in kb and ('free', 3, 4) in kb
+    # Cell facts live in the grids, not in the string set
+    assert kb.facts == set() and len(kb) == 1
+    kb.tell("Visited")
+    assert kb.facts == {"Visited"} and "Visited" in kb and len(kb) == 2
+
+
+def test_strings_off_the_grid_stay_strings():
+    kb = KnowledgeBase(shape=(5, 6), verbose=False)
+    kb.tell("free_7_1")
+    assert kb.facts == {"free_7_1"}
+    assert ('free', 7, 1) not in kb
+
+
+def test_cells_off_the_grid_raise():
+    kb = KnowledgeBase(shape=(5, 6), verbose=False)
+    kb.tell('free', 4, 5)
+    for row, col in ((-1, -1), (5, 0), (0, 6), (-1, 5)):
+        with pytest.raises(IndexError):
+            kb.tell('free', row, col)
+        with pytest.raises(IndexError):
+            kb.ask('free', row, col)
+        with pytest.raises(IndexError):
+            kb.ask('free', row, col, backward=True)
+        assert ('free', row, col) not in kb
+
+
+def test_backward_templates_match_closure():
+    for seed in range(20):
+        facts, ground = random_facts(seed)
+        expected = expected_closure(facts, ground)
+        kb = KnowledgeBase(shape=SHAPE, verbose=False)
+        for fact in facts:
+            kb.tell(fact)
+        for premises, conclusion in TEMPLATES + ground:
+            kb.add_rule(premises, conclusion)
+        for name in CELL_PREDICATES:
+            for r in range(SHAPE[0]):
+                for c in range(SHAPE[1]):
+                    atom = f"{name}({r},{c})"
+                    assert kb.ask(name, r, c, backward=True) == (atom in expected), (seed, atom)
+        # Proving goals does not run the templates over the grid
+        assert kb._templates_seen == -1
+        assert not kb.grid_facts('C').any()
+
+
+def random_program(seed, symbols=15, rules=25):
+    """Random ground facts and rules over propositions P0..P14, some on cells."""
+    rng = random.Random(seed)
+    names = [f"P{i}" for i in range(symbols - 5)] + [f"Q({i},{i % 3})" for i in range(5)]
+    facts = rng.sample(names, 3)
+    program = [(rng.sample(names, rng.randint(1, 3)), rng.choice(names)) for _ in range(rules)]
+    return names, facts, program
+
+
+def test_infer_matches_closure():
+    for seed in range(50):
+        names, facts, program = random_program(seed)
+        expected = closure(facts, program)
+        for shape in (None, (5, 3)):
+            kb = KnowledgeBase(shape=shape, verbose=False)
+            for fact in facts:
+                kb.tell(fact)
+            for premises, conclusion in program:
+                kb.add_rule(premises, conclusion)
+            kb.infer()
+            assert {name for name in names if kb.ask(name)} == expected, (seed, shape)
+            assert len(kb) == len(expected)
+
+
+def test_tell_propagates_incrementally():
+    for seed in range(50):
+        names, facts, program = random_program(seed)
+        kb = KnowledgeBase(shape=(5, 3), verbose=False)
+        for premises, conclusion in program:
+            kb.add_rule(premises, conclusion)
+        # Rules come first, so every tell must leave the KB at its closure
+        # without any infer()
+        told = []
+        for fact in facts:
+            fired_before = kb.rules_fired
+            fired = kb.tell(fact)
+            told.append(fact)
+            assert fired == kb.last_fired == kb.rules_fired - fired_before
+            assert {name for name in names if kb.ask(name)} == closure(told, program), seed
+        assert kb.infer() == 0
+
+
+def test_tell_of_known_fact_fires_nothing():
+    kb = KnowledgeBase(shape=(3, 3), verbose=False)
+    kb.add_rule([('free', 0, 0), "Lit"], "Go")
+    assert kb.tell('free', 0, 0) == 0
+    assert kb.tell("Lit") == 1 and kb.ask("Go")
+    assert kb.tell("Lit") == 0 and kb.last_fired == 0
+    assert kb.tells == 2
+
+
+def test_template_infer_matches_closure():
+    for seed in range(20):
+        facts, ground = random_facts(seed)
+        expected = expected_closure(facts, ground)
+        kb = KnowledgeBase(shape=SHAPE, verbose=False)
+        for premises, conclusion in TEMPLATES + ground:
+            kb.add_rule(premises, conclusion)
+        for fact in facts:
+            kb.tell(fact)
+        kb.infer()
+        known = {f"{name}({r},{c})" for name in CELL_PREDICATES
+                 for r in range(SHAPE[0]) for c in range(SHAPE[1]) if kb.ask(name, r, c)}
+        assert known == {fact for fact in expected if fact != "Flag"}, seed
+        assert kb.infer() == 0
+
+
+def test_template_errors():
+    kb = KnowledgeBase(shape=SHAPE, verbose=False)
+    with pytest.raises(ValueError):
+        kb.add_rule(["A(X)"], "B(Y)")
+    with pytest.raises(ValueError):
+        kb.add_rule(["A(X)", "Adjacent(X,Y)", "Adjacent(Y,Z)", "Adjacent(Z,X)"], "B(X)")
+    with pytest.raises(ValueError):
+        kb.add_rule(["Near(X,Y)", "A(Y)"], "B(X)")
@@ -0,0 +1,73 @@
+"""
+Tests for multi-agent pathfinding (CBS and prioritized planning).
+"""
+
+import numpy as np
+
+from environment import GridWorld, OBSTACLE
+from ai_core.mapf import cbs, prioritized_planning, find_conflicts
+from reference import dijkstra, joint_optimal_cost, random_world
+
+
+def random_agents(env, count: int, seed: int):
+    """Distinct starts and distinct goals in the largest open region."""
+    labels = env.component_labels()
+    largest = np.bincount(labels[labels >= 0]).argmax()
+    free = [tuple(int(v) for v in cell) for cell in np.argwhere(labels == largest)]
+    rng = np.random.default_rng(seed)
+    starts = [free[i] for i in rng.permutation(len(free))[:count]]
+    goals = [free[i] for i in rng.permutation(len(free))[:count]]
+    return starts, goals
+
+
+def test_corridor_swap_is_collision_free():
+    # Two agents swap ends of a corridor with one side pocket
+    env = GridWorld(width=5, height=2)
+    for col in (0, 1, 3, 4):
+        env.add_obstacle(1, col)
+    stats = {}
+    paths = cbs(env, [(0, 0), (0, 4)], [(0, 4), (0, 0)], stats=stats)
+    assert paths is not None and not find_conflicts(paths)
+    assert stats['sum_of_costs'] == joint_optimal_cost(env, [(0, 0), (0, 4)], [(0, 4), (0, 0)])
+
+
+def test_cbs_optimal_on_tiny_maps():
+    for seed in range(12):
+        env = random_world(seed, width=4, height=4, density=0.15, terrain=seed % 2 == 1)
+        starts, goals = random_agents(env, 2 + seed % 2, seed)
+        best = joint_optimal_cost(env, starts, goals)
+        stats = {}
+        paths = cbs(env, starts, goals, max_nodes=20000, stats=stats)
+        if best == float('inf'):
+            assert paths is None
+            continue
+        assert not find_conflicts(paths)
+        assert abs(stats['sum_of_costs'] - best) < 1e-6
+
+
+def test_single_agent_matches_dijkstra():
+    env = random_world(3, terrain=True)
+    stats = {}
+    paths = cbs(env, [env.start], [env.goal], stats=stats)
+    assert abs(stats['sum_of_costs'] - dijkstra(env, env.start, env.goal)) < 1e-6
+    assert paths[0][0] == env.start and paths[0][-1] == env.goal
+
+
+def test_bounded_suboptimal_cbs_many_agents():
+    env = random_world(1, width=32, height=32, density=0.2)
+    starts, goals = random_agents(env, 40, 1)
+    stats = {}
+    paths = cbs(env, starts, goals, suboptimality=1.5, time_limit=60, stats=stats)
+    assert paths is not None and not find_conflicts(paths)
+    lower_bound = sum(dijkstra(env, start, goal) for start, goal in zip(starts, goals))
+    assert stats['sum_of_costs'] <= 1.5 * lower_bound + 1e-6
+
+
+def test_prioritized_planning_collision_free():
+    env = random_world(2, width=24, height=24, density=0.2)
+    starts, goals = random_agents(env, 30, 2)
+    paths = prioritized_planning(env, starts, goals)
+    assert paths is not None and not find_conflicts(paths)
+    for path, start, goal in zip(paths, starts, goals):
+        assert path[0] == start and path[-1] == goal
+        assert all(env.grid[cell] != OBSTACLE for cell in path)
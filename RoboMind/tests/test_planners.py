@@ -0,0 +1,133 @@
+"""
+Tests for the goal-directed planners: distance field, flow field, D* Lite,
+and the hybrid agent that selects between them.
+"""
+
+import numpy as np
+import pytest
+
+from environment import OBSTACLE
+from agents.hybrid_agent import HybridAgent
+from ai_core.distance_field import DistanceField
+from ai_core.flow_field import FlowField
+from ai_core.search_algorithms import DStarLite
+from reference import dijkstra, path_cost, random_world, random_query
+
+
+def assert_cheapest(env, path, start, goal):
+    """path is None exactly when goal is unreachable, otherwise a cheapest path."""
+    best = dijkstra(env, start, goal)
+    if best == float('inf'):
+        assert path is None
+        return
+    assert path[0] == start and path[-1] == goal
+    assert abs(path_cost(env, path) - best) < 1e-6
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_distance_field_matches_dijkstra(terrain):
+    for seed in range(6):
+        env = random_world(seed, terrain=terrain)
+        for query in range(5):
+            start, goal = random_query(env, seed * 10 + query)
+            field = DistanceField(env, goal)
+            assert_cheapest(env, field.path_from(start), start, goal)
+            assert field.distance(start) == pytest.approx(dijkstra(env, start, goal))
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_flow_field_matches_dijkstra(terrain):
+    for seed in range(6):
+        env = random_world(seed, terrain=terrain)
+        for query in range(5):
+            start, goal = random_query(env, seed * 10 + query)
+            assert_cheapest(env, FlowField(env, goal).path_from(start), start, goal)
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_dstar_lite_matches_dijkstra(terrain):
+    for seed in range(6):
+        env = random_world(seed, terrain=terrain)
+        for query in range(5):
+            start, goal = random_query(env, seed * 10 + query)
+            path, cost, _ = DStarLite(env, goal).plan(start)
+            assert_cheapest(env, path, start, goal)
+
+
+@pytest.mark.parametrize("planner", ['field', 'dstar', 'flow'])
+def test_hybrid_agent_plans_cheapest_path_on_terrain(planner):
+    for seed in range(4):
+        env = random_world(seed, terrain=True)
+        agent = HybridAgent(env, planner=planner)
+        assert_cheapest(env, agent.plan(), env.agent_pos, env.goal)
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_distance_field_reused_and_blocked(terrain):
+    for seed in range(6):
+        env = random_world(seed, terrain=terrain)
+        start, goal = random_query(env, seed)
+        field = DistanceField(env, goal)
+        field.path_from(start)
+        field.path_from(start)
+        assert field.recomputes == 1
+        # Blocking cells matches a map where they are obstacles
+        walls = random_world(seed, terrain=terrain)
+        cells = {random_query(env, seed + s)[0] for s in range(1, 6)} - {start, goal}
+        for cell in cells:
+            assert field.set_blocked(cell, True)
+            walls.add_obstacle(*cell)
+        assert not field.set_blocked(next(iter(cells)), True)
+        assert_cheapest(walls, field.path_from(start), start, goal)
+        assert field.recomputes == 2
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_dstar_lite_repairs_after_changes(terrain):
+    for seed in range(6):
+        env = random_world(seed, terrain=terrain)
+        start, goal = random_query(env, seed)
+        blocked = set()
+        dstar = DStarLite(env, goal, is_blocked=blocked.__contains__)
+        path, _, _ = dstar.plan(start)
+        if path is None or len(path) < 5:
+            continue
+        # Walk a little, then a grid obstacle and a believed one appear ahead
+        position = path[2]
+        env.add_obstacle(*path[3])
+        blocked.add(path[-2])
+        walls = random_world(seed, terrain=terrain)
+        walls.add_obstacle(*path[3])
+        walls.add_obstacle(*path[-2])
+        repaired, _, _ = dstar.plan(position, [path[-2]])
+        assert_cheapest(walls, repaired, position, goal)
+
+
+@pytest.mark.parametrize("terrain", [False, True])
+def test_flow_field_updates_match_fresh_field(terrain):
+    repaired = 0
+    for seed in range(6):
+        env = random_world(seed, width=24, height=20, terrain=terrain)
+        walls = random_world(seed, width=24, height=20, terrain=terrain)
+        goal = random_query(env, seed)[1]
+        field = FlowField(env, goal)
+        cells = sorted({random_query(env, seed + s)[0] for s in range(1, 6)} - {goal})
+        # One change at a time: block cells, wall one in the grid, free one again
+        changes = [(cell, True) for cell in cells[:-1]] + [(cells[-1], None), (cells[0], False)]
+        for cell, blocked in changes:
+            rebuilds = field.rebuilds
+            if blocked is None:
+                env.add_obstacle(*cell)
+            else:
+                field.set_blocked(cell, blocked)
+            walls.grid = np.where([[(r, c) in field.blocked for c in range(env.width)]
+                                   for r in range(env.height)], OBSTACLE, env.grid)
+            assert np.array_equal(field.integration, FlowField(walls, goal).integration)
+            repaired += field.rebuilds == rebuilds
+        starts = [random_query(walls, seed * 10 + s)[0] for s in range(4)]
+        for start in starts:
+            assert_cheapest(walls, field.path_from(start), start, goal)
+        steps = field.next_steps(starts)
+        assert [tuple(step) for step in steps] == [field.next_step(start) or start for start in starts]
+    # Most changes are repaired in place rather than rebuilt
+    assert repaired > 15
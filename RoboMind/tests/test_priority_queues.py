@@ -0,0 +1,35 @@
+"""
+Tests for the interchangeable open lists in ai_core.priority_queues.
+"""
+
+import random
+
+import pytest
+
+from ai_core.priority_queues import make_open_list
+
+
+@pytest.mark.parametrize("kind", ['heap', 'bucket', 'indexed'])
+def test_pops_in_priority_order_with_decrease_key(kind):
+    rng = random.Random(0)
+    queue = make_open_list(kind)
+    best = {}
+    for _ in range(300):
+        item, priority = rng.randrange(60), rng.randrange(40)
+        if priority < best.get(item, float('inf')):
+            best[item] = priority
+            queue.push(item, priority)
+    popped = {}
+    last = -1
+    while len(queue):
+        priority, item = queue.pop()
+        assert priority >= last
+        last = priority
+        popped.setdefault(item, priority)   # 'heap' may return outdated entries later
+    assert popped == best
+    assert queue.peak >= 1
+
+
+def test_unknown_open_list():
+    with pytest.raises(ValueError):
+        make_open_list('fibonacci')
@@ -0,0 +1,84 @@
+"""
+Tests for SearchAgent's algorithm dispatch and its LRU path cache.
+"""
+
+import pytest
+
+from agents.search_agent import SearchAgent
+from ai_core.instrumentation import SearchInstrument
+from ai_core.path_cache import PathCache
+from reference import dijkstra, path_cost, random_world
+
+OPTIMAL = ('bfs', 'ucs', 'astar', 'jps', 'bidirectional_bfs', 'bidirectional_astar',
+           'wavefront', 'arastar', 'idastar', 'flow')
+
+
+def test_optimal_algorithms_match_dijkstra():
+    for seed in range(4):
+        env = random_world(seed, width=14, height=12)
+        agent = SearchAgent(env)
+        best = dijkstra(env, env.start, env.goal)
+        for algorithm in OPTIMAL:
+            path, cost, _ = agent.search(algorithm)
+            if best == float('inf'):
+                assert path is None, algorithm
+                continue
+            assert path[0] == env.start and path[-1] == env.goal, algorithm
+            assert path_cost(env, path) == cost == best, algorithm
+
+
+def test_repeated_search_hits_cache_until_grid_changes():
+    env = random_world(3, width=14, height=12)
+    agent = SearchAgent(env)
+    first = agent.search('astar')
+    first[0].append((0, 0))          # Callers may modify the returned path
+    second = agent.search('astar')
+    assert agent.path_cache.hits == 1
+    assert second[0] == first[0][:-1] and second[1:] == first[1:]
+    agent.search('astar', heuristic='euclidean')
+    assert agent.path_cache.misses == 2
+    row, col = second[0][len(second[0]) // 2]
+    env.add_obstacle(row, col)
+    third = agent.search('astar')
+    assert agent.path_cache.stats()['invalidations'] == 1
+    assert third[0] is None or (row, col) not in third[0]
+
+
+
+def test_cache_hit_restores_the_search_statistics():
+    env = random_world(1, width=14, height=12)
+    agent = SearchAgent(env)
+    agent.search('idastar')
+    stats = dict(agent.last_stats)
+    assert stats['iterations'] > 0
+    agent.search('bfs')
+    assert agent.last_stats == {}
+    agent.search('idastar')
+    assert agent.path_cache.hits == 1 and agent.last_stats == stats
+    agent.search('bfs')
+    assert agent.path_cache.hits == 2 and agent.last_stats == {}
+
+def test_cache_evicts_least_recently_used():
+    env = random_world(0)
+    cache = PathCache(env, maxsize=2)
+    for col in range(3):
+        cache.put((0, 0), (0, col), 'bfs', None, ([(0, 0)], col, 1))
+        cache.get((0, 0), (0, 0), 'bfs')
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get((0, 0), (0, 0), 'bfs') is not None
+    assert cache.get((0, 0), (0, 1), 'bfs') is None
+
+
+@pytest.mark.parametrize("algorithm", ['bfs', 'ucs', 'astar'])
+def test_instrument_watches_every_search(algorithm):
+    env = random_world(2, width=14, height=12, terrain=algorithm != 'bfs')
+    agent = SearchAgent(env)
+    plain = agent.search(algorithm)
+    for open_list in ('heap', 'indexed'):
+        probe = SearchInstrument()
+        result = agent.search(algorithm, open_list=open_list, instrument=probe)
+        # Not served from the cache, and the same result as the plain run
+        assert agent.path_cache.hits == 0
+        assert result[1] == plain[1] and probe.expansions == result[2] > 0
+    with pytest.raises(ValueError):
+        agent.search('jps', instrument=SearchInstrument())
@@ -0,0 +1,207 @@
+"""
+Tests for the single-agent searches in ai_core.search_algorithms,
+checked against a reference Dijkstra.
+"""
+
+import heapq
+import math
+import time
+import tracemalloc
+
+import pytest
+
+from environment import GridWorld, OBSTACLE
+from ai_core import search_algorithms
+from ai_core.search_algorithms import (arastar, astar, astar_array, bidirectional_astar, bidirectional_bfs,
+                                      idastar, jps, ucs, wavefront, wavefront_bfs)
+from reference import dijkstra, path_cost, random_world, random_query
+
+
+def assert_optimal(env, start, goal, result):
+    """A search result is a valid path with the optimal cost, or None when none exists."""
+    path, cost, _ = result
+    best = dijkstra(env, start, goal)
+    if best == float('inf'):
+        assert path is None and cost == float('inf')
+        return
+    assert path[0] == start and path[-1] == goal
+    assert abs(path_cost(env, path) - best) < 1e-6
+    assert abs(cost - best) < 1e-6
+
+
+def test_idastar_optimal():
+    for seed in range(20):
+        env = random_world(seed, terrain=seed % 2 == 1)
+        start, goal = random_query(env, seed)
+        assert_optimal(env, start, goal, idastar(env, start, goal))
+
+
+def test_idastar_cap_smaller_than_path_terminates():
+    env = GridWorld(width=21, height=19)
+    stats = {}
+    began = time.perf_counter()
+    path, cost, _ = idastar(env, (18, 0), (2, 17), max_nodes=30, stats=stats)
+    assert time.perf_counter() - began < 5
+    assert path is None and cost == float('inf')
+    assert stats['truncated']
+
+
+def test_idastar_cap_on_maze_detour_terminates():
+    # The goal is close by Manhattan distance but the only path detours
+    env = GridWorld(width=9, height=9)
+    for row in range(8):
+        env.add_obstacle(row, 4)
+    stats = {}
+    path, _, _ = idastar(env, (0, 3), (0, 5), max_nodes=12, stats=stats)
+    assert path is None and stats['truncated']
+    # 19 path cells plus the ball around the goal (a quarter of the cap)
+    path, cost, _ = idastar(env, (0, 3), (0, 5), max_nodes=26, stats=stats)
+    assert cost == dijkstra(env, (0, 3), (0, 5))
+    assert stats['peak_nodes'] <= 26
+
+
+def test_idastar_peak_bytes_on_large_grid():
+    # A cap far below the grid size: nothing may be allocated per cell, and
+    # the reported peak has to account for what is
+    env = GridWorld(width=1000, height=1000)
+    for row in range(490, 511):
+        env.add_obstacle(row, 500)
+    stats = {}
+    tracemalloc.start()
+    path, cost, _ = idastar(env, (500, 490), (500, 510), max_nodes=1000, stats=stats)
+    _, traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert cost == 42 and path_cost(env, path) == 42
+    assert stats['peak_nodes'] <= 1000
+    assert stats['peak_bytes'] < 200_000
+    assert traced < 2 * stats['peak_bytes']
+
+
+def test_astar_array_matches_astar():
+    for seed in range(20):
+        env = random_world(seed, terrain=seed % 2 == 1)
+        for query in range(3):
+            start, goal = random_query(env, seed * 10 + query)
+            for open_list in ('heap', 'indexed'):
+                result = astar_array(env, start, goal, open_list=open_list)
+                assert_optimal(env, start, goal, result)
+                # Same expansion order as astar()
+                assert result[2] == astar(env, start, goal, open_list=open_list)[2]
+
+
+
+def test_astar_array_reuses_buffers_across_queries_and_changes():
+    env = random_world(3, width=20, height=16)
+    astar_array(env, env.start, env.start)
+    buffers = search_algorithms._search_buffers[env]
+    for seed in range(20):
+        start, goal = random_query(env, seed)
+        assert_optimal(env, start, goal, astar_array(env, start, goal))
+        env.add_obstacle(*random_query(env, 100 + seed)[0])
+    assert search_algorithms._search_buffers[env] is buffers
+    # Stamps wrapping around clear the buffers instead of reading stale cells
+    buffers.generation = 0xFFFFFFFF
+    start, goal = random_query(env, 7)
+    assert_optimal(env, start, goal, astar_array(env, start, goal))
+    assert buffers.generation == 1
+
+
+def octile_dijkstra(env, start, goal):
+    """Cheapest 8-connected path cost; diagonal steps cost sqrt(2) and may not cut corners."""
+    def free(r, c):
+        return 0 <= r < env.height and 0 <= c < env.width and env.grid[r, c] != OBSTACLE
+
+    dist = {start: 0.0}
+    frontier = [(0.0, start)]
+    while frontier:
+        d, (row, col) = heapq.heappop(frontier)
+        if (row, col) == goal:
+            return d
+        if d > dist[(row, col)]:
+            continue
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if (dr or dc) and free(row + dr, col + dc) and \
+                        (not (dr and dc) or (free(row + dr, col) and free(row, col + dc))):
+                    nd = d + (math.sqrt(2) if dr and dc else 1.0)
+                    if nd < dist.get((row + dr, col + dc), float('inf')):
+                        dist[(row + dr, col + dc)] = nd
+                        heapq.heappush(frontier, (nd, (row + dr, col + dc)))
+    return float('inf')
+
+
+def test_jps_optimal():
+    for seed in range(20):
+        env = random_world(seed, width=16, height=14)
+        for query in range(3):
+            start, goal = random_query(env, seed * 10 + query)
+            assert_optimal(env, start, goal, jps(env, start, goal))
+            path, cost, _ = jps(env, start, goal, diagonal=True)
+            best = octile_dijkstra(env, start, goal)
+            if best == float('inf'):
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert all(max(abs(r1 - r2), abs(c1 - c2)) == 1 and env.grid[r2, c2] != OBSTACLE
+                       for (r1, c1), (r2, c2) in zip(path, path[1:]))
+            assert abs(cost - best) < 1e-6
+
+
+def test_jps_rejects_terrain():
+    env = random_world(0, terrain=True)
+    with pytest.raises(ValueError):
+        jps(env, env.start, env.goal)
+
+
+def test_bidirectional_optimal():
+    for seed in range(20):
+        env = random_world(seed, width=16, height=14, terrain=seed % 2 == 1)
+        for query in range(3):
+            start, goal = random_query(env, seed * 10 + query)
+            for heuristic in ('manhattan', 'euclidean'):
+                assert_optimal(env, start, goal, bidirectional_astar(env, start, goal, heuristic))
+            if env.has_uniform_cost():
+                assert_optimal(env, start, goal, bidirectional_bfs(env, start, goal))
+
+
+def test_wavefront_distances_match_dijkstra():
+    for seed in range(10):
+        env = random_world(seed)
+        source, _ = random_query(env, seed)
+        dist, parent_dir = wavefront(env, source)
+        for row in range(env.height):
+            for col in range(env.width):
+                best = dijkstra(env, source, (row, col))
+                assert dist[row, col] == (best if best < float('inf') else -1)
+        assert parent_dir[source] == -1
+        for query in range(3):
+            start, goal = random_query(env, seed * 10 + query)
+            assert_optimal(env, start, goal, wavefront_bfs(env, start, goal))
+
+
+@pytest.mark.parametrize("open_list", ['heap', 'bucket', 'indexed'])
+def test_ucs_and_astar_open_lists_optimal(open_list):
+    for seed in range(10):
+        env = random_world(seed, terrain=seed % 2 == 1)
+        for query in range(3):
+            start, goal = random_query(env, seed * 10 + query)
+            assert_optimal(env, start, goal, ucs(env, start, goal, open_list=open_list))
+            assert_optimal(env, start, goal, astar(env, start, goal, open_list=open_list))
+
+
+def test_arastar_converges_and_bounds_its_cost():
+    for seed in range(10):
+        env = random_world(seed, width=16, height=14, terrain=seed % 2 == 1)
+        start, goal = random_query(env, seed)
+        stats = {}
+        assert_optimal(env, start, goal, arastar(env, start, goal, stats=stats))
+        best = dijkstra(env, start, goal)
+        if best == float('inf'):
+            continue
+        assert stats['epsilon'] == 1.0
+        # A tight budget still returns a path within its stated bound
+        stats = {}
+        path, cost, _ = arastar(env, start, goal, max_expansions=40, stats=stats)
+        if path is not None:
+            assert abs(path_cost(env, path) - cost) < 1e-6
+            assert best - 1e-6 <= cost <= stats['epsilon'] * best + 1e-6
@@ -0,0 +1,46 @@
+"""
+Tests for the generator searches in ai_core.stepwise_search.
+"""
+
+import pytest
+
+from ai_core.search_algorithms import astar, bfs, ucs
+from ai_core.stepwise_search import astar_steps, bfs_steps, run_steps, ucs_steps
+from reference import random_world, random_query
+
+PAIRS = [(bfs_steps, bfs), (ucs_steps, ucs), (astar_steps, astar)]
+
+
+@pytest.mark.parametrize("steps, search", PAIRS)
+def test_steps_match_blocking_search(steps, search):
+    for seed in range(10):
+        env = random_world(seed, terrain=seed % 2 == 1 and search is not bfs)
+        start, goal = random_query(env, seed)
+        for k in (1, 7):
+            assert run_steps(steps(env, start, goal, k=k)) == search(env, start, goal)
+
+
+@pytest.mark.parametrize("steps, search", PAIRS)
+def test_step_deltas_add_up(steps, search):
+    env = random_world(4)
+    start, goal = random_query(env, 4)
+    visited, frontier = [], []
+    for step in steps(env, start, goal, k=5):
+        assert step.done or len(step.visited_delta) == 5
+        visited += step.visited_delta
+        frontier += step.frontier_delta
+    # ucs() does not count popping the goal as an expansion
+    assert len(visited) == step.expanded + (search is ucs and step.path is not None)
+    assert set(visited) <= set(frontier)
+
+
+def test_closing_the_generator_cancels():
+    env = random_world(5, width=30, height=30, density=0.1)
+    steps = astar_steps(env, (0, 0), (29, 29), k=1)
+    first = next(steps)
+    assert not first.done and first.expanded == 1
+    steps.close()
+    with pytest.raises(StopIteration):
+        next(steps)
+    with pytest.raises(ValueError):
+        next(bfs_steps(env, (0, 0), (29, 29), k=0))